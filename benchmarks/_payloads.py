@@ -0,0 +1,77 @@
+"""
+Synthetic payloads for the parsing and conversion benchmarks.
+
+Every response model in enemera.models.response_models gets a payload of a
+single series (one zone, market and generation type) covering a given span,
+so payload size scales with time only. Models served by a curve reuse the
+stand-in server's generators; the Terna models, which are not exposed as
+curves, are projected from imbalance rows.
+"""
+
+import json
+from datetime import date, timedelta
+from typing import Any, Dict, List, Type
+
+from enemera.models import response_models as rm
+from enemera.models.curves import Curve
+from enemera.testing.synthetic import generate_rows
+from enemera.transport.replay import ReplayResponse
+
+# Span of each payload size in days
+SIZES = {"1d": 1, "1m": 30, "1y": 365, "10y": 3652}
+
+START = date(2015, 1, 1)
+
+# Curve and extra query parameters used to generate each model's rows
+MODEL_SOURCES = {
+    rm.PriceData: (Curve.ITALY_PRICES, {"market": "MGP", "area": "NORD"}),
+    rm.IPEXXbidRecapResponse: (Curve.ITALY_XBID_RESULTS, {"area": "NORD"}),
+    rm.IpexQuantityResponse: (Curve.ITALY_EXCHANGE_VOLUMES,
+                              {"market": "MGP", "area": "NORD", "purpose": "BUY"}),
+    rm.IPEXAncillaryServicesResponse: (Curve.ITALY_ANCILLARY_SERVICES,
+                                       {"market": "MSD", "area": "NORD"}),
+    rm.IPEXEstimatedDemandResponse: (Curve.ITALY_DAM_DEMAND_FCS, {"area": "NORD"}),
+    rm.IPEXActualDemandResponse: (Curve.ITALY_DAM_DEMAND_ACT, {"area": "NORD"}),
+    rm.IPEXFlowResponse: (Curve.ITALY_COMMERCIAL_FLOWS,
+                          {"market": "MGP", "area_from": "NORD", "area_to": "CNOR"}),
+    rm.IPEXFlowLimitResponse: (Curve.ITALY_COMMERCIAL_FLOW_LIMITS,
+                               {"market": "MGP", "area_from": "NORD", "area_to": "CNOR"}),
+    rm.ItalyImbalanceDataResponse: (Curve.ITALY_IMBALANCE_DATA, {"area": "NORD"}),
+    rm.TernaImbalancePriceResponse: (Curve.ITALY_IMBALANCE_DATA, {"area": "NORD"}),
+    rm.TernaImbalanceVolumeResponse: (Curve.ITALY_IMBALANCE_DATA, {"area": "NORD"}),
+    rm.TernaImbalanceSignResponse: (Curve.ITALY_IMBALANCE_DATA, {"area": "NORD"}),
+    rm.TernaNonArbitragePriceResponse: (Curve.ITALY_IMBALANCE_DATA, {"area": "NORD"}),
+    rm.GenerationData: (Curve.ITALY_GENERATION, {"area": "NORD", "generation_type": "SOLAR"}),
+    rm.LoadData: (Curve.ITALY_LOAD_ACTUAL, {"area": "NORD"}),
+    rm.SpainPriceResponse: (Curve.SPAIN_PRICES, {"market": "MD"}),
+    rm.SpainXbidResultsResponse: (Curve.SPAIN_XBID_RESULTS, {}),
+}
+
+# Renamed or added fields of the Terna models relative to the imbalance rows
+_TERNA_EXTRA = {
+    rm.TernaImbalancePriceResponse: lambda row: {"is_final": row["is_final_price"]},
+    rm.TernaImbalanceVolumeResponse: lambda row: {"is_final": row["is_final_sign"]},
+    rm.TernaImbalanceSignResponse: lambda row: {"is_final": row["is_final_sign"]},
+    rm.TernaNonArbitragePriceResponse: lambda row: {"is_final": row["is_final_pnamz"],
+                                                    "time_resolution": "PT15M"},
+}
+
+
+def model_rows(model_class: Type, size: str) -> List[Dict[str, Any]]:
+    """Return JSON rows for a model covering the span of a payload size."""
+    curve, params = MODEL_SOURCES[model_class]
+    end = START + timedelta(days=SIZES[size] - 1)
+    rows = generate_rows(curve, dict(params, date_from=START.isoformat(), date_to=end.isoformat()))
+    extra = _TERNA_EXTRA.get(model_class)
+    if extra is None:
+        return rows
+    fields = set(model_class.model_fields)
+    return [dict({k: v for k, v in row.items() if k in fields}, **extra(row)) for row in rows]
+
+
+def json_response(rows: List[Dict[str, Any]]) -> ReplayResponse:
+    """Return a response object holding the rows as a JSON body."""
+    body = json.dumps(rows, separators=(",", ":")).encode()
+    response = ReplayResponse(200, {"Content-Type": "application/json"}, "http://bench", body)
+    response._content = body
+    return response
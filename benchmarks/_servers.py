@@ -0,0 +1,137 @@
+"""
+Minimal local HTTP servers used by the benchmarks.
+
+Both servers answer every GET with the same JSON body after an optional
+delay, so transport overhead can be measured without the live API.
+"""
+
+import http.server
+import json
+import socket
+import threading
+import time
+
+ROW = {"utc": "2024-01-01T00:00:00Z", "market": "MGP", "zone": "NORD",
+       "price": 100.0, "time_resolution": "PT60M"}
+
+
+def json_body(rows: int = 24) -> bytes:
+    return json.dumps([ROW] * rows).encode()
+
+
+class HTTP1Server:
+    """Threaded HTTP/1.1 server with keep-alive"""
+
+    def __init__(self, body: bytes, latency: float = 0.0):
+        body_ = body
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if latency:
+                    time.sleep(latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body_)))
+                self.end_headers()
+                self.wfile.write(body_)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class H2CServer:
+    """Plain-text HTTP/2 server (prior knowledge), one thread per stream"""
+
+    def __init__(self, body: bytes, latency: float = 0.0):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        self._h2 = h2
+        self.body = body
+        self.latency = latency
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(64)
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self._closed = False
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        h2 = self._h2
+        config = h2.config.H2Configuration(client_side=False)
+        connection = h2.connection.H2Connection(config=config)
+        lock = threading.Lock()
+        connection.initiate_connection()
+        conn.sendall(connection.data_to_send())
+
+        def respond(stream_id):
+            if self.latency:
+                time.sleep(self.latency)
+            with lock:
+                connection.send_headers(stream_id, [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(self.body))),
+                ])
+                # Respect flow control windows
+                data = self.body
+                while data:
+                    size = min(connection.local_flow_control_window(stream_id),
+                               connection.max_outbound_frame_size, len(data))
+                    if size <= 0:
+                        conn.sendall(connection.data_to_send())
+                        lock.release()
+                        time.sleep(0.001)
+                        lock.acquire()
+                        continue
+                    connection.send_data(stream_id, data[:size], end_stream=size == len(data))
+                    data = data[size:]
+                conn.sendall(connection.data_to_send())
+
+        while True:
+            try:
+                data = conn.recv(65535)
+            except OSError:
+                break
+            if not data:
+                break
+            with lock:
+                events = connection.receive_data(data)
+                pending = connection.data_to_send()
+                if pending:
+                    conn.sendall(pending)
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    threading.Thread(target=respond, args=(event.stream_id,), daemon=True).start()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    conn.close()
+                    return
+        conn.close()
+
+    def close(self):
+        self._closed = True
+        self.sock.close()
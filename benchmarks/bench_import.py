@@ -0,0 +1,72 @@
+"""
+Benchmarks for the startup cost of importing the client.
+
+asv runs each timeraw_* snippet in a fresh interpreter, so the figures include
+every module loaded by the import. Track them across commits with
+
+    asv continuous main HEAD --bench bench_import
+
+or print the slowest modules of a cold import with:
+
+    python -m benchmarks.bench_import
+"""
+
+import subprocess
+import sys
+
+# Heavy optional dependencies that no import below may load
+HEAVY_MODULES = ("pandas", "numpy", "polars", "pyarrow")
+
+
+class ImportSuite:
+    """Cold import of the package and its main entry points"""
+
+    repeat = 10
+
+    def timeraw_import_enemera(self):
+        return "import enemera"
+
+    def timeraw_import_client(self):
+        return "from enemera import EnemeraClient, Curve"
+
+    def timeraw_import_response(self):
+        return "from enemera import APIResponse"
+
+
+def import_times(statement: str):
+    """Run a statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        (times, heavy): (cumulative microseconds, module) for every module
+        imported by the statement, and the modules loaded from HEAVY_MODULES
+    """
+    check = f"import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"{statement}; {check}"],
+                            capture_output=True, text=True, check=True)
+    times = []
+    lines = [line for line in result.stderr.splitlines()
+             if line.startswith("import time:") and "cumulative" not in line]
+    # Skip the modules imported by the interpreter itself, up to and including site
+    names = [line.split("|")[2].strip() for line in lines]
+    start = names.index("site") + 1 if "site" in names else 0
+    for line in lines[start:]:
+        _, cumulative, name = line.split("|")
+        times.append((int(cumulative), name.rstrip()))
+    heavy = [m for m in result.stdout.strip().split(",") if m]
+    return times, heavy
+
+
+def main():
+    for statement in ("import enemera", "from enemera import EnemeraClient, Curve"):
+        times, heavy = import_times(statement)
+        # Top-level entries of the import tree are indented by a single space
+        total = sum(t for t, name in times if not name.startswith("  "))
+        print(f"{statement}: {total / 1000:.1f}ms, heavy modules loaded: {heavy or 'none'}")
+        for cumulative, name in sorted(times, reverse=True)[:10]:
+            print(f"  {cumulative / 1000:>8.1f}ms {name}")
+        if heavy:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Memory profile of the response pipeline, stage by stage.
+
+A curve is fetched from the stand-in server (running in a child process, so
+its allocations are not traced) and taken through the same steps as the
+client, with tracemalloc measuring each step on its own:
+
+    download   wire body read from the connection
+    decode     decompressed body and response.json() dictionaries
+    validate   pydantic models and the APIResponse holding them
+    convert    APIResponse.to_pandas() (model_dump records and the DataFrame)
+    export     DataFrame.to_csv()
+
+For every stage the peak (highest extra memory while it ran) and retained
+(extra memory still held once it finished, with earlier outputs alive, as in
+the client) allocations are reported in MB.
+
+Save a baseline and check later runs against it; the check exits with
+status 1 if any stage's peak grew by more than the threshold:
+
+    python -m benchmarks.bench_memory --save memory_baseline.json
+    python -m benchmarks.bench_memory --check memory_baseline.json --threshold 0.1
+
+The asv suite tracks the same figures across commits.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks._payloads import SIZES, START
+from benchmarks.loadtest import standin_server
+from enemera.core.compression import StreamDecoder, accept_encoding_header
+from enemera.core.response import APIResponse
+from enemera.models.curves import CURVE_ENDPOINTS, Curve
+from enemera.testing import make_api_key
+from enemera.transport import RequestsTransport
+
+STAGES = ("download", "decode", "validate", "convert", "export")
+
+# Curves profiled by default, with the extra parameters they need
+CURVES = {
+    Curve.ITALY_IMBALANCE_DATA: {},
+    Curve.ITALY_PRICES: {"market": "MGP"},
+    Curve.ITALY_GENERATION: {"generation_type": "SOLAR"},
+}
+
+MB = 1024 * 1024
+
+
+def _measure(func: Callable[[], Any]) -> Tuple[Any, Dict[str, float]]:
+    """Run one stage and return its result with peak and retained allocations"""
+    gc.collect()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = func()
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    return result, {
+        "peak_mb": round((peak - before) / MB, 3),
+        "retained_mb": round((after - before) / MB, 3),
+    }
+
+
+def profile_pipeline(url: str, curve: Curve, size: str) -> Dict[str, Dict[str, float]]:
+    """Profile every stage for one curve and payload size.
+
+    Args:
+        url: Base URL of a stand-in server
+        curve: Curve to fetch
+        size: Payload size key from benchmarks._payloads.SIZES
+
+    Returns:
+        Peak and retained MB per stage, plus the number of rows
+    """
+    endpoint, model_class = CURVE_ENDPOINTS[curve]
+    params = dict(CURVES.get(curve, {}),
+                  date_from=START.isoformat(),
+                  date_to=(START + timedelta(days=SIZES[size] - 1)).isoformat())
+
+    transport = RequestsTransport()
+    transport.update_headers({"Authorization": f"Bearer {make_api_key()}",
+                              "Accept-Encoding": accept_encoding_header()})
+    response = transport.send("GET", url + endpoint, params=params, timeout=(10, 300))
+
+    def download():
+        return b"".join(transport.iter_raw(response, 64 * 1024))
+
+    def decode():
+        decoder = StreamDecoder(response.headers.get("Content-Encoding"))
+        transport.set_body(response, decoder.decompress(wire) + decoder.flush())
+        return response.json()
+
+    def validate():
+        return APIResponse([model_class(**item) for item in rows])
+
+    def convert():
+        return result.to_pandas()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def export():
+            result.to_csv(os.path.join(tmp, "export.csv"))
+
+        tracemalloc.start()
+        try:
+            report = {}
+            wire, report["download"] = _measure(download)
+            rows, report["decode"] = _measure(decode)
+            result, report["validate"] = _measure(validate)
+            df, report["convert"] = _measure(convert)
+            _, report["export"] = _measure(export)
+        finally:
+            tracemalloc.stop()
+            transport.close()
+
+    report["rows"] = len(rows)
+    return report
+
+
+def run(curves: List[Curve], sizes: List[str]) -> Dict[str, Any]:
+    """Profile every curve and size against a fresh stand-in server"""
+    results = {}
+    with standin_server("0", 0.0, 0.0) as url:
+        # Warm up once so lazy imports and library caches are not counted
+        for curve in curves:
+            profile_pipeline(url, curve, "1d")
+        for curve in curves:
+            for size in sizes:
+                results[f"{curve.value}/{size}"] = profile_pipeline(url, curve, size)
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+            min_mb: float = 1.0) -> List[str]:
+    """Return a description of every stage whose peak regressed beyond the threshold"""
+    regressions = []
+    for key, stages in results.items():
+        for stage in STAGES:
+            old = baseline.get(key, {}).get(stage, {}).get("peak_mb")
+            new = stages[stage]["peak_mb"]
+            # Ignore stages too small for the relative change to mean anything
+            if old is None or max(old, new) < min_mb:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(f"{key} {stage}: peak {old:.2f}MB -> {new:.2f}MB "
+                                   f"(+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+    return regressions
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    print(f"{'curve/size':<40}{'rows':>9}" + "".join(f"{s:>19}" for s in STAGES))
+    print(f"{'':<49}" + "".join(f"{'peak / retained':>19}" for _ in STAGES))
+    for key, stages in results.items():
+        cells = "".join(f"{stages[s]['peak_mb']:>9.1f} /{stages[s]['retained_mb']:>7.1f}MB"
+                        for s in STAGES)
+        print(f"{key:<40}{stages['rows']:>9}{cells}")
+
+
+class MemoryStagesSuite:
+    """asv tracking of the peak allocation of each pipeline stage"""
+
+    params = ([c.value for c in CURVES], ["1m", "1y"])
+    param_names = ["curve", "size"]
+    timeout = 600
+    unit = "MB"
+
+    def setup_cache(self):
+        return run(list(CURVES), self.params[1])
+
+    def track_download_peak(self, results, curve, size):
+        return results[f"{curve}/{size}"]["download"]["peak_mb"]
+
+    def track_decode_peak(self, results, curve, size):
+        return results[f"{curve}/{size}"]["decode"]["peak_mb"]
+
+    def track_validate_peak(self, results, curve, size):
+        return results[f"{curve}/{size}"]["validate"]["peak_mb"]
+
+    def track_convert_peak(self, results, curve, size):
+        return results[f"{curve}/{size}"]["convert"]["peak_mb"]
+
+    def track_export_peak(self, results, curve, size):
+        return results[f"{curve}/{size}"]["export"]["peak_mb"]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Per-stage memory profile of the response pipeline")
+    parser.add_argument("--curves", nargs="+", default=[c.value for c in CURVES],
+                        help="Curve values, e.g. italy_imbalance_data italy_prices")
+    parser.add_argument("--sizes", nargs="+", default=["1m", "1y"], choices=list(SIZES))
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--check", help="Compare against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed relative growth of a stage's peak (default 0.10)")
+    args = parser.parse_args(argv)
+
+    results = run([Curve(c) for c in args.curves], args.sizes)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.check:
+        with open(args.check) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nMemory regressions:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"\nNo stage regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmarks for the CPU-bound hot paths: parsing responses into models and
+converting them to DataFrames.
+
+Payloads range from one day to ten years of a single series (see
+benchmarks/_payloads.py). Track them across commits with asv, e.g.
+
+    asv continuous main HEAD --bench bench_parsing
+
+or print a quick table with:
+
+    python -m benchmarks.bench_parsing
+"""
+
+import json
+import shutil
+import tempfile
+import time
+
+from benchmarks._payloads import MODEL_SOURCES, SIZES, json_response, model_rows
+from enemera.api.base import BaseCurveClient
+from enemera.cache import ArrowCache, CacheEntry
+from enemera.core.parallel import ParallelParser
+from enemera.core.response import APIResponse
+from enemera.models.response_models import PriceData
+from enemera.utils.utility_functions import calc_delivery_period
+from enemera.validators.validators import validate_and_transform_areas
+
+MODELS = {cls.__name__: cls for cls in MODEL_SOURCES}
+
+
+class ParseResponseSuite:
+    """BaseCurveClient._parse_response for every response model"""
+
+    params = (list(MODELS), list(SIZES))
+    param_names = ["model", "size"]
+    timeout = 300
+
+    def setup(self, model, size):
+        self.model_class = MODELS[model]
+        self.response = json_response(model_rows(self.model_class, size))
+
+    def time_parse_response(self, model, size):
+        BaseCurveClient._parse_response(self.response, self.model_class)
+
+    def peakmem_parse_response(self, model, size):
+        BaseCurveClient._parse_response(self.response, self.model_class)
+
+
+class ParallelParseSuite:
+    """ParallelParser on ten years of imbalance data, one worker per CPU"""
+
+    params = ["response", "pandas"]
+    param_names = ["output"]
+    timeout = 600
+
+    def setup(self, output):
+        self.model_class = MODELS["ItalyImbalanceDataResponse"]
+        self.body = json.dumps(model_rows(self.model_class, "10y")).encode()
+        self.parser = ParallelParser(min_bytes=0)
+        # Start the worker processes outside of the timed section
+        self.parser.parse(self.body[:1024 * 1024].rsplit(b"},", 1)[0] + b"}]", self.model_class)
+
+    def teardown(self, output):
+        self.parser.close()
+
+    def time_parallel_parse(self, output):
+        self.parser.parse(self.body, self.model_class, output)
+
+
+class ConversionSuite:
+    """APIResponse conversions and delivery period calculation on price data"""
+
+    params = list(SIZES)
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        self.result = APIResponse([PriceData(**row) for row in model_rows(PriceData, size)])
+        self.df = self.result.to_pandas()
+
+    def time_to_pandas(self, size):
+        self.result.to_pandas()
+
+    def time_to_pandas_cet(self, size):
+        self.result.to_pandas_cet()
+
+    def time_to_polars(self, size):
+        self.result.to_polars()
+
+    def time_calc_delivery_period(self, size):
+        calc_delivery_period(self.df.copy())
+
+    def peakmem_to_pandas(self, size):
+        self.result.to_pandas()
+
+
+class ArrowCacheSuite:
+    """Reloading a cached response from an ArrowCache and converting it"""
+
+    params = list(SIZES)
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ArrowCache(self.directory)
+        result = APIResponse([PriceData(**row) for row in model_rows(PriceData, size)])
+        self.cache.set("prices", CacheEntry(result))
+
+    def teardown(self, size):
+        shutil.rmtree(self.directory)
+
+    def time_load(self, size):
+        self.cache.get("prices")
+
+    def time_load_to_pandas(self, size):
+        self.cache.get("prices").response.to_pandas()
+
+    def time_load_to_polars(self, size):
+        self.cache.get("prices").response.to_polars()
+
+
+class AreaValidationSuite:
+    """validate_and_transform_areas for the accepted input shapes"""
+
+    params = ["single", "comma_separated", "list"]
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        zones = ["NORD", "CNOR", "CSUD", "SUD", "SICI", "SARD", "CALA"]
+        self.value = {
+            "single": "NORD",
+            "comma_separated": ",".join(zones),
+            "list": zones,
+        }[shape]
+
+    def time_validate_and_transform_areas(self, shape):
+        for _ in range(1000):
+            validate_and_transform_areas(self.value)
+
+
+def _measure(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sizes = [s for s in SIZES if s != "10y"]
+    print(f"{'benchmark':<48}" + "".join(f"{s:>10}" for s in sizes))
+
+    parse = ParseResponseSuite()
+    for model in MODELS:
+        cells = []
+        for size in sizes:
+            parse.setup(model, size)
+            cells.append(_measure(lambda: parse.time_parse_response(model, size)))
+        print(f"{'parse ' + model:<48}" + "".join(f"{c * 1000:>8.1f}ms" for c in cells))
+
+    conversion = ConversionSuite()
+    for name in ("to_pandas", "to_pandas_cet", "to_polars", "calc_delivery_period"):
+        cells = []
+        for size in sizes:
+            conversion.setup(size)
+            method = getattr(conversion, "time_" + name)
+            cells.append(_measure(lambda: method(size)))
+        print(f"{name:<48}" + "".join(f"{c * 1000:>8.1f}ms" for c in cells))
+
+    cache = ArrowCacheSuite()
+    for name in ("load", "load_to_pandas", "load_to_polars"):
+        cells = []
+        for size in sizes:
+            cache.setup(size)
+            method = getattr(cache, "time_" + name)
+            cells.append(_measure(lambda: method(size)))
+            cache.teardown(size)
+        print(f"{'arrow cache ' + name:<48}" + "".join(f"{c * 1000:>8.1f}ms" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Transport benchmarks: requests (HTTP/1.1) versus httpx (HTTP/1.1 and HTTP/2).
+
+Each benchmark fetches a small JSON payload from a local server, either
+sequentially or from several threads at once, through SecureSession so the
+full request path (headers, decoding, byte accounting) is included.
+
+Run with asv, or directly for a quick table:
+
+    python -m benchmarks.bench_transport
+"""
+
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._servers import H2CServer, HTTP1Server, json_body
+
+REQUESTS = 200
+THREADS = 16
+LATENCY = 0.005
+
+
+def make_api_key() -> str:
+    """Structurally valid JWT accepted by the client-side validator"""
+    def b64(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    now = int(time.time())
+    return ".".join([
+        b64({"alg": "HS256", "typ": "JWT"}),
+        b64({"sub": "benchmark-user-000000", "type": "api_key", "iat": now - 60,
+             "exp": now + 86400, "jti": "benchmark-0123456789abcdef"}),
+        "bEnChMaRk0123456789sIgNaTuRe_-AbCdEf"
+    ])
+
+
+def _make_session(backend: str):
+    from enemera.security import SecureSession
+    from enemera.transport import HTTPXTransport
+
+    if backend == "requests":
+        transport = "requests"
+    elif backend == "httpx-h1":
+        transport = HTTPXTransport(http2=False)
+    else:
+        # HTTP/2 over plain text requires prior knowledge
+        transport = HTTPXTransport(http2=True, http1=False)
+    return SecureSession(make_api_key(), "http://127.0.0.1", transport=transport)
+
+
+class TransportSuite:
+    params = ["requests", "httpx-h1", "httpx-h2"]
+    param_names = ["backend"]
+    timeout = 120
+
+    def setup(self, backend):
+        server_cls = H2CServer if backend == "httpx-h2" else HTTP1Server
+        self.server = server_cls(json_body(), latency=LATENCY)
+        self.session = _make_session(backend)
+        self.url = self.server.url + "/italy/prices"
+        # Warm up the connection pool
+        self.session.make_request("GET", self.url)
+
+    def teardown(self, backend):
+        self.session.close()
+        self.server.close()
+
+    def time_sequential(self, backend):
+        for _ in range(REQUESTS):
+            self.session.make_request("GET", self.url)
+
+    def time_concurrent(self, backend):
+        with ThreadPoolExecutor(THREADS) as pool:
+            list(pool.map(lambda _: self.session.make_request("GET", self.url), range(REQUESTS)))
+
+
+def main():
+    suite = TransportSuite()
+    print(f"{REQUESTS} requests, {LATENCY * 1000:.0f} ms server latency, {THREADS} threads")
+    print(f"{'backend':<10} {'sequential':>12} {'concurrent':>12}")
+    for backend in TransportSuite.params:
+        suite.setup(backend)
+        try:
+            timings = []
+            for bench in (suite.time_sequential, suite.time_concurrent):
+                start = time.perf_counter()
+                bench(backend)
+                timings.append(time.perf_counter() - start)
+        finally:
+            suite.teardown(backend)
+        print(f"{backend:<10} {timings[0]:>11.3f}s {timings[1]:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
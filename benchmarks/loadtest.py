@@ -0,0 +1,246 @@
+"""
+End-to-end load test of EnemeraClient against the local stand-in server.
+
+N worker threads share one client and pull curve data either with single
+client.get calls ("get" mode) or through download_long_period ("download"
+mode). The stand-in server runs in a separate process so that the reported
+CPU time and peak RSS belong to the client alone.
+
+Reported figures:
+    throughput   requests, curve-days and rows per second
+    latency      p50/p95/p99 of HTTP requests (send to body read) and, in
+                 "get" mode, of complete client.get calls including parsing
+    resources    client CPU time per request and peak RSS
+
+Example:
+
+    python -m benchmarks.loadtest --workers 8 --requests 400 --days 7 --latency 0.02:0.08
+    python -m benchmarks.loadtest --mode download --workers 4 --days 365 --json before.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from enemera import EnemeraClient
+from enemera.models.curves import Curve
+from enemera.testing import make_api_key
+from enemera.transport import Transport, create_transport
+from enemera.utils.utility_functions import download_long_period
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Curves in the default workload, with the extra parameters they need
+WORKLOAD = [
+    (Curve.ITALY_PRICES, {"market": "MGP"}),
+    (Curve.ITALY_IMBALANCE_DATA, {}),
+    (Curve.ITALY_LOAD_ACTUAL, {}),
+    (Curve.ITALY_GENERATION, {"generation_type": "SOLAR"}),
+    (Curve.SPAIN_PRICES, {"market": "MD"}),
+]
+
+START = date(2020, 1, 1)
+
+
+class TimedTransport(Transport):
+    """Transport wrapper recording the latency of every HTTP request"""
+
+    name = "timed"
+
+    def __init__(self, inner: Transport):
+        self.inner = inner
+        self.latencies: List[float] = []
+        self._started: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def send(self, method, url, *, params=None, headers=None, timeout=None):
+        start = time.perf_counter()
+        response = self.inner.send(method, url, params=params, headers=headers, timeout=timeout)
+        with self._lock:
+            self._started[id(response)] = start
+        return response
+
+    def iter_raw(self, response, chunk_size) -> Iterator[bytes]:
+        yield from self.inner.iter_raw(response, chunk_size)
+        end = time.perf_counter()
+        with self._lock:
+            start = self._started.pop(id(response), None)
+            if start is not None:
+                self.latencies.append(end - start)
+
+    def set_body(self, response, body):
+        self.inner.set_body(response, body)
+
+    def update_headers(self, headers):
+        self.inner.update_headers(headers)
+
+    def close_response(self, response):
+        self.inner.close_response(response)
+
+    def close(self):
+        self.inner.close()
+
+    @staticmethod
+    def response_url(response):
+        return str(response.url)
+
+
+@contextlib.contextmanager
+def standin_server(latency: str, error_rate: float, rate_limit_rate: float) -> Iterator[str]:
+    """Run the stand-in server in a child process and yield its URL"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "enemera.testing", "--port", "0", "--quiet",
+         "--latency", latency, "--error-rate", str(error_rate),
+         "--rate-limit-rate", str(rate_limit_rate), "--seed", "0"],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        line = process.stdout.readline()
+        if "listening on" not in line:
+            raise RuntimeError(f"Stand-in server failed to start: {line!r}")
+        yield line.rsplit(" ", 1)[-1].strip()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def percentiles(samples: List[float]) -> Dict[str, Optional[float]]:
+    """Nearest-rank p50/p95/p99 in milliseconds"""
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None}
+    ordered = sorted(samples)
+    result = {}
+    for pct in (50, 95, 99):
+        rank = max(1, int(round(pct / 100.0 * len(ordered))))
+        result[f"p{pct}"] = round(ordered[min(rank, len(ordered)) - 1] * 1000, 2)
+    return result
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run(url: str, mode: str, workers: int, requests: int, days: int,
+        step_days: int, transport: str) -> Dict[str, Any]:
+    """Run one load test against a server and return its report"""
+    timed = TimedTransport(create_transport(transport))
+    client = EnemeraClient(api_key=make_api_key(), base_url=url, transport=timed)
+    call_latencies: List[float] = []
+    totals = {"calls": 0, "errors": 0, "rows": 0, "curve_days": 0}
+    lock = threading.Lock()
+
+    def job(i: int) -> None:
+        curve, extra = WORKLOAD[i % len(WORKLOAD)]
+        date_from = START + timedelta(days=(i * days) % 3650)
+        date_to = date_from + timedelta(days=days - 1)
+        start = time.perf_counter()
+        try:
+            if mode == "get":
+                rows = len(client.get(curve, date_from=date_from, date_to=date_to, **extra))
+            else:
+                # download_long_period reports progress on stdout
+                with contextlib.redirect_stdout(io.StringIO()):
+                    rows = len(download_long_period(client, curve, date_from, date_to,
+                                                    step_days=step_days, **extra))
+            error = 0
+        except Exception:
+            rows, error = 0, 1
+        elapsed = time.perf_counter() - start
+        with lock:
+            call_latencies.append(elapsed)
+            totals["calls"] += 1
+            totals["errors"] += error
+            totals["rows"] += rows
+            totals["curve_days"] += 0 if error else days
+
+    cpu_start = os.times()
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(job, range(requests)))
+    wall = time.perf_counter() - wall_start
+    cpu_end = os.times()
+    client.secure_session.close()
+
+    cpu = (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system)
+    http_requests = len(timed.latencies)
+    return {
+        "mode": mode,
+        "transport": transport,
+        "workers": workers,
+        "calls": totals["calls"],
+        "errors": totals["errors"],
+        "http_requests": http_requests,
+        "days_per_call": days,
+        "wall_seconds": round(wall, 3),
+        "calls_per_second": round(totals["calls"] / wall, 2),
+        "http_requests_per_second": round(http_requests / wall, 2),
+        "curve_days_per_second": round(totals["curve_days"] / wall, 2),
+        "rows_per_second": round(totals["rows"] / wall, 1),
+        "http_latency_ms": percentiles(timed.latencies),
+        "call_latency_ms": percentiles(call_latencies),
+        "cpu_ms_per_http_request": round(cpu * 1000 / http_requests, 3) if http_requests else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"mode={report['mode']} transport={report['transport']} workers={report['workers']} "
+          f"days/call={report['days_per_call']}")
+    print(f"  calls            {report['calls']} ({report['errors']} failed), "
+          f"{report['http_requests']} HTTP requests in {report['wall_seconds']}s")
+    print(f"  throughput       {report['calls_per_second']} calls/s, "
+          f"{report['http_requests_per_second']} req/s, "
+          f"{report['curve_days_per_second']} curve-days/s, {report['rows_per_second']} rows/s")
+    for name in ("http_latency_ms", "call_latency_ms"):
+        p = report[name]
+        print(f"  {name.replace('_ms', ''):<16} p50={p['p50']}ms p95={p['p95']}ms p99={p['p99']}ms")
+    print(f"  cpu per request  {report['cpu_ms_per_http_request']}ms")
+    print(f"  peak RSS         {report['peak_rss_mb']}MB")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Load test EnemeraClient against a stand-in server")
+    parser.add_argument("--mode", choices=("get", "download"), default="get")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200,
+                        help="Number of client.get calls, or downloads in download mode")
+    parser.add_argument("--days", type=int, default=1, help="Days covered by each call")
+    parser.add_argument("--step-days", type=int, default=100, help="Chunk size in download mode")
+    parser.add_argument("--latency", default="0.02", help="Server latency in seconds, or MIN:MAX")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--transport", default="requests", choices=("requests", "httpx", "http2"))
+    parser.add_argument("--url", help="Use an already running server instead of starting one")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args(argv)
+
+    with (contextlib.nullcontext(args.url) if args.url else
+          standin_server(args.latency, args.error_rate, args.rate_limit_rate)) as url:
+        report = run(url, args.mode, args.workers, args.requests, args.days,
+                     args.step_days, args.transport)
+    report["server_latency"] = args.latency
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
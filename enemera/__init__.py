@@ -1,7 +1,13 @@
 """
 Enemera API Client - A Python client for the Enemera energy data API.
+
+Only the exceptions are imported eagerly. Every other public name is imported
+on first access, so `import enemera` stays cheap and pandas, numpy and polars
+are loaded only by the conversions that need them.
 """
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.2.1"
 
 # Import exceptions first as they don't have dependencies
@@ -12,29 +18,62 @@ from enemera.core.exceptions import (
     APIError,
     ValidationError,
     ConnectionError,
+    TimeoutError,
+    CircuitOpenError,
     DependencyError
 )
-from enemera.models.curves import Curve
-# Import common enums and models that don't have dependencies
-from enemera.models.enums import Market, Area, Purpose
-from enemera.utils.utility_functions import calc_delivery_period, download_long_period
 
-# Import response module with optional dependencies
-try:
+# Public name -> module defining it, imported on first access
+_LAZY_IMPORTS = {
+    "EnemeraClient": "enemera.client",
+    "BaseCurveClient": "enemera.api.base",
+    "APIResponse": "enemera.core.response",
+    "Curve": "enemera.models.curves",
+    "Market": "enemera.models.enums",
+    "Area": "enemera.models.enums",
+    "Purpose": "enemera.models.enums",
+    "calc_delivery_period": "enemera.utils.utility_functions",
+    "download_long_period": "enemera.utils.utility_functions",
+    "deadline": "enemera.core.deadline",
+    "Deadline": "enemera.core.deadline",
+    "HedgingPolicy": "enemera.core.hedging",
+    "CircuitBreaker": "enemera.core.breaker",
+    "ParallelParser": "enemera.core.parallel",
+    "RequestEvent": "enemera.core.hooks",
+    "RequestHook": "enemera.core.hooks",
+    "StatsCollector": "enemera.core.hooks",
+    "SlowQueryLog": "enemera.core.slow_queries",
+}
+
+if TYPE_CHECKING:
+    from enemera.api.base import BaseCurveClient
+    from enemera.client import EnemeraClient
+    from enemera.core.breaker import CircuitBreaker
+    from enemera.core.deadline import Deadline, deadline
+    from enemera.core.hedging import HedgingPolicy
+    from enemera.core.hooks import RequestEvent, RequestHook, StatsCollector
+    from enemera.core.parallel import ParallelParser
     from enemera.core.response import APIResponse
-    # from enemera.data_utils import to_pandas, to_polars, to_csv, to_excel, convert_timezone, to_cet
-except ImportError as e:
-    # Provide a helpful message if dependencies are missing
-    missing_dep = str(e).split("'")[-2] if "'" in str(e) else str(e)
-    if "polars" in missing_dep or "pytz" in missing_dep:
-        print(
-            f"Optional dependency missing: {missing_dep}. Install with 'pip install enemera[polars]'")
-    else:
-        print(f"Error importing data conversion modules: {e}")
-
-# Import the client and API base which depend on the above
-from enemera.api.base import BaseCurveClient
-from enemera.client import EnemeraClient
+    from enemera.core.slow_queries import SlowQueryLog
+    from enemera.models.curves import Curve
+    from enemera.models.enums import Market, Area, Purpose
+    from enemera.utils.utility_functions import calc_delivery_period, download_long_period
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'enemera' has no attribute '{name}'")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "EnemeraClient",
@@ -44,5 +83,14 @@ __all__ = [
     "APIResponse",
     "Curve",
     "calc_delivery_period",
-    "download_long_period"
+    "download_long_period",
+    "deadline",
+    "Deadline",
+    "HedgingPolicy",
+    "CircuitBreaker",
+    "ParallelParser",
+    "RequestEvent",
+    "RequestHook",
+    "StatsCollector",
+    "SlowQueryLog"
 ]
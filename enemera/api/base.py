@@ -1,21 +1,125 @@
 # Add these imports at the top
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, date
-from typing import Dict, Any, Optional, Union, Type, TYPE_CHECKING, TypeVar
+from typing import (Dict, Any, Callable, Iterable, Iterator, Optional, Set, Tuple, Union,
+                    Type, TYPE_CHECKING, TypeVar)
 
-import pandas as pd
 import requests
 
-from enemera.core.exceptions import ConfigurationError
-from enemera.core.response import APIResponse
+from enemera.cache import CacheBackend, CacheEntry, CachePolicy, make_cache_key
+from enemera.core.breaker import CircuitBreaker, is_failure
+from enemera.core.compression import TransferStats
+from enemera.core.deadline import current_deadline
+from enemera.core.exceptions import APIError, ConfigurationError, RateLimitError, RetryError
+from enemera.core.hedging import HedgingPolicy
+from enemera.core.hooks import (
+    HookManager,
+    RequestEvent,
+    RequestHook,
+    current_event,
+    make_hook_manager,
+    track
+)
+from enemera.core.parallel import ParallelParser
+from enemera.core.response import APIResponse, ArrowResponse
+from enemera.models.curves import ENDPOINT_CURVES
 from enemera.security import validate_api_key, SecureSession, SecureConfig
+from enemera.transport import Transport
 from enemera.utils.logging import logger
 
 # Keep existing TypeVar
 T = TypeVar('T')
 
+_defer_parsing: ContextVar[bool] = ContextVar("enemera_defer_parsing", default=False)
+
+_revalidate: ContextVar[bool] = ContextVar("enemera_revalidate", default=False)
+
+
+@contextmanager
+def deferred_parsing() -> Iterator[None]:
+    """Make client calls in the enclosed block return a DeferredResponse
+
+    The calls then only download their response, leaving decoding and
+    validation to DeferredResponse.parse(), which can run on another thread
+    while the next download is in flight.
+    """
+    token = _defer_parsing.set(True)
+    try:
+        yield
+    finally:
+        _defer_parsing.reset(token)
+
+
+@contextmanager
+def revalidating() -> Iterator[None]:
+    """Make client calls in the enclosed block ask the API even for fresh cache entries
+
+    Entries younger than cache_max_age are revalidated with a conditional GET
+    instead of being served as they are, and stale entries are never served.
+    Final entries are still served from the cache. Background refreshes and
+    prefetching use this to bring the cache up to date.
+    """
+    token = _revalidate.set(True)
+    try:
+        yield
+    finally:
+        _revalidate.reset(token)
+
+
+def _finish_fetch(event: RequestEvent, finish: Callable[[], APIResponse]) -> APIResponse:
+    """Parse a fetched response and complete the call's event"""
+    with track(event):
+        try:
+            result = finish()
+        except Exception as e:
+            event.error = e
+            event.emit("on_error", e)
+            raise
+        # Conversions of the result are reported against this call
+        result._event = event
+        event.rows = len(result)
+        event.emit("on_parsed")
+        return result
+
+
+def _served(response: APIResponse, stale: bool) -> APIResponse:
+    """Return a copy of a cached response for one call, flagged if it is outdated
+
+    Every call gets its own copy, so its flags, the event its conversions are
+    reported to and changes made to it as a list stay out of the cache.
+    """
+    served = response._copy()
+    served.stale = stale
+    return served
+
+
+class DeferredResponse:
+    """A downloaded response that has not been parsed yet
+
+    Returned by client calls made inside deferred_parsing().
+
+    Attributes:
+        event: RequestEvent of the call
+    """
+
+    def __init__(self, event: RequestEvent, finish: Callable[[], APIResponse]):
+        self.event = event
+        self._finish = finish
+
+    def parse(self) -> APIResponse:
+        """Decode and validate the response, completing the call"""
+        return _finish_fetch(self.event, self._finish)
+
+
 if TYPE_CHECKING:
+    import pandas as pd
     import polars as pl
+    from enemera.store import ParquetStore
 
 
 class BaseCurveClient:
@@ -23,7 +127,20 @@ class BaseCurveClient:
 
     def __init__(self, base_url: str,
                  api_key: Optional[str] = None,
-                 use_secure_session: bool = True):
+                 use_secure_session: bool = True,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 hedging: Optional[HedgingPolicy] = None,
+                 cache: Optional[CacheBackend] = None,
+                 cache_max_age: float = 0,
+                 cache_policy: Optional[CachePolicy] = None,
+                 stale_while_revalidate: float = 0,
+                 stale_if_error: float = 0,
+                 breaker: Optional[CircuitBreaker] = None,
+                 transport: Union[str, Transport, None] = None,
+                 hooks: Union[HookManager, Iterable[RequestHook], None] = None,
+                 secure_session: Optional[SecureSession] = None,
+                 parallel: Optional[ParallelParser] = None,
+                 store: Optional['ParquetStore'] = None):
         """
         Initialize base client with optional security enhancements
         
@@ -31,18 +148,72 @@ class BaseCurveClient:
             base_url: API base URL
             api_key: API key (if None, attempts to load from environment)
             use_secure_session: Whether to use enhanced security features
+            timeout: Read timeout in seconds, or a (connect, read) tuple
+                (if None, uses ENEMERA_TIMEOUT or the session default)
+            hedging: Optional policy for hedging slow GET requests
+            cache: Optional cache for parsed responses, revalidated with
+                conditional GETs (ETag / Last-Modified)
+            cache_max_age: Seconds a cached response is served without
+                revalidation (0 revalidates on every call)
+            cache_policy: Optional per-curve ttl and finality of cached
+                responses; final ones are served without revalidation
+            stale_while_revalidate: Seconds past cache_max_age a cached
+                response is still returned immediately, flagged as stale,
+                while a background request refreshes the cache
+            stale_if_error: Seconds past cache_max_age a cached response is
+                returned, flagged as stale, when the API is unavailable
+                (connection errors, timeouts, 5xx, 429, open circuit)
+            breaker: Optional circuit breaker failing calls to an endpoint
+                fast after repeated failures (secure session only)
+            transport: HTTP backend: "requests" (default), "httpx", "http2",
+                or a Transport instance
+            hooks: Lifecycle hooks notified of every call (see enemera.core.hooks)
+            secure_session: Existing SecureSession to share instead of
+                creating a new one
+            parallel: Optional process pool used to parse large responses
+                (see enemera.core.parallel)
+            store: Optional local Parquet store. Calls are served from it and
+                only the days it is missing (or holds non-final data for) are
+                requested and added to it.
         """
         self.base_url = base_url.rstrip('/')
         self.use_secure_session = use_secure_session
 
+        if timeout is None:
+            timeout = SecureConfig.load_timeout(default=None)
+        self.timeout = SecureSession._normalize_timeout(timeout)
+        self.hedging = hedging
+        self.cache = cache
+        self.cache_max_age = cache_max_age
+        self.cache_policy = cache_policy
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.breaker = breaker
+        self.transport = transport
+        self.hooks = make_hook_manager(hooks)
+        self.parallel = parallel
+        self.store = store
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing_keys: Set[str] = set()
+        self._refresh_lock = threading.Lock()
+
         if use_secure_session:
-            self._init_secure_session(api_key)
+            self._init_secure_session(api_key, secure_session)
+            # Hooks and circuits are shared with every client using the same session
+            self.hooks = self.secure_session.hooks
+            self.breaker = self.secure_session.breaker
         else:
             self._init_legacy_session(api_key)
 
-    def _init_secure_session(self, api_key: Optional[str] = None):
+    def _init_secure_session(self, api_key: Optional[str] = None,
+                             secure_session: Optional[SecureSession] = None):
         """Initialize with enhanced security"""
 
+        if secure_session is not None:
+            self.secure_session = secure_session
+            self.session = secure_session.session
+            return
+
         # Load configuration securely
         if api_key is None:
             try:
@@ -62,7 +233,9 @@ class BaseCurveClient:
         validated_key = validate_api_key(api_key)
 
         # Initialize secure session
-        self.secure_session = SecureSession(validated_key, self.base_url)
+        self.secure_session = SecureSession(validated_key, self.base_url, timeout=self.timeout,
+                                            hedging=self.hedging, transport=self.transport,
+                                            hooks=self.hooks, breaker=self.breaker)
         self.session = self.secure_session.session  # For backward compatibility
 
     def _init_legacy_session(self, api_key: Optional[str] = None):
@@ -80,10 +253,16 @@ class BaseCurveClient:
                 "Content-Type": "application/json"
             })
 
-    def _make_request(self, endpoint: str, params: Dict[str, Any]) -> requests.Response:
-        """Make HTTP request with enhanced error handling"""
+    @property
+    def transfer_stats(self) -> Optional[TransferStats]:
+        """Wire versus decoded byte counters per endpoint (secure session only)"""
+        if self.use_secure_session and hasattr(self, 'secure_session'):
+            return self.secure_session.transfer_stats
+        return None
+
+    def _format_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Format and validate query parameters, dropping unset ones"""
 
-        # Format parameters (keep existing logic)
         formatted_params = {}
         date_from = None
         date_to = None
@@ -113,13 +292,40 @@ class BaseCurveClient:
             if to_date < from_date:
                 raise ValueError(f"date_to ({date_to}) cannot be before date_from ({date_from})")
 
+        return formatted_params
+
+    def _make_request(self, endpoint: str, params: Dict[str, Any],
+                      headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Make HTTP request with enhanced error handling"""
+
+        formatted_params = self._format_params(params)
+
         # Make request using appropriate session
         url = f"{self.base_url}{endpoint}"
 
         if self.use_secure_session and hasattr(self, 'secure_session'):
-            return self.secure_session.make_request('GET', url, params=formatted_params)
+            return self.secure_session.make_request('GET', url, params=formatted_params,
+                                                    headers=headers)
         else:
-            response = self.session.get(url, params=formatted_params)
+            timeout = self.timeout
+            deadline = current_deadline()
+            if deadline is not None:
+                deadline.check()
+                timeout = deadline.cap_timeout(timeout)
+            start = time.perf_counter()
+            response = self.session.get(url, params=formatted_params, headers=headers,
+                                        timeout=timeout)
+            event = current_event()
+            if event is not None:
+                event.add_timing("wait", time.perf_counter() - start)
+                event.status_code = response.status_code
+                # requests has already decompressed the body; only Content-Length
+                # tells its size on the wire (unknown for chunked responses)
+                content_length = response.headers.get("Content-Length", "")
+                if content_length.isdigit():
+                    event.wire_bytes += int(content_length)
+                event.decoded_bytes += len(response.content)
+                event.emit("on_response")
             response.raise_for_status()
             return response
 
@@ -136,14 +342,186 @@ class BaseCurveClient:
         else:
             return str(date_obj)
 
+    def _fetch(self, endpoint: str, params: Dict[str, Any], model_class: Type[T]) -> APIResponse[T]:
+        """Request an endpoint and parse the response, using the cache if configured
+
+        Cached responses younger than cache_max_age, or final according to
+        the cache policy, are returned directly.
+        Older ones are revalidated with a conditional GET; on 304 Not Modified
+        the cached APIResponse is reused without decoding or validating anything.
+        Within stale_while_revalidate (or stale_if_error, when the request
+        fails) an older response is returned instead, with stale set to True.
+
+        The call is tracked by a RequestEvent passed to the client's hooks.
+        Inside deferred_parsing(), the response is only downloaded and a
+        DeferredResponse is returned instead; its parse() finishes the call.
+        """
+        event = RequestEvent(method='GET', endpoint=endpoint, params=params, hooks=self.hooks)
+        with track(event):
+            event.emit("on_request_start")
+            try:
+                finish = self._fetch_cached(endpoint, params, model_class, event)
+            except Exception as e:
+                event.error = e
+                event.emit("on_error", e)
+                raise
+        if _defer_parsing.get():
+            return DeferredResponse(event, finish)
+        return _finish_fetch(event, finish)
+
+    def _fetch_cached(self, endpoint: str, params: Dict[str, Any], model_class: Type[T],
+                      event: RequestEvent) -> Callable[[], APIResponse[T]]:
+        """Fetch through the cache if one is configured
+
+        Returns:
+            A function turning what was fetched into the APIResponse
+        """
+        if self.store is not None and endpoint in ENDPOINT_CURVES \
+                and params.get('date_from') is not None and params.get('date_to') is not None:
+            return self._fetch_stored(endpoint, params, model_class, event)
+
+        if self.cache is None:
+            response = self._make_request(endpoint, params)
+            return lambda: self._parse_response(response, model_class, self.parallel)
+
+        formatted = self._format_params(params)
+        key = make_cache_key(endpoint, formatted)
+        entry = self.cache.get(key)
+        if entry is not None and entry.expired:
+            entry = None
+        if entry is not None and (entry.final or (entry.age < self.cache_max_age
+                                                   and not _revalidate.get())):
+            event.cache = "hit"
+            return lambda: _served(entry.response, stale=False)
+
+        if entry is not None and not _revalidate.get() \
+                and entry.age < self.cache_max_age + self.stale_while_revalidate:
+            self._refresh_in_background(key, endpoint, params, model_class)
+            event.cache = "stale"
+            return lambda: _served(entry.response, stale=True)
+
+        headers = entry.conditional_headers() if entry is not None else None
+        try:
+            response = self._make_request(endpoint, params, headers=headers)
+        except Exception as e:
+            if entry is None or _revalidate.get() or not self._serves_stale_on(entry, e):
+                raise
+            logger.warning(f"Serving a stale response for {endpoint}",
+                           age=round(entry.age, 1), error=str(e))
+            event.cache = "stale"
+            event.extra["stale_error"] = e
+            return lambda: _served(entry.response, stale=True)
+
+        if response.status_code == 304:
+            if entry is None:
+                # Nothing was asked conditionally, so there is no body to fall back on
+                raise APIError(304, f"Unexpected 304 Not Modified for {endpoint} "
+                                    f"without a cached response")
+            entry.revalidated(response.headers)
+            self.cache.set(key, entry)
+            event.cache = "revalidated"
+            return lambda: _served(entry.response, stale=False)
+
+        def parse_and_store():
+            result = self._parse_response(response, model_class, self.parallel)
+            new_entry = CacheEntry(
+                result,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+            if self.cache_policy is not None:
+                self.cache_policy.apply(new_entry, endpoint, formatted)
+            self.cache.set(key, new_entry)
+            return result._copy()
+
+        return parse_and_store
+
+    def _serves_stale_on(self, entry: CacheEntry, error: Exception) -> bool:
+        """Whether a failed request falls back to an outdated cached response"""
+        # Rate limiting, surfacing directly or as exhausted retries, also falls back
+        rate_limited = isinstance(error, RateLimitError) or (
+            isinstance(error, RetryError) and error.status_code == 429)
+        unavailable = is_failure(error) or rate_limited
+        return unavailable and entry.age < self.cache_max_age + self.stale_if_error
+
+    def _refresh_in_background(self, key: str, endpoint: str, params: Dict[str, Any],
+                               model_class: Type[T]) -> None:
+        """Refresh a cache entry on a background thread, once per key at a time"""
+        with self._refresh_lock:
+            if key in self._refreshing_keys:
+                return
+            self._refreshing_keys.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="enemera-refresh")
+        self._refresh_executor.submit(self._refresh, key, endpoint, dict(params), model_class)
+
+    def _refresh(self, key: str, endpoint: str, params: Dict[str, Any],
+                 model_class: Type[T]) -> None:
+        """Revalidate or refetch a stale entry; the call is reported to the hooks"""
+        try:
+            with revalidating():
+                self._fetch(endpoint, params, model_class)
+        except Exception as e:
+            logger.warning(f"Background refresh of {endpoint} failed", error=str(e))
+        finally:
+            with self._refresh_lock:
+                self._refreshing_keys.discard(key)
+
+    def _fetch_stored(self, endpoint: str, params: Dict[str, Any], model_class: Type[T],
+                      event: RequestEvent) -> Callable[[], APIResponse[T]]:
+        """Request only the days the store is missing, then serve the call from the store"""
+        curve = ENDPOINT_CURVES[endpoint]
+        formatted = self._format_params(params)
+        start = date.fromisoformat(formatted['date_from'])
+        end = date.fromisoformat(formatted['date_to'])
+        filters = {k: v for k, v in params.items() if k not in ('date_from', 'date_to')}
+        partition = self.store.partition(curve, filters, names=list(filters))
+
+        missing = self.store.missing(partition, start, end)
+        for range_start, range_end in missing:
+            response = self._make_request(endpoint, dict(params, date_from=range_start,
+                                                         date_to=range_end))
+            result = self._parse_response(response, model_class, self.parallel)
+            self.store.write(partition, curve, result, range_start, range_end)
+        event.cache = "miss" if missing else "hit"
+
+        def read():
+            table = self.store.read_partition(partition, start, end)
+            fields = [f for f in model_class.model_fields if f in table.column_names]
+            # Conversions read the table; models are only built if the rows are used as a list
+            return ArrowResponse(table.select(fields), model_class)
+
+        return read
+
     @staticmethod
-    def _parse_response(response: requests.Response, model_class: Type[T]) -> APIResponse[T]:
-        """Parse response into model objects"""
+    def _parse_response(response: requests.Response, model_class: Type[T],
+                        parallel: Optional[ParallelParser] = None) -> APIResponse[T]:
+        """Parse response into model objects
+
+        Large bodies are decoded and validated in shards by the parallel
+        parser if one is given; their whole parse time counts as validation.
+        """
+        if parallel is not None and parallel.should_parallelize(response.content):
+            start = time.perf_counter()
+            result = parallel.parse(response.content, model_class)
+            event = current_event()
+            if event is not None:
+                event.add_timing("validate", time.perf_counter() - start)
+            return result
+
+        start = time.perf_counter()
         data = response.json()
+        decoded = time.perf_counter()
         items = [model_class(**item) for item in data]
+
+        event = current_event()
+        if event is not None:
+            event.add_timing("json_decode", decoded - start)
+            event.add_timing("validate", time.perf_counter() - decoded)
         return APIResponse(items)
 
-    def get_pandas(self, **kwargs) -> pd.DataFrame:
+    def get_pandas(self, **kwargs) -> 'pd.DataFrame':
         """Get data as pandas DataFrame"""
         return self.get(**kwargs).to_pandas()
 
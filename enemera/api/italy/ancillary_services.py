@@ -10,8 +10,8 @@ from enemera.models.response_models import IPEXAncillaryServicesResponse
 class ItalyAncillaryServicesResultsClient(BaseCurveClient):
     """Client for Italian electricity prices"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             market: str,
@@ -29,5 +29,4 @@ class ItalyAncillaryServicesResultsClient(BaseCurveClient):
             'area': area
         }
         endpoint = '/italy/ancillary_services'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, IPEXAncillaryServicesResponse)
+        return self._fetch(endpoint, params, IPEXAncillaryServicesResponse)
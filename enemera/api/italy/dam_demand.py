@@ -10,8 +10,8 @@ from enemera.models.response_models import IPEXActualDemandResponse, IPEXEstimat
 class ItalyActDamDemandClient(BaseCurveClient):
     """Client for Italian DAM Demand Act or Fabbisogno"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -24,15 +24,14 @@ class ItalyActDamDemandClient(BaseCurveClient):
             'area': area
         }
         endpoint = '/italy/dam_demand/act'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, IPEXActualDemandResponse)
+        return self._fetch(endpoint, params, IPEXActualDemandResponse)
 
 
 class ItalyFcsDamDemandClient(BaseCurveClient):
     """Client for Italian DAM Demand Fcs or Stima Fabbisogno"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -45,5 +44,4 @@ class ItalyFcsDamDemandClient(BaseCurveClient):
             'area': area
         }
         endpoint = '/italy/dam_demand/fcs'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, IPEXEstimatedDemandResponse)
+        return self._fetch(endpoint, params, IPEXEstimatedDemandResponse)
@@ -10,8 +10,8 @@ from enemera.models.response_models import IpexQuantityResponse
 class ItalyExchangeVolumesClient(BaseCurveClient):
     """Client for Italian exchange volumes"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             market: str,
@@ -28,5 +28,4 @@ class ItalyExchangeVolumesClient(BaseCurveClient):
             'purpose': purpose
         }
         endpoint = '/italy/exchange_volumes'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, IpexQuantityResponse)
+        return self._fetch(endpoint, params, IpexQuantityResponse)
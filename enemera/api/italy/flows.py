@@ -10,8 +10,8 @@ from enemera.models.response_models import IPEXFlowResponse, IPEXFlowLimitRespon
 class ItalyCommercialFlowsClient(BaseCurveClient):
     """Client for Italian commercial flows"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             market: str,
@@ -30,15 +30,14 @@ class ItalyCommercialFlowsClient(BaseCurveClient):
         }
 
         endpoint = '/italy/commercial_flows'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, IPEXFlowResponse)
+        return self._fetch(endpoint, params, IPEXFlowResponse)
 
 
 class ItalyCommercialFlowLimitsClient(BaseCurveClient):
     """Client for Italian commercial flow limits"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             market: str,
@@ -57,5 +56,4 @@ class ItalyCommercialFlowLimitsClient(BaseCurveClient):
         }
 
         endpoint = '/italy/commercial_flow_limits'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, IPEXFlowLimitResponse)
+        return self._fetch(endpoint, params, IPEXFlowLimitResponse)
@@ -10,8 +10,8 @@ from enemera.models.response_models import GenerationData
 class ItalyGenerationClient(BaseCurveClient):
     """Client for Italian generation data"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             generation_type: str,
@@ -26,15 +26,14 @@ class ItalyGenerationClient(BaseCurveClient):
             'area': area
         }
         endpoint = f'/italy/generation/actual'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, GenerationData)
+        return self._fetch(endpoint, params, GenerationData)
 
 
 class ItalyGenerationForecastClient(BaseCurveClient):
     """Client for Italian generation data"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             generation_type: str,
@@ -49,5 +48,4 @@ class ItalyGenerationForecastClient(BaseCurveClient):
             'area': area
         }
         endpoint = f'/italy/generation/forecast'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, GenerationData)
+        return self._fetch(endpoint, params, GenerationData)
@@ -10,8 +10,8 @@ from enemera.models.response_models import ItalyImbalanceDataResponse
 class ItalyImbalanceDataClient(BaseCurveClient):
     """Client for Italian imbalance data"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -24,15 +24,14 @@ class ItalyImbalanceDataClient(BaseCurveClient):
             'area': area
         }
         endpoint = '/italy/imbalance/data'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, ItalyImbalanceDataResponse)
+        return self._fetch(endpoint, params, ItalyImbalanceDataResponse)
 
 
 class ItalyImbalanceDataPT60MClient(BaseCurveClient):
     """Client for Italian imbalance data"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -45,5 +44,4 @@ class ItalyImbalanceDataPT60MClient(BaseCurveClient):
             'area': area
         }
         endpoint = '/italy/imbalance/data_PT60M'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, ItalyImbalanceDataResponse)
+        return self._fetch(endpoint, params, ItalyImbalanceDataResponse)
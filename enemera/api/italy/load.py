@@ -10,8 +10,8 @@ from enemera.models.response_models import LoadData
 class ItalyLoadActualClient(BaseCurveClient):
     """Client for Italian actual load"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -26,15 +26,14 @@ class ItalyLoadActualClient(BaseCurveClient):
 
         endpoint = '/italy/load/actual'
 
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, LoadData)
+        return self._fetch(endpoint, params, LoadData)
 
 
 class ItalyLoadForecastClient(BaseCurveClient):
     """Client for Italian load forecasts"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -48,5 +47,4 @@ class ItalyLoadForecastClient(BaseCurveClient):
         }
 
         endpoint = '/italy/load/forecast'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, LoadData)
+        return self._fetch(endpoint, params, LoadData)
@@ -21,13 +21,16 @@ class ItalyPricesClient(BaseCurveClient):
     including day-ahead (MGP) and intraday markets (MI1-MI7).
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
         """Initialize a new ItalyPricesClient.
 
         Args:
             api_key: Optional API key for authentication
+            base_url: API base URL (e.g., a local stand-in server or proxy)
+            **kwargs: Additional session options passed to BaseCurveClient
+                (e.g., timeout, secure_session)
         """
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             market: str,
@@ -66,5 +69,4 @@ class ItalyPricesClient(BaseCurveClient):
             'area': area
         }
         endpoint = '/italy/prices'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, PriceData)
+        return self._fetch(endpoint, params, PriceData)
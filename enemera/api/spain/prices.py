@@ -10,8 +10,8 @@ from enemera.models.response_models import SpainPriceResponse
 class SpainPricesClient(BaseCurveClient):
     """Client for Spanish electricity prices"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             market: str,
@@ -23,5 +23,4 @@ class SpainPricesClient(BaseCurveClient):
             'date_from': date_from,
             'date_to': date_to
         }
-        response = self._make_request('/spain/prices', params)
-        return self._parse_response(response, SpainPriceResponse)
+        return self._fetch('/spain/prices', params, SpainPriceResponse)
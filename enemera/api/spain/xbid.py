@@ -10,8 +10,8 @@ from enemera.models.response_models import SpainXbidResultsResponse
 class SpainXbidResultsClient(BaseCurveClient):
     """Client for Spanish XBID results """
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
 
     def get(self,
             date_from: Union[str, datetime, date],
@@ -24,5 +24,4 @@ class SpainXbidResultsClient(BaseCurveClient):
             'date_to': date_to,
         }
         endpoint = '/spain/xbid/results'
-        response = self._make_request(endpoint, params)
-        return self._parse_response(response, SpainXbidResultsResponse)
+        return self._fetch(endpoint, params, SpainXbidResultsResponse)
@@ -0,0 +1,18 @@
+# enemera/cache/__init__.py
+"""Response caching for the Enemera API client"""
+
+from .arrow import ArrowCache
+from .base import CacheBackend, CacheEntry, make_cache_key
+from .memory import MemoryCache
+from .policy import CachePolicy
+from .redis import RedisCache
+
+__all__ = [
+    'ArrowCache',
+    'CacheBackend',
+    'CacheEntry',
+    'CachePolicy',
+    'MemoryCache',
+    'RedisCache',
+    'make_cache_key'
+]
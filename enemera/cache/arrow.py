@@ -0,0 +1,139 @@
+"""
+On-disk response cache of memory-mapped Arrow IPC files.
+
+Each entry is stored as an Arrow IPC file (Feather v2) holding the rows,
+plus a small JSON file with the key, HTTP validators, ttl and model class.
+Loading an entry memory-maps the Arrow file instead of decoding JSON and
+validating models again, so a new process gets its cached responses back
+in microseconds, and processes on the same host share the cached pages
+through the operating system's page cache. Files are uncompressed unless a
+compression is chosen, since compressed buffers cannot be mapped as is.
+
+Entries are returned as ArrowResponse objects: to_pandas(), to_polars() and
+to_arrow() read the mapped table directly, and the rows are validated into
+models only when the response is used as a list.
+"""
+
+import hashlib
+import json
+import pathlib
+import threading
+from typing import Optional, Union
+
+from enemera.cache.base import CacheBackend, CacheEntry
+from enemera.cache.serialization import entry_from_table, entry_metadata, entry_table
+from enemera.core.exceptions import DependencyError
+from enemera.core.response import ArrowResponse
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        raise DependencyError("pyarrow", "cache responses as Arrow files",
+                              "pip install enemera[arrow]")
+    return pyarrow
+
+
+def _unlink(path: pathlib.Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class ArrowCache(CacheBackend):
+    """Response cache storing entries as memory-mapped Arrow IPC files.
+
+    Entries are only removed once they expire (see CacheEntry.ttl), or by
+    delete() and clear(). Several processes may share a directory: files are
+    written under a temporary name and renamed into place, so readers never
+    see a partial file.
+
+    Attributes:
+        directory: Directory holding the entries
+        compression: Buffer compression of new files, or None
+
+    Example:
+        >>> client = EnemeraClient(api_key="...", cache=ArrowCache("~/.cache/enemera"),
+        ...                        cache_max_age=3600)
+        >>> df = client.get(Curve.ITALY_PRICES, market="MGP", date_from="2024-01-01",
+        ...                 date_to="2024-12-31").to_pandas()
+    """
+
+    def __init__(self, directory: Union[str, pathlib.Path], compression: Optional[str] = None):
+        """Initialize a new ArrowCache.
+
+        Args:
+            directory: Directory holding the entries (created on first write)
+            compression: Buffer compression ("zstd" or "lz4"); compressed files
+                are several times smaller but are decompressed on every load
+                instead of being mapped without copying
+        """
+        self.directory = pathlib.Path(directory).expanduser()
+        self.compression = compression
+        self._lock = threading.Lock()
+
+    def _paths(self, key: str):
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}.arrow", self.directory / f"{name}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        if meta["key"] != key:
+            return None
+
+        pa = _import_pyarrow()
+        try:
+            source = pa.memory_map(str(data_path), "r")
+        except FileNotFoundError:
+            return None
+        table = pa.ipc.open_file(source).read_all()
+        entry = entry_from_table(table, meta, source=str(data_path))
+        if entry.expired:
+            self.delete(key)
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        from enemera.store.atomic import write_atomic
+
+        response = entry.response
+        data_path, meta_path = self._paths(key)
+        table, model_class = entry_table(entry)
+        # An entry loaded from here and revalidated: only its metadata changed
+        rewrite = not (isinstance(response, ArrowResponse) and response.source == str(data_path))
+        meta = dict(entry_metadata(entry, model_class), key=key)
+
+        def write_data(tmp):
+            pa = _import_pyarrow()
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            with pa.OSFile(str(tmp), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                    writer.write_table(table)
+
+        def write_meta(tmp):
+            with open(tmp, "w") as f:
+                json.dump(meta, f)
+
+        with self._lock:
+            if rewrite:
+                write_atomic(data_path, write_data)
+            write_atomic(meta_path, write_meta)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            for path in self._paths(key):
+                _unlink(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            for pattern in ("*.arrow", "*.json"):
+                for path in self.directory.glob(pattern):
+                    _unlink(path)
@@ -0,0 +1,114 @@
+"""
+Cache entries and the backend interface for cached API responses.
+
+A cache entry holds a parsed APIResponse together with the validators the API
+sent with it (ETag and Last-Modified). Once an entry is older than the
+client's cache max age it is revalidated with a conditional GET, and a 304
+Not Modified answer reuses the cached APIResponse without any JSON decoding
+or model validation.
+
+Backends only store and return entries; CachePolicy (enemera.cache.policy)
+decides how long an entry lives and whether it is final, per curve.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from enemera.core.response import APIResponse
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Build a cache key from an endpoint and its formatted query parameters.
+
+    Args:
+        endpoint: Endpoint path (e.g., "/italy/prices")
+        params: Query parameters as sent to the API
+
+    Returns:
+        str: Key that is identical for identical requests regardless of parameter order
+    """
+    query = urlencode(sorted((k, str(v)) for k, v in params.items() if v is not None))
+    return f"{endpoint}?{query}"
+
+
+class CacheEntry:
+    """A cached API response and its HTTP validators.
+
+    Attributes:
+        response: The parsed APIResponse
+        etag: ETag header sent with the response, if any
+        last_modified: Last-Modified header sent with the response, if any
+        stored_at: Time (seconds since the epoch) the entry was stored or last revalidated
+        ttl: Seconds after stored_at the entry expires (None keeps it until evicted)
+        final: Whether the data can no longer be revised, so the entry is
+            served without revalidation (see CachePolicy)
+    """
+
+    def __init__(self, response: APIResponse,
+                 etag: Optional[str] = None,
+                 last_modified: Optional[str] = None,
+                 stored_at: Optional[float] = None,
+                 ttl: Optional[float] = None,
+                 final: bool = False):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.time() if stored_at is None else stored_at
+        self.ttl = ttl
+        self.final = final
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored or last revalidated."""
+        return time.time() - self.stored_at
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Time (seconds since the epoch) the entry expires, or None."""
+        return None if self.ttl is None else self.stored_at + self.ttl
+
+    @property
+    def expired(self) -> bool:
+        """Whether the entry outlived its ttl."""
+        return self.ttl is not None and self.age >= self.ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the headers that turn a GET into a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self, headers) -> None:
+        """Mark the entry as fresh after a 304 Not Modified response.
+
+        Args:
+            headers: Headers of the 304 response, which may carry updated validators
+        """
+        self.stored_at = time.time()
+        self.etag = headers.get("ETag", self.etag)
+        self.last_modified = headers.get("Last-Modified", self.last_modified)
+
+
+class CacheBackend(ABC):
+    """Interface implemented by response cache backends."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under key, or None."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under key."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under key, if any."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
@@ -0,0 +1,61 @@
+"""
+In-process response cache.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from enemera.cache.base import CacheBackend, CacheEntry
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe least-recently-used cache of parsed responses.
+
+    Entries are kept as live objects, so hits cost nothing; expired entries
+    are dropped when they are looked up.
+
+    Attributes:
+        max_entries: Maximum number of responses kept before the least
+            recently used one is evicted
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize a new MemoryCache.
+
+        Args:
+            max_entries: Maximum number of responses kept
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expired:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
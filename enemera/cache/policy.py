@@ -0,0 +1,66 @@
+"""
+Per-curve lifetime and finality of cached responses.
+
+How long a response stays useful depends on the curve: day-ahead prices do
+not change once published, while imbalance data is revised for days. A
+CachePolicy gives every fresh cache entry a ttl for its curve, and marks
+entries whose data is final (every requested day is past the curve's
+revision window and no is_final_* flag is False). Final entries are served
+without revalidation and kept for final_ttl.
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional
+
+from enemera.cache.base import CacheEntry
+from enemera.models.curves import ENDPOINT_CURVES, Curve, is_final
+
+
+class CachePolicy:
+    """Decides the ttl and finality of cache entries per curve.
+
+    Attributes:
+        ttl: Seconds non-final entries of a curve are kept, per curve
+        default_ttl: ttl of curves missing from ttl (None keeps them until evicted)
+        final_ttl: ttl of final entries (None keeps them until evicted)
+
+    Example:
+        >>> policy = CachePolicy(ttl={Curve.ITALY_IMBALANCE_DATA: 300}, default_ttl=3600,
+        ...                      final_ttl=30 * 86400)
+        >>> client = EnemeraClient(api_key="...", cache=RedisCache("redis://cache:6379/0"),
+        ...                        cache_policy=policy)
+    """
+
+    def __init__(self, ttl: Optional[Dict[Curve, float]] = None,
+                 default_ttl: Optional[float] = None,
+                 final_ttl: Optional[float] = None):
+        """Initialize a new CachePolicy.
+
+        Args:
+            ttl: Seconds non-final entries are kept, per curve
+            default_ttl: ttl of other curves
+            final_ttl: ttl of final entries
+        """
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self.final_ttl = final_ttl
+
+    def apply(self, entry: CacheEntry, endpoint: str, params: Dict[str, Any]) -> None:
+        """Set the ttl and finality of a freshly fetched entry.
+
+        Args:
+            entry: The entry
+            endpoint: Endpoint the response came from
+            params: Formatted query parameters of the request
+        """
+        curve = ENDPOINT_CURVES.get(endpoint)
+        date_to = params.get('date_to')
+        entry.final = False
+        if curve is not None and date_to is not None:
+            flags = (value for item in entry.response for name, value in item.__dict__.items()
+                     if name.startswith("is_final"))
+            entry.final = is_final(curve, date.fromisoformat(str(date_to)), flags)
+        if entry.final:
+            entry.ttl = self.final_ttl
+        else:
+            entry.ttl = self.ttl.get(curve, self.default_ttl)
@@ -0,0 +1,109 @@
+"""
+Shared response cache on a Redis-compatible server.
+
+Workers pointing at the same server share one warm cache: a response fetched
+by any of them is served to all others, revalidated with a conditional GET
+once it is older than cache_max_age. Entries are stored as zstd-compressed
+Arrow IPC streams (see enemera.cache.serialization) and expire on the server
+according to their ttl, so the server needs no eviction policy of its own.
+
+Any server speaking the Redis protocol works (Redis, Valkey, KeyDB,
+Dragonfly), as does enemera.testing.StandInRedis for tests.
+"""
+
+from typing import Optional
+
+from enemera.cache.base import CacheBackend, CacheEntry
+from enemera.cache.serialization import dumps, loads
+from enemera.core.exceptions import DependencyError
+from enemera.utils.logging import logger
+
+
+def _import_redis():
+    try:
+        import redis
+    except ImportError:
+        raise DependencyError("redis", "share the response cache through Redis",
+                              "pip install enemera[redis]")
+    return redis
+
+
+class RedisCache(CacheBackend):
+    """Response cache stored on a Redis-compatible server.
+
+    The cache is an optimization: if the server cannot be reached, lookups
+    miss and writes are dropped (with a warning) instead of failing calls.
+
+    Attributes:
+        prefix: Prefix of every key written to the server
+        default_ttl: Seconds entries without a ttl are kept (None keeps them
+            until deleted)
+        compression: Buffer compression of stored entries
+
+    Example:
+        >>> cache = RedisCache("redis://cache.internal:6379/0", default_ttl=86400)
+        >>> client = EnemeraClient(api_key="...", cache=cache, cache_max_age=300)
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0",
+                 client=None,
+                 prefix: str = "enemera:cache:",
+                 default_ttl: Optional[float] = None,
+                 compression: Optional[str] = "zstd",
+                 **client_options):
+        """Initialize a new RedisCache.
+
+        Args:
+            url: Server URL, used unless a client is given
+            client: Existing redis.Redis (or compatible) client to share
+            prefix: Prefix of every key written to the server
+            default_ttl: Seconds entries without a ttl are kept
+            compression: Buffer compression ("zstd", "lz4" or None)
+            **client_options: Options passed to redis.Redis.from_url()
+                (e.g., socket_timeout=1)
+        """
+        self._redis = _import_redis()
+        self.client = client if client is not None else self._redis.Redis.from_url(
+            url, **client_options)
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.compression = compression
+
+    def _unavailable(self, action: str, error: Exception) -> None:
+        logger.warning(f"Redis cache unavailable, {action}", error=str(error))
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            data = self.client.get(self.prefix + key)
+        except self._redis.RedisError as e:
+            self._unavailable("treating lookup as a miss", e)
+            return None
+        return loads(data) if data is not None else None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ttl = entry.ttl if entry.ttl is not None else self.default_ttl
+        expires_in = None
+        if ttl is not None:
+            expires_in = int((ttl - entry.age) * 1000)
+            if expires_in <= 0:
+                return self.delete(key)
+        data = dumps(entry, self.compression)
+        try:
+            self.client.set(self.prefix + key, data, px=expires_in)
+        except self._redis.RedisError as e:
+            self._unavailable("entry not stored", e)
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self.prefix + key)
+        except self._redis.RedisError as e:
+            self._unavailable("entry not deleted", e)
+
+    def clear(self) -> None:
+        """Remove every entry under the prefix (other keys are left alone)."""
+        try:
+            keys = list(self.client.scan_iter(match=self.prefix + "*", count=500))
+            for start in range(0, len(keys), 500):
+                self.client.delete(*keys[start:start + 500])
+        except self._redis.RedisError as e:
+            self._unavailable("cache not cleared", e)
@@ -6,9 +6,11 @@ main entry point for interacting with the Enemera energy data API. It aggregates
 all specialized clients for different data types and markets.
 """
 
-from typing import Optional
-
-import pandas as pd
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Iterator, Optional, Union, TYPE_CHECKING
 
 from enemera.api import (
     ItalyPricesClient,
@@ -26,10 +28,23 @@ from enemera.api import (
     ItalyLoadActualClient, ItalyLoadForecastClient,
     SpainPricesClient, SpainXbidResultsClient, ItalyImbalanceDataPT60MClient
 )
-from enemera.api.base import BaseCurveClient
+from enemera.api.base import BaseCurveClient, DeferredResponse, deferred_parsing
 from enemera.core.constants import BASE_URL
+from enemera.core.deadline import Deadline, deadline as time_budget
 from enemera.core.response import APIResponse
 from enemera.models.curves import Curve
+from enemera.utils.utility_functions import date_chunks
+
+# Formats iter_chunks can yield chunks in
+CHUNK_OUTPUTS = ("response", "pandas", "pandas_cet", "polars", "arrow")
+
+# Settings read on every call; changing one on an EnemeraClient changes it
+# for its curve-specific clients too
+SHARED_SETTINGS = ("timeout", "cache", "cache_max_age", "cache_policy", "stale_while_revalidate",
+                   "stale_if_error", "parallel", "store", "hooks")
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class EnemeraClient(BaseCurveClient):
@@ -57,38 +72,59 @@ class EnemeraClient(BaseCurveClient):
         spain_xbid_results: Client for Spanish cross-border intraday results
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL, **kwargs):
         """Initialize a new EnemeraClient.
 
         Args:
             api_key: Optional API key for authentication. If not provided,
                 the client will attempt to use the ENEMERA_API_KEY environment variable.
+            base_url: API base URL (e.g., a local stand-in server or proxy)
+            **kwargs: Additional session options passed to BaseCurveClient
+                (e.g., timeout, use_secure_session)
         """
-        super().__init__(base_url=BASE_URL, api_key=api_key)
+        super().__init__(base_url=base_url, api_key=api_key, **kwargs)
+
+        # Curve-specific clients share this client's session, so the API key is
+        # validated once and connection pools, timeouts and retries are common.
+        # Without a secure session they still share its hooks; settings changed
+        # on this client later reach them through __setattr__.
+        kwargs['base_url'] = base_url
+        if self.use_secure_session:
+            kwargs['secure_session'] = self.secure_session
+        else:
+            kwargs['hooks'] = self.hooks
 
         # Initialize curve-specific clients
-        self.italy_prices = ItalyPricesClient(api_key)
-        self.italy_xbid_results = ItalyXbidResultsClient(api_key)
-        self.italy_exchange_volumes = ItalyExchangeVolumesClient(api_key)
-        self.italy_ancillary_services = ItalyAncillaryServicesResultsClient(
-            api_key)
-        self.italy_dam_demand_act = ItalyActDamDemandClient(api_key)
-        self.italy_dam_demand_fcs = ItalyFcsDamDemandClient(api_key)
+        self.italy_prices = ItalyPricesClient(api_key, **kwargs)
+        self.italy_xbid_results = ItalyXbidResultsClient(api_key, **kwargs)
+        self.italy_exchange_volumes = ItalyExchangeVolumesClient(api_key, **kwargs)
+        self.italy_ancillary_services = ItalyAncillaryServicesResultsClient(api_key, **kwargs)
+        self.italy_dam_demand_act = ItalyActDamDemandClient(api_key, **kwargs)
+        self.italy_dam_demand_fcs = ItalyFcsDamDemandClient(api_key, **kwargs)
+
+        self.italy_commercial_flows = ItalyCommercialFlowsClient(api_key, **kwargs)
+        self.italy_commercial_flow_limits = ItalyCommercialFlowLimitsClient(api_key, **kwargs)
 
-        self.italy_commercial_flows = ItalyCommercialFlowsClient(api_key)
-        self.italy_commercial_flow_limits = ItalyCommercialFlowLimitsClient(
-            api_key)
+        self.italy_load_actual = ItalyLoadActualClient(api_key, **kwargs)
+        self.italy_load_forecast = ItalyLoadForecastClient(api_key, **kwargs)
 
-        self.italy_load_actual = ItalyLoadActualClient(api_key)
-        self.italy_load_forecast = ItalyLoadForecastClient(api_key)
+        self.italy_generation = ItalyGenerationClient(api_key, **kwargs)
+        self.italy_generation_forecast = ItalyGenerationForecastClient(api_key, **kwargs)
+        self.italy_imbalance_data = ItalyImbalanceDataClient(api_key, **kwargs)
+        self.italy_imbalance_data_pt60m = ItalyImbalanceDataPT60MClient(api_key, **kwargs)
 
-        self.italy_generation = ItalyGenerationClient(api_key)
-        self.italy_generation_forecast = ItalyGenerationForecastClient(api_key)
-        self.italy_imbalance_data = ItalyImbalanceDataClient(api_key)
-        self.italy_imbalance_data_pt60m = ItalyImbalanceDataPT60MClient(api_key)
+        self.spain_prices = SpainPricesClient(api_key, **kwargs)
+        self.spain_xbid_results = SpainXbidResultsClient(api_key, **kwargs)
 
-        self.spain_prices = SpainPricesClient(api_key)
-        self.spain_xbid_results = SpainXbidResultsClient(api_key)
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in SHARED_SETTINGS:
+            for client in self._curve_clients():
+                setattr(client, name, value)
+
+    def _curve_clients(self) -> Iterator[BaseCurveClient]:
+        """Yield the curve-specific clients created so far"""
+        return (value for value in vars(self).values() if isinstance(value, BaseCurveClient))
 
     def get(self, curve: Curve, **kwargs) -> APIResponse:
         """Get data for a specific curve.
@@ -117,6 +153,16 @@ class EnemeraClient(BaseCurveClient):
             ...     date_to="2023-01-31"
             ... )
         """
+        return self.curve_method(curve)(**kwargs)
+
+    def curve_method(self, curve: Curve):
+        """Return the get method of the specialized client serving a curve.
+
+        Its signature lists the filters the curve accepts besides the dates.
+
+        Raises:
+            ValueError: If the specified curve is not supported
+        """
         curve_mapping = {
             Curve.ITALY_PRICES: self.italy_prices.get,
             Curve.ITALY_XBID_RESULTS: self.italy_xbid_results.get,
@@ -144,9 +190,9 @@ class EnemeraClient(BaseCurveClient):
         if curve not in curve_mapping:
             raise ValueError(f"Unsupported curve: {curve}")
 
-        return curve_mapping[curve](**kwargs)
+        return curve_mapping[curve]
 
-    def get_pandas(self, curve: Curve, index_col: str = 'utc', naive_datetime: bool = False, **kwargs) -> pd.DataFrame:
+    def get_pandas(self, curve: Curve, index_col: str = 'utc', naive_datetime: bool = False, **kwargs) -> 'pd.DataFrame':
         """
         Get data as pandas DataFrame
 
@@ -162,7 +208,7 @@ class EnemeraClient(BaseCurveClient):
         response = self.get(curve, **kwargs)
         return response.to_pandas(index_col=index_col, naive_datetime=naive_datetime)
 
-    def get_pandas_cet(self, curve: Curve, naive_datetime: bool = False, **kwargs) -> pd.DataFrame:
+    def get_pandas_cet(self, curve: Curve, naive_datetime: bool = False, **kwargs) -> 'pd.DataFrame':
         """
         Get data as pandas DataFrame with timestamps converted to CET timezone
 
@@ -176,3 +222,188 @@ class EnemeraClient(BaseCurveClient):
         """
         response = self.get(curve, **kwargs)
         return response.to_pandas_cet(naive_datetime=naive_datetime)
+
+    def iter_chunks(self, curve: Curve,
+                    date_from: Union[str, datetime, date],
+                    date_to: Union[str, datetime, date],
+                    step_days: int = 30,
+                    output: str = "response",
+                    prefetch: int = 2,
+                    deadline: Optional[float] = None,
+                    pipeline: bool = False,
+                    **kwargs) -> Iterator[Any]:
+        """
+        Download a long period chunk by chunk, yielding each chunk as it lands
+
+        While the caller processes one chunk, up to `prefetch` following chunks
+        are downloaded (and converted) in background threads. At most
+        prefetch + 1 chunks are held in memory, so multi-year ranges can be
+        consumed with constant memory. Chunks are yielded in date order.
+
+        With pipeline=True, chunks are instead downloaded one at a time over a
+        single connection, while a second thread decodes, validates and
+        converts the previous chunk. Use it with rate-limited keys, where
+        concurrent downloads would only be throttled.
+
+        Args:
+            curve: The curve to query
+            date_from: First delivery date of the period
+            date_to: Last delivery date of the period (inclusive)
+            step_days: Number of days per chunk
+            output: Format of each chunk: "response" (APIResponse), "pandas",
+                "pandas_cet", "polars" or "arrow" (pyarrow Table)
+            prefetch: Number of chunks downloaded ahead of the consumer
+                (0 downloads each chunk only when it is requested)
+            deadline: Optional overall time budget in seconds for all chunks
+            pipeline: Overlap sequential downloads with parsing instead of
+                downloading several chunks at once
+            **kwargs: Additional parameters to pass to the API (e.g., market, area)
+
+        Yields:
+            One chunk of data per step_days days, in the requested format
+
+        Raises:
+            ValueError: If output is unknown or the dates are invalid
+
+        Example:
+            >>> for df in client.iter_chunks(Curve.ITALY_IMBALANCE_DATA, "2015-01-01",
+            ...                              "2024-12-31", output="pandas"):
+            ...     df.to_parquet(f"imbalance_{df.index[0]:%Y%m%d}.parquet")
+        """
+        if output not in CHUNK_OUTPUTS:
+            raise ValueError(
+                f"Invalid output: {output}. Available outputs: {', '.join(CHUNK_OUTPUTS)}")
+        start = datetime.strptime(self._format_date(date_from), '%Y-%m-%d').date()
+        end = datetime.strptime(self._format_date(date_to), '%Y-%m-%d').date()
+        if end < start:
+            raise ValueError(f"date_to ({end}) cannot be before date_from ({start})")
+
+        # The budget starts now and is applied to each chunk's request, not to
+        # what the caller does between chunks
+        budget = Deadline(deadline) if deadline is not None else None
+        chunks = date_chunks(start, end, step_days)
+        if pipeline:
+            yield from self._iter_pipelined(curve, chunks, output, max(1, prefetch), kwargs, budget)
+            return
+        if prefetch <= 0:
+            for chunk_start, chunk_end in chunks:
+                yield self._get_chunk(curve, chunk_start, chunk_end, output, kwargs, budget)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="enemera-prefetch")
+        pending = deque()
+        try:
+            for chunk_start, chunk_end in chunks:
+                # Each download runs in a copy of this context, so a deadline
+                # active around the loop also applies in the background threads
+                pending.append(executor.submit(
+                    contextvars.copy_context().run, self._get_chunk,
+                    curve, chunk_start, chunk_end, output, kwargs, budget))
+                if len(pending) > prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer stopped early or a chunk failed: drop the lookahead
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_pipelined(self, curve: Curve, chunks: Iterator, output: str, in_flight: int,
+                        params: dict, budget: Optional[Deadline]) -> Iterator[Any]:
+        """Run downloads and parsing as two stages on their own threads
+
+        The download stage only fetches responses (see deferred_parsing), the
+        parse stage turns them into the requested output, in order. At most
+        in_flight chunks are between the two stages and the consumer.
+        """
+        downloads = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enemera-download")
+        parses = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enemera-parse")
+        pending = deque()
+        try:
+            for chunk_start, chunk_end in chunks:
+                download = downloads.submit(contextvars.copy_context().run, self._download_chunk,
+                                            curve, chunk_start, chunk_end, params, budget)
+                parse = parses.submit(self._parse_chunk, download, output)
+                pending.append((download, parse))
+                if len(pending) > in_flight:
+                    yield pending.popleft()[1].result()
+            while pending:
+                yield pending.popleft()[1].result()
+        finally:
+            for download, parse in pending:
+                parse.cancel()
+                download.cancel()
+            downloads.shutdown(wait=False)
+            parses.shutdown(wait=False)
+
+    def _download_chunk(self, curve: Curve, chunk_start: date, chunk_end: date,
+                        params: dict, budget: Optional[Deadline]) -> DeferredResponse:
+        """Download one chunk without parsing it"""
+        with deferred_parsing():
+            return self._request_chunk(curve, chunk_start, chunk_end, params, budget)
+
+    @staticmethod
+    def _parse_chunk(download, output: str) -> Any:
+        """Parse a downloaded chunk and convert it to the requested output format"""
+        response = download.result().parse()
+        if output == "response":
+            return response
+        return getattr(response, "to_" + output)()
+
+    def _request_chunk(self, curve: Curve, chunk_start: date, chunk_end: date, params: dict,
+                       budget: Optional[Deadline] = None):
+        """Request one chunk, within the remaining time budget if there is one"""
+        if budget is None:
+            return self.get(curve, date_from=chunk_start, date_to=chunk_end, **params)
+        budget.check()
+        with time_budget(budget.remaining()):
+            return self.get(curve, date_from=chunk_start, date_to=chunk_end, **params)
+
+    def _get_chunk(self, curve: Curve, chunk_start: date, chunk_end: date, output: str,
+                   params: dict, budget: Optional[Deadline] = None) -> Any:
+        """Download one chunk and convert it to the requested output format"""
+        response = self._request_chunk(curve, chunk_start, chunk_end, params, budget)
+        if output == "response":
+            return response
+        return getattr(response, "to_" + output)()
+
+    def sync(self, curve: Curve, store_path: Optional[str] = None,
+             date_from: Union[str, datetime, date, None] = None,
+             date_to: Union[str, datetime, date, None] = None,
+             step_days: int = 30,
+             **filters) -> dict:
+        """
+        Keep a local Parquet copy of a curve up to date
+
+        Only the days missing from the store, or not final yet, are requested.
+        See enemera.store.ParquetStore for the layout.
+
+        Args:
+            curve: The curve to sync
+            store_path: Root directory of the local store (defaults to the
+                store the client was created with)
+            date_from: First delivery day to keep locally
+            date_to: Last delivery day (defaults to tomorrow)
+            step_days: Maximum number of days per request
+            **filters: Curve filters (e.g., market="MGP", area="NORD")
+
+        Returns:
+            dict: Counts of fetched and skipped days, rows and files written
+
+        Example:
+            >>> client.sync(Curve.ITALY_PRICES, "~/enemera-data", "2015-01-01", market="MGP")
+        """
+        from enemera.store import ParquetStore
+        if date_from is None:
+            raise ValueError("date_from is required")
+        store = self.store
+        if store_path is not None:
+            requested = ParquetStore(store_path)
+            if store is None:
+                store = requested
+            elif requested.root != store.root:
+                raise ValueError("The client already writes to another store")
+        if store is None:
+            raise ValueError("store_path is required for a client without a store")
+        return store.sync(self, curve, date_from, date_to, step_days=step_days, **filters)
@@ -0,0 +1,212 @@
+"""
+Circuit breaker for the Enemera API client.
+
+When the API degrades, every call waits out the transport's retries with
+backoff before failing. A circuit breaker counts consecutive failures per
+endpoint (connection errors, timeouts and 5xx answers); once they reach a
+threshold the endpoint's circuit opens and calls fail immediately with
+CircuitOpenError instead of hanging. After reset_timeout seconds the circuit
+is half-open: a single probe request is let through, closing the circuit if
+it succeeds and opening it again if it fails.
+
+    closed --(failure_threshold failures)--> open --(reset_timeout)--> half_open
+    half_open --(probe succeeds)--> closed
+    half_open --(probe fails)--> open
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from enemera.core.exceptions import APIError, CircuitOpenError, ConnectionError, RetryError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Numeric value of each state, e.g., for a gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def is_failure(error: BaseException) -> bool:
+    """Return whether an error means the API is unavailable rather than the request wrong.
+
+    Connection errors, timeouts and 5xx answers count, as do exhausted
+    retries unless their last answer was a 429; client errors (4xx,
+    including 429 rate limiting) do not.
+    """
+    if isinstance(error, ConnectionError):
+        return True
+    if isinstance(error, RetryError):
+        return error.status_code is None or error.status_code >= 500
+    return isinstance(error, APIError) and error.status_code >= 500
+
+
+class _Circuit:
+    """State of one endpoint's circuit"""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.opened = 0
+        self.rejected = 0
+        self.changed_at = time.time()
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker keeping one circuit per endpoint.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open a circuit
+        reset_timeout: Seconds an open circuit rejects calls before a probe
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        >>> client = EnemeraClient(api_key="...", breaker=breaker)
+        >>> breaker.snapshot()["/italy/prices"]["state"]
+        'closed'
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize a new CircuitBreaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds an open circuit rejects calls before a probe
+
+        Raises:
+            ValueError: If failure_threshold is less than 1
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit()
+        return circuit
+
+    @staticmethod
+    def _set_state(circuit: _Circuit, state: str) -> Optional[Tuple[str, str]]:
+        previous = circuit.state
+        if previous == state:
+            return None
+        circuit.state = state
+        circuit.changed_at = time.time()
+        if state == OPEN:
+            circuit.opened += 1
+            circuit.opened_at = time.monotonic()
+        return previous, state
+
+    def before_request(self, endpoint: str) -> Optional[Tuple[str, str]]:
+        """Let a request through or reject it.
+
+        Every request let through must be followed by record_success(),
+        record_failure() or, if it ended without an outcome, release().
+
+        Returns:
+            (previous, new) state if the circuit changed state, else None
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                probe already in flight
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            change = None
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.reset_timeout - time.monotonic()
+                if retry_in <= 0:
+                    change = self._set_state(circuit, HALF_OPEN)
+                else:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(endpoint, retry_in)
+            if circuit.state == HALF_OPEN:
+                if circuit.probing:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(endpoint, 0.0)
+                circuit.probing = True
+            return change
+
+    def record_success(self, endpoint: str) -> Optional[Tuple[str, str]]:
+        """Record a request the API answered, closing a half-open circuit.
+
+        Returns:
+            (previous, new) state if the circuit changed state, else None
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.failures = 0
+            circuit.probing = False
+            return self._set_state(circuit, CLOSED)
+
+    def record_failure(self, endpoint: str) -> Optional[Tuple[str, str]]:
+        """Record a failed request, opening the circuit at the threshold.
+
+        Returns:
+            (previous, new) state if the circuit changed state, else None
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.probing = False
+                change = self._set_state(circuit, OPEN)
+                # A failed probe restarts the wait before the next one
+                circuit.opened_at = time.monotonic()
+                return change
+            return None
+
+    def release(self, endpoint: str) -> None:
+        """Forget a request that ended without an outcome, e.g., interrupted.
+
+        A half-open circuit lets the next call probe instead of rejecting
+        calls until the process restarts.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None:
+                circuit.probing = False
+
+    def state(self, endpoint: str) -> str:
+        """Return the state of an endpoint's circuit ("closed", "open" or "half_open")."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CLOSED
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """Close one circuit, or all of them, and forget their counters."""
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state and counters of every circuit, per endpoint.
+
+        Each entry holds the state, consecutive failures, how often the
+        circuit opened, how many calls it rejected, when it last changed
+        state (seconds since the epoch) and, when open, the seconds left
+        before the next probe.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                endpoint: {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "opened": circuit.opened,
+                    "rejected": circuit.rejected,
+                    "changed_at": circuit.changed_at,
+                    "retry_in": max(0.0, circuit.opened_at + self.reset_timeout - now)
+                    if circuit.state == OPEN else 0.0,
+                }
+                for endpoint, circuit in self._circuits.items()
+            }
@@ -0,0 +1,253 @@
+"""
+HTTP compression support for the Enemera API client.
+
+Price and imbalance JSON compresses very well, so the client advertises every
+content encoding it can decode (gzip and deflate always, brotli and zstd when
+the optional libraries are installed), decodes response bodies itself while
+streaming them, and keeps per-endpoint counters of bytes received on the wire
+versus decoded bytes so the bandwidth saved can be measured.
+"""
+
+import threading
+import zlib
+from typing import Any, Dict, List, Optional
+
+from enemera.core.exceptions import DependencyError, EnemeraError
+
+
+def _load_brotli():
+    """Return the installed brotli module, or None"""
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        pass
+    try:
+        import brotlicffi
+        return brotlicffi
+    except ImportError:
+        return None
+
+
+def _load_zstandard():
+    """Return the installed zstandard module, or None"""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def supported_encodings() -> List[str]:
+    """Return the content encodings this client can decode, in preference order.
+
+    Returns:
+        List of encodings, e.g. ["zstd", "br", "gzip", "deflate"]
+    """
+    encodings = []
+    if _load_zstandard() is not None:
+        encodings.append("zstd")
+    if _load_brotli() is not None:
+        encodings.append("br")
+    encodings.extend(["gzip", "deflate"])
+    return encodings
+
+
+def accept_encoding_header() -> str:
+    """Return the Accept-Encoding header value for the supported encodings."""
+    return ", ".join(supported_encodings())
+
+
+class _ZlibDecoder:
+    """Incremental gzip/deflate decoder"""
+
+    def __init__(self, encoding: str):
+        self._gzip = encoding == "gzip"
+        self._first = True
+        self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS if self._gzip else zlib.MAX_WBITS)
+
+    def decompress(self, data: bytes) -> bytes:
+        if not self._first:
+            return self._obj.decompress(data)
+        self._first = False
+        try:
+            return self._obj.decompress(data)
+        except zlib.error:
+            if self._gzip:
+                raise
+            # Some servers send raw deflate streams without the zlib header
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliDecoder:
+    """Incremental brotli decoder"""
+
+    def __init__(self, brotli):
+        self._obj = brotli.Decompressor()
+        self._process = getattr(self._obj, "process", None) or self._obj.decompress
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._process(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _ZstdDecoder:
+    """Incremental zstd decoder"""
+
+    def __init__(self, zstandard):
+        self._zstandard = zstandard
+        self._obj = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        output = []
+        while data:
+            output.append(self._obj.decompress(data))
+            # A body may hold several zstd frames; start a new one after each
+            data = self._obj.unused_data
+            if data:
+                self._obj = self._zstandard.ZstdDecompressor().decompressobj()
+        return b"".join(output)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class StreamDecoder:
+    """Incremental decoder for a (possibly multi-layer) Content-Encoding.
+
+    Attributes:
+        encodings: Content encodings applied by the server, in order
+    """
+
+    def __init__(self, content_encoding: Optional[str]):
+        """Initialize a new StreamDecoder.
+
+        Args:
+            content_encoding: Value of the Content-Encoding response header
+
+        Raises:
+            DependencyError: If the body uses brotli or zstd and the library is missing
+            EnemeraError: If the encoding is not supported at all
+        """
+        self.encodings = [
+            e.strip().lower() for e in (content_encoding or "").split(",")
+            if e.strip() and e.strip().lower() != "identity"
+        ]
+        # Encodings are listed in the order they were applied, so undo them in reverse
+        self._decoders = [self._make_decoder(e) for e in reversed(self.encodings)]
+
+    @staticmethod
+    def _make_decoder(encoding: str):
+        if encoding in ("gzip", "x-gzip"):
+            return _ZlibDecoder("gzip")
+        if encoding == "deflate":
+            return _ZlibDecoder("deflate")
+        if encoding == "br":
+            brotli = _load_brotli()
+            if brotli is None:
+                raise DependencyError("brotli", "decode brotli-compressed responses",
+                                      "pip install enemera[compression]")
+            return _BrotliDecoder(brotli)
+        if encoding == "zstd":
+            zstandard = _load_zstandard()
+            if zstandard is None:
+                raise DependencyError("zstandard", "decode zstd-compressed responses",
+                                      "pip install enemera[compression]")
+            return _ZstdDecoder(zstandard)
+        raise EnemeraError(f"Unsupported response content encoding: {encoding}")
+
+    @property
+    def encoding(self) -> str:
+        """The Content-Encoding of the body, or "identity" if uncompressed."""
+        return ",".join(self.encodings) or "identity"
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decode the next chunk of the body."""
+        for decoder in self._decoders:
+            data = decoder.decompress(data)
+        return data
+
+    def flush(self) -> bytes:
+        """Return any data still buffered once the body is complete."""
+        data = b""
+        for decoder in self._decoders:
+            data = decoder.decompress(data) + decoder.flush()
+        return data
+
+
+class TransferStats:
+    """Thread-safe per-endpoint counters of wire bytes versus decoded bytes.
+
+    Example:
+        >>> stats = client.transfer_stats.snapshot()
+        >>> stats["/italy/prices"]["compression_ratio"]
+        9.7
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, endpoint: str, wire_bytes: int, decoded_bytes: int,
+               encoding: str = "identity") -> None:
+        """Record one response body.
+
+        Args:
+            endpoint: Endpoint path (e.g., "/italy/prices")
+            wire_bytes: Body size as received from the network
+            decoded_bytes: Body size after decompression
+            encoding: Content encoding of the body
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                "responses": 0,
+                "compressed_responses": 0,
+                "wire_bytes": 0,
+                "decoded_bytes": 0,
+                "encodings": {}
+            })
+            stats["responses"] += 1
+            if encoding != "identity":
+                stats["compressed_responses"] += 1
+            stats["wire_bytes"] += wire_bytes
+            stats["decoded_bytes"] += decoded_bytes
+            stats["encodings"][encoding] = stats["encodings"].get(encoding, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of the counters per endpoint, with derived ratios."""
+        with self._lock:
+            result = {}
+            for endpoint, stats in self._endpoints.items():
+                entry = dict(stats, encodings=dict(stats["encodings"]))
+                entry["saved_bytes"] = stats["decoded_bytes"] - stats["wire_bytes"]
+                entry["compression_ratio"] = (
+                    stats["decoded_bytes"] / stats["wire_bytes"] if stats["wire_bytes"] else None
+                )
+                result[endpoint] = entry
+            return result
+
+    def totals(self) -> Dict[str, Any]:
+        """Return the counters summed over all endpoints."""
+        snapshot = self.snapshot()
+        wire = sum(s["wire_bytes"] for s in snapshot.values())
+        decoded = sum(s["decoded_bytes"] for s in snapshot.values())
+        return {
+            "responses": sum(s["responses"] for s in snapshot.values()),
+            "compressed_responses": sum(s["compressed_responses"] for s in snapshot.values()),
+            "wire_bytes": wire,
+            "decoded_bytes": decoded,
+            "saved_bytes": decoded - wire,
+            "compression_ratio": decoded / wire if wire else None
+        }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,120 @@
+"""
+Deadline propagation for the Enemera API client.
+
+A deadline gives a group of calls (for example every chunk of a long-period
+download, or several curves fetched one after the other) a single overall
+time budget. While a deadline is active, every HTTP request gets a timeout
+capped by the remaining budget, retries stop as soon as the budget is spent,
+and new requests fail fast with TimeoutError once it has run out.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+from enemera.core.exceptions import TimeoutError
+
+TimeoutValue = Union[float, Tuple[float, float]]
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar(
+    "enemera_deadline", default=None)
+
+
+class Deadline:
+    """An absolute point in time by which a group of requests must complete.
+
+    Attributes:
+        seconds: The total time budget in seconds
+        expires_at: The monotonic clock value at which the budget runs out
+    """
+
+    def __init__(self, seconds: float):
+        """Initialize a new Deadline.
+
+        Args:
+            seconds: Total time budget in seconds, starting now
+
+        Raises:
+            ValueError: If seconds is not a positive number
+        """
+        if seconds is None or seconds <= 0:
+            raise ValueError("Deadline must be a positive number of seconds")
+
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Return the remaining budget in seconds (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the time budget has been used up."""
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """Raise TimeoutError if the time budget has been used up."""
+        if self.expired:
+            raise TimeoutError(
+                f"Deadline of {self.seconds}s exceeded",
+                timeout_value=self.seconds
+            )
+
+    def cap_timeout(self, timeout: Optional[TimeoutValue]) -> TimeoutValue:
+        """Cap a requests-style timeout by the remaining budget.
+
+        Args:
+            timeout: A single timeout or a (connect, read) tuple, or None
+
+        Returns:
+            The timeout with every component limited to the remaining budget
+        """
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return (
+                remaining if connect is None else min(connect, remaining),
+                remaining if read is None else min(read, remaining)
+            )
+        return min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(seconds={self.seconds}, remaining={self.remaining():.3f})"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline active in the current context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """Run the enclosed calls under one overall time budget.
+
+    Nested deadlines never extend an enclosing one: the inner block gets
+    whichever budget runs out first.
+
+    Args:
+        seconds: Total time budget in seconds for the enclosed block
+
+    Yields:
+        Deadline: The deadline in effect inside the block
+
+    Example:
+        >>> with deadline(60):
+        ...     prices = client.get(Curve.ITALY_PRICES, market="MGP", ...)
+        ...     load = client.get(Curve.ITALY_LOAD_ACTUAL, ...)
+    """
+    new_deadline = Deadline(seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at < new_deadline.expires_at:
+        new_deadline = outer
+
+    token = _current_deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _current_deadline.reset(token)
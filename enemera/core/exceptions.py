@@ -5,6 +5,7 @@ This module defines a hierarchy of exception classes used throughout the Enemera
 All exceptions inherit from the base EnemeraError class, providing consistent
 error handling and reporting.
 """
+import builtins
 from typing import Optional, Dict, Any, Union
 
 
@@ -135,8 +136,11 @@ class ValidationError(EnemeraError):
         super().__init__(message, errors=errors, **kwargs)
 
 
-class ConnectionError(EnemeraError):
-    """Raised when connection to the API fails."""
+class ConnectionError(EnemeraError, builtins.ConnectionError):
+    """Raised when connection to the API fails.
+
+    Also a builtin ConnectionError, so code catching that keeps working.
+    """
 
     def __init__(
         self,
@@ -166,22 +170,51 @@ class TimeoutError(ConnectionError):
         super().__init__(message, timeout_value=timeout_value, **kwargs)
 
 
+class CircuitOpenError(ConnectionError):
+    """Raised without sending a request while an endpoint's circuit breaker is open.
+
+    Attributes:
+        endpoint: Endpoint path whose circuit is open
+        retry_in: Seconds until the breaker lets a probe request through
+    """
+
+    def __init__(self, endpoint: str, retry_in: float = 0.0, **kwargs):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for {endpoint} after repeated failures, "
+            f"next attempt in {retry_in:.1f}s",
+            endpoint=endpoint,
+            retry_in=retry_in,
+            **kwargs
+        )
+
+
 class RetryError(EnemeraError):
-    """Raised when all retry attempts fail."""
+    """Raised when all retry attempts fail.
+
+    Attributes:
+        attempts: Number of attempts made
+        last_exception: The error of the last attempt
+        status_code: HTTP status of the last attempt, if it got a response
+    """
 
     def __init__(
         self,
         message: str = "All retry attempts failed",
         attempts: int = 0,
         last_exception: Optional[Exception] = None,
+        status_code: Optional[int] = None,
         **kwargs
     ):
         self.attempts = attempts
         self.last_exception = last_exception
+        self.status_code = status_code
         super().__init__(
             message,
             attempts=attempts,
             last_exception=str(last_exception) if last_exception else None,
+            status_code=status_code,
             **kwargs
         )
 
@@ -0,0 +1,169 @@
+"""
+Hedged requests for the Enemera API client.
+
+Tail latency of small interactive queries is dominated by the occasional slow
+response rather than by the median. A hedging policy sends a second, identical
+GET when the first one has not completed within a given percentile of the
+recent latency observed for the same endpoint, and uses whichever response
+arrives first. A token budget caps the extra load hedging may generate.
+"""
+
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of recent request latencies per endpoint.
+
+    Attributes:
+        window: Number of most recent latencies kept per endpoint
+    """
+
+    def __init__(self, window: int = 200):
+        """Initialize a new LatencyTracker.
+
+        Args:
+            window: Number of most recent latencies kept per endpoint
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._samples[endpoint].append(seconds)
+
+    def keys(self) -> List[str]:
+        """Return the endpoints (or other keys) latencies were recorded for."""
+        with self._lock:
+            return list(self._samples)
+
+    def clear(self) -> None:
+        """Forget all recorded latencies."""
+        with self._lock:
+            self._samples.clear()
+
+    def count(self, endpoint: str) -> int:
+        """Return the number of latencies currently kept for an endpoint."""
+        with self._lock:
+            return len(self._samples.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, pct: float) -> Optional[float]:
+        """Return the given percentile of recent latency for an endpoint.
+
+        Args:
+            endpoint: Endpoint path (e.g., "/italy/prices")
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if no samples were recorded yet
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if not samples:
+            return None
+        # Nearest-rank percentile
+        rank = max(1, int(round(pct / 100.0 * len(samples))))
+        return samples[min(rank, len(samples)) - 1]
+
+
+class HedgingPolicy:
+    """Policy deciding when a GET request is hedged with a duplicate.
+
+    The hedge delay for an endpoint is the configured percentile of its recent
+    latency, never less than min_delay. Each request earns `budget` tokens (up
+    to max_tokens) and each hedge spends one, so in steady state at most a
+    `budget` fraction of requests is duplicated.
+
+    Attributes:
+        percentile: Latency percentile after which a hedge is sent
+        min_delay: Lower bound on the hedge delay in seconds
+        budget: Fraction of extra requests hedging may add (e.g., 0.05 = 5%)
+        max_tokens: Maximum number of hedges that can be sent in a burst
+        min_samples: Latencies required for an endpoint before hedging starts
+        max_workers: Maximum number of threads used to run hedged requests
+        latencies: Rolling latency statistics per endpoint
+    """
+
+    def __init__(self,
+                 percentile: float = 95.0,
+                 min_delay: float = 0.05,
+                 budget: float = 0.05,
+                 max_tokens: float = 10.0,
+                 window: int = 200,
+                 min_samples: int = 20,
+                 max_workers: int = 8):
+        """Initialize a new HedgingPolicy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            min_delay: Lower bound on the hedge delay in seconds
+            budget: Fraction of extra requests hedging may add
+            max_tokens: Maximum number of hedges that can be sent in a burst
+            window: Number of recent latencies kept per endpoint
+            min_samples: Latencies required for an endpoint before hedging starts
+            max_workers: Maximum number of threads used to run hedged requests
+
+        Raises:
+            ValueError: If percentile or budget are out of range
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.latencies = LatencyTracker(window)
+
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Return how long to wait before hedging a request to an endpoint.
+
+        Returns:
+            Delay in seconds, or None if there is not enough latency history
+        """
+        if self.latencies.count(endpoint) < self.min_samples:
+            return None
+        delay = self.latencies.percentile(endpoint, self.percentile)
+        return max(self.min_delay, delay)
+
+    def record_request(self) -> None:
+        """Account for a new request, earning budget for future hedges."""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+    def try_acquire(self) -> bool:
+        """Spend budget for one hedge, returning False if none is left."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def record_hedge_win(self) -> None:
+        """Account for a hedge that completed before the original request."""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return request, hedge and hedge-win counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins
+            }
@@ -0,0 +1,293 @@
+"""
+Request lifecycle hooks for the Enemera API client.
+
+Every call to a curve client produces one RequestEvent that travels through
+the request path and collects a timing breakdown (connect, wait, download,
+decompress, JSON decode, validation, DataFrame conversion), byte sizes, row
+counts and retries. Hooks registered on a client are notified as the event
+progresses:
+
+    on_request_start(event)       before anything is sent
+    on_retry(event, info)         before a retry of a failed attempt
+    on_response(event)            once the response (and its body) arrived
+    on_parsed(event)              once the body was turned into models
+    on_converted(event, info)     after each DataFrame conversion of the result
+    on_error(event, error)        when the call fails
+    on_breaker(event, info)       when the call changed the state of a circuit breaker
+
+StatsCollector is a built-in hook aggregating these figures per endpoint.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from urllib.parse import urlsplit
+
+from enemera.models.curves import ENDPOINT_CURVES
+from enemera.utils.logging import logger
+
+# Stages of the timing breakdown, in the order they happen
+STAGES = ("connect", "wait", "download", "decompress", "json_decode", "validate", "convert")
+
+HOOK_EVENTS = ("on_request_start", "on_retry", "on_response", "on_parsed",
+               "on_converted", "on_error", "on_breaker")
+
+_current_event: ContextVar[Optional["RequestEvent"]] = ContextVar(
+    "enemera_request_event", default=None)
+
+
+class RequestEvent:
+    """Measurements of one client call, shared with every hook.
+
+    Attributes:
+        method: HTTP method
+        endpoint: Endpoint path (e.g., "/italy/prices")
+        params: Query parameters
+        timings: Seconds spent per stage (see STAGES); missing stages were skipped
+        status_code: HTTP status of the final response, if one was received
+        wire_bytes: Body size as received from the network
+        decoded_bytes: Body size after decompression
+        rows: Number of parsed rows
+        retries: Number of retried attempts
+        cache: "miss", "hit" (served without a request), "revalidated" (304) or
+            "stale" (an outdated cached response, see stale_while_revalidate)
+        error: The exception the call failed with, if any
+        started_at: Wall clock time (seconds since the epoch) the call started
+        extra: Scratch space for hooks to keep per-call state (e.g., open spans)
+    """
+
+    def __init__(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                 hooks: Optional["HookManager"] = None):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.params = params or {}
+        self.timings: Dict[str, float] = {}
+        self.status_code: Optional[int] = None
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.rows: Optional[int] = None
+        self.retries = 0
+        self.cache = "miss"
+        self.error: Optional[BaseException] = None
+        self.started_at = time.time()
+        self.extra: Dict[str, Any] = {}
+        self._start = time.perf_counter()
+        self._hooks = hooks
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                 hooks: Optional["HookManager"] = None) -> "RequestEvent":
+        """Create an event for an absolute request URL."""
+        return cls(method, urlsplit(url).path, params, hooks)
+
+    def emit(self, name: str, *args) -> None:
+        """Notify the hooks of the client that created this event."""
+        if self._hooks:
+            self._hooks.emit(name, self, *args)
+
+    def add_timing(self, stage: str, seconds: float) -> None:
+        """Add time spent in a stage (stages can accumulate over retries)."""
+        with self._lock:
+            self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the call started."""
+        return time.perf_counter() - self._start
+
+    @property
+    def curve(self) -> str:
+        """Value of the curve served at the endpoint, or the endpoint itself."""
+        curve = ENDPOINT_CURVES.get(self.endpoint)
+        return curve.value if curve is not None else self.endpoint
+
+    def __repr__(self) -> str:
+        stages = ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in self.timings.items())
+        return (f"RequestEvent({self.method} {self.endpoint}, status={self.status_code}, "
+                f"rows={self.rows}, {stages})")
+
+
+def current_event() -> Optional[RequestEvent]:
+    """Return the event of the call running in the current context, if any."""
+    return _current_event.get()
+
+
+@contextmanager
+def track(event: RequestEvent) -> Iterator[RequestEvent]:
+    """Make an event the current one while the enclosed call runs."""
+    token = _current_event.set(event)
+    try:
+        yield event
+    finally:
+        _current_event.reset(token)
+
+
+class RequestHook:
+    """Base class for hooks; override the methods of the events you need.
+
+    Example:
+        >>> class PrintSlow(RequestHook):
+        ...     def on_parsed(self, event):
+        ...         if event.elapsed > 1:
+        ...             print(event)
+        >>> client.hooks.add(PrintSlow())
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before the request is sent."""
+
+    def on_retry(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        """Called before a retry; info holds the attempt, status or error and backoff."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Called once the response and its body were received."""
+
+    def on_parsed(self, event: RequestEvent) -> None:
+        """Called once the response was parsed into models."""
+
+    def on_converted(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        """Called after a DataFrame conversion; info holds the format, seconds and shape."""
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        """Called when the call fails."""
+
+    def on_breaker(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        """Called when a circuit changes state; info holds the endpoint, state and previous state."""
+
+
+class HookManager:
+    """Thread-safe registry dispatching lifecycle events to hooks.
+
+    A failing hook is logged and never breaks the request it observes.
+    """
+
+    def __init__(self, hooks: Optional[Iterable[RequestHook]] = None):
+        """Initialize a new HookManager.
+
+        Args:
+            hooks: Hooks to register initially
+        """
+        self._hooks: List[RequestHook] = list(hooks or [])
+        self._lock = threading.Lock()
+
+    def add(self, hook: RequestHook) -> RequestHook:
+        """Register a hook and return it."""
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+        return hook
+
+    def remove(self, hook: RequestHook) -> None:
+        """Unregister a hook."""
+        with self._lock:
+            self._hooks = [h for h in self._hooks if h is not hook]
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    def emit(self, name: str, event: RequestEvent, *args) -> None:
+        """Call the named method of every registered hook."""
+        for hook in self._hooks:
+            method = getattr(hook, name, None)
+            if method is None:
+                continue
+            try:
+                method(event, *args)
+            except Exception as e:
+                logger.warning(f"Hook {type(hook).__name__}.{name} failed: {e}")
+
+
+def make_hook_manager(hooks: Union[HookManager, Iterable[RequestHook], None]) -> HookManager:
+    """Return a HookManager from a manager, a list of hooks or None."""
+    if isinstance(hooks, HookManager):
+        return hooks
+    return HookManager(hooks)
+
+
+class StatsCollector(RequestHook):
+    """Hook aggregating counters and stage timings per endpoint.
+
+    Example:
+        >>> stats = client.hooks.add(StatsCollector())
+        >>> client.get(Curve.ITALY_PRICES, market="MGP", date_from="2024-01-01", date_to="2024-01-31")
+        >>> stats.snapshot()["/italy/prices"]["stages"]["validate"]["mean"]
+        0.0042
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def _stats(self, endpoint: str) -> Dict[str, Any]:
+        return self._endpoints.setdefault(endpoint, {
+            "requests": 0,
+            "errors": 0,
+            "retries": 0,
+            "cache_hits": 0,
+            "revalidated": 0,
+            "stale": 0,
+            "rows": 0,
+            "wire_bytes": 0,
+            "decoded_bytes": 0,
+            "status": {},
+            "stages": {},
+        })
+
+    def _add_stage(self, stats: Dict[str, Any], stage: str, seconds: float) -> None:
+        entry = stats["stages"].setdefault(stage, {"count": 0, "total": 0.0, "max": 0.0})
+        entry["count"] += 1
+        entry["total"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+
+    def _finish(self, event: RequestEvent, error: bool) -> None:
+        with self._lock:
+            stats = self._stats(event.endpoint)
+            stats["requests"] += 1
+            stats["errors"] += int(error)
+            stats["retries"] += event.retries
+            stats["cache_hits"] += int(event.cache == "hit")
+            stats["revalidated"] += int(event.cache == "revalidated")
+            stats["stale"] += int(event.cache == "stale")
+            stats["rows"] += event.rows or 0
+            stats["wire_bytes"] += event.wire_bytes
+            stats["decoded_bytes"] += event.decoded_bytes
+            if event.status_code is not None:
+                stats["status"][event.status_code] = stats["status"].get(event.status_code, 0) + 1
+            for stage, seconds in event.timings.items():
+                if stage != "convert":
+                    self._add_stage(stats, stage, seconds)
+            self._add_stage(stats, "total", event.elapsed)
+
+    def on_parsed(self, event: RequestEvent) -> None:
+        self._finish(event, error=False)
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        self._finish(event, error=True)
+
+    def on_converted(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        with self._lock:
+            self._add_stage(self._stats(event.endpoint), "convert", info["seconds"])
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of the statistics per endpoint, with mean stage times."""
+        with self._lock:
+            result = {}
+            for endpoint, stats in self._endpoints.items():
+                entry = dict(stats, status=dict(stats["status"]))
+                entry["stages"] = {
+                    stage: dict(values, mean=values["total"] / values["count"])
+                    for stage, values in stats["stages"].items()
+                }
+                result[endpoint] = entry
+            return result
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._endpoints.clear()
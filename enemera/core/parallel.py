@@ -0,0 +1,233 @@
+"""
+Parallel parsing of large responses for the Enemera API client.
+
+Decoding and validating millions of rows with pydantic is CPU-bound and runs
+on a single core. A ParallelParser splits the raw JSON array of a response
+into byte shards at row boundaries, lets a process pool decode and validate
+each shard, and reassembles the results in order.
+
+Pickling pydantic models between processes costs more than validating them,
+so workers send back plain tuples of validated values and the models are
+rebuilt without validating them a second time. When the rows are only needed
+as a table, parse(..., output="pandas") or output="polars" builds the
+DataFrame in the workers and only concatenates the shards here, which scales
+much better.
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import TypeAdapter, ValidationError
+
+from enemera.core.response import APIResponse
+from enemera.models.response_models import BaseTimeSeriesResponse
+
+OUTPUTS = ("response", "pandas", "polars")
+
+# End of one row object and start of the next one
+_ROW_BOUNDARY = re.compile(rb"\}\s*,\s*\{")
+
+# TypeAdapters built in each worker process, per model class
+_adapters: Dict[type, Any] = {}
+
+
+def split_json_array(body: bytes, shards: int) -> List[bytes]:
+    """Split a JSON array of flat objects into smaller JSON arrays.
+
+    Cuts are placed at the first row boundary after each of `shards` evenly
+    spaced offsets, so every shard is itself a valid JSON array. Rows of the
+    API are flat objects; a string value that happens to look like a row
+    boundary results in an invalid shard, which the parser detects.
+
+    Args:
+        body: Raw JSON array, e.g. b'[{"utc": ...}, {"utc": ...}]'
+        shards: Number of shards wanted
+
+    Returns:
+        The shards, in order (fewer than requested for small bodies)
+    """
+    start = body.find(b"[")
+    end = body.rfind(b"]")
+    if start < 0 or end < start:
+        raise ValueError("Response body is not a JSON array")
+    if shards <= 1:
+        return [body]
+
+    step = (end - start) // shards
+    result = []
+    position = start + 1
+    for i in range(1, shards):
+        match = _ROW_BOUNDARY.search(body, max(position, start + i * step), end)
+        if match is None:
+            break
+        # Keep the closing brace in this shard and the opening one in the next
+        cut = match.start() + 1
+        result.append(b"[" + body[position:cut] + b"]")
+        position = match.end() - 1
+    result.append(b"[" + body[position:end] + b"]")
+    return result
+
+
+def _adapter(model_class: type):
+    adapter = _adapters.get(model_class)
+    if adapter is None:
+        adapter = _adapters[model_class] = TypeAdapter(List[model_class])
+    return adapter
+
+
+def _parse_shard(model_class: Type[BaseTimeSeriesResponse], shard: bytes, output: str):
+    """Decode and validate one shard (runs in a worker process)"""
+    items = _adapter(model_class).validate_json(shard)
+    if output == "pandas":
+        return APIResponse(items).to_pandas()
+    if output == "polars":
+        return APIResponse(items).to_polars()
+
+    # Rows as value tuples, each ending with the index of its set of explicitly
+    # set fields; optional fields make that set differ between rows
+    fields_sets: List[frozenset] = []
+    fields_index: Dict[frozenset, int] = {}
+    rows = []
+    for item in items:
+        fields_set = frozenset(item.__pydantic_fields_set__)
+        index = fields_index.get(fields_set)
+        if index is None:
+            index = fields_index[fields_set] = len(fields_sets)
+            fields_sets.append(fields_set)
+        rows.append((*item.__dict__.values(), index))
+    return fields_sets, rows
+
+
+def _rebuild_models(model_class: Type[BaseTimeSeriesResponse],
+                    shard: Tuple[List[frozenset], List[tuple]]) -> List[BaseTimeSeriesResponse]:
+    """Rebuild validated models from value tuples without validating them again"""
+    fields_sets, rows = shard
+    fields = list(model_class.model_fields)
+    new = object.__new__
+    set_attr = object.__setattr__
+    items = []
+    for row in rows:
+        item = new(model_class)
+        set_attr(item, "__dict__", dict(zip(fields, row)))
+        set_attr(item, "__pydantic_fields_set__", set(fields_sets[row[-1]]))
+        set_attr(item, "__pydantic_extra__", None)
+        set_attr(item, "__pydantic_private__", None)
+        items.append(item)
+    return items
+
+
+class ParallelParser:
+    """Process pool parsing large response bodies in shards.
+
+    Bodies smaller than min_bytes are parsed in the calling thread, since
+    shipping them to other processes would cost more than it saves.
+
+    Attributes:
+        workers: Number of worker processes
+        min_bytes: Smallest body (in decoded bytes) parsed in parallel
+        shard_bytes: Target shard size; bodies are split into one shard per
+            worker, or more so that shards stay around this size
+
+    Example:
+        >>> with ParallelParser(workers=32) as parser:
+        ...     client = EnemeraClient(api_key="...", parallel=parser)
+        ...     imbalance = client.get(Curve.ITALY_IMBALANCE_DATA, date_from="2015-01-01",
+        ...                            date_to="2024-12-31")
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_bytes: int = 8 * 1024 * 1024,
+                 shard_bytes: int = 16 * 1024 * 1024, mp_context=None):
+        """Initialize a new ParallelParser.
+
+        The process pool is started on first use.
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            min_bytes: Smallest body parsed in parallel
+            shard_bytes: Target shard size in bytes
+            mp_context: Optional multiprocessing context (e.g., "spawn")
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_bytes = min_bytes
+        self.shard_bytes = shard_bytes
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = self._mp_context
+                if isinstance(context, str):
+                    import multiprocessing
+                    context = multiprocessing.get_context(context)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+
+    def should_parallelize(self, body: bytes) -> bool:
+        """Whether a body is large enough to be parsed in parallel."""
+        return self.workers > 1 and len(body) >= self.min_bytes
+
+    def parse(self, body: bytes, model_class: Type[BaseTimeSeriesResponse],
+              output: str = "response"):
+        """Decode and validate a JSON array response body in parallel.
+
+        Args:
+            body: Decoded response body (a JSON array of rows)
+            model_class: Response model of the rows
+            output: "response" for an APIResponse of models, or "pandas" /
+                "polars" for a DataFrame as returned by APIResponse.to_pandas()
+                and to_polars()
+
+        Returns:
+            An APIResponse or a DataFrame, with the rows in their original order
+
+        Raises:
+            ValueError: If output is unknown or the body is not a JSON array
+            pydantic.ValidationError: If a row does not match the model
+        """
+        if output not in OUTPUTS:
+            raise ValueError(f"Invalid output: {output}. Available outputs: {', '.join(OUTPUTS)}")
+
+        shards = max(self.workers, -(-len(body) // self.shard_bytes))
+        parts = split_json_array(body, shards)
+        if len(parts) == 1:
+            results = [_parse_shard(model_class, parts[0], output)]
+        else:
+            executor = self._get_executor()
+            futures = [executor.submit(_parse_shard, model_class, part, output) for part in parts]
+            try:
+                results = [future.result() for future in futures]
+            except ValidationError as e:
+                if not any(error["type"] == "json_invalid" for error in e.errors()):
+                    raise
+                # A cut fell inside a string value; parse the body as a whole
+                results = [_parse_shard(model_class, body, output)]
+
+        if output == "pandas":
+            import pandas as pd
+            return pd.concat(results) if len(results) > 1 else results[0]
+        if output == "polars":
+            import polars as pl
+            return pl.concat(results) if len(results) > 1 else results[0]
+
+        items = []
+        for shard in results:
+            items.extend(_rebuild_models(model_class, shard))
+        return APIResponse(items)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self) -> "ParallelParser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,80 @@
+"""
+Client-side rate limiting for the Enemera API client.
+
+A RateLimiter is a token bucket shared by every thread that calls acquire():
+tokens refill at a steady rate up to a burst size, and callers block until a
+token is available instead of being answered with 429 Too Many Requests.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from enemera.core.deadline import current_deadline
+from enemera.core.exceptions import TimeoutError
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Attributes:
+        rate: Tokens added per second
+        burst: Maximum number of tokens held, i.e. requests that may be sent
+            at once after an idle period
+
+    Example:
+        >>> limiter = RateLimiter(rate=5, burst=10)
+        >>> limiter.acquire()   # blocks until a request may be sent
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Initialize a new RateLimiter.
+
+        Args:
+            rate: Requests per second
+            burst: Bucket size (defaults to one second's worth of requests)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one if the bucket is empty.
+
+        Waiting is capped by the active deadline, if any.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the deadline expires before a token is available
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - start
+                wait = (1 - self._tokens) / self.rate
+            deadline = current_deadline()
+            if deadline is not None:
+                if deadline.remaining() < wait:
+                    raise TimeoutError(f"Deadline of {deadline.seconds}s exceeded waiting "
+                                       f"for the rate limit", timeout_value=deadline.seconds)
+            time.sleep(wait)
+
+    def snapshot(self) -> dict:
+        """Return the configured rate and the tokens currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {"rate": self.rate, "burst": self.burst, "tokens": self._tokens}
@@ -3,35 +3,84 @@ Response handling for the Enemera API.
 
 This module provides the APIResponse class, which extends the built-in list 
 to provide additional functionality for converting API responses to various
-data formats (pandas DataFrames, polars DataFrames, CSV, Excel, etc.)
+data formats (pandas DataFrames, polars DataFrames, CSV, Excel, etc.), and
+ArrowResponse, an APIResponse backed by an Arrow table that is only turned
+into models when needed.
 """
 
 import pathlib
-from typing import Union, List, TypeVar
-
-import pandas as pd
+import time
+from typing import Any, Optional, Union, List, TypeVar, TYPE_CHECKING
 
+from enemera.core.exceptions import DependencyError
 from enemera.models.response_models import BaseTimeSeriesResponse
 from enemera.validators.validators import validate_filepath
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
 T = TypeVar('T', bound=BaseTimeSeriesResponse)
 
 
+def _import_pandas():
+    """Import pandas on first use, so that importing enemera does not load it"""
+    try:
+        import pandas as pd
+    except ImportError:
+        raise DependencyError("pandas", "convert responses to pandas DataFrames",
+                              "pip install enemera[pandas]")
+    return pd
+
+
 class APIResponse(List[T]):
     """Enhanced list that supports data conversion methods"""
 
     def __init__(self, data: List[T]):
         super().__init__(data)
         self._data = data
+        # RequestEvent of the call that returned this response, if any
+        self._event = None
+        # Whether the call served an outdated cached copy (see stale_while_revalidate)
+        self.stale = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_event'] = None
+        state['stale'] = False
+        return state
+
+    def _copy(self) -> 'APIResponse[T]':
+        """Return a response holding the same items in a list, flags and event of its own"""
+        return APIResponse(list(self))
+
+    def _record_conversion(self, fmt: str, start: float, frame: Any) -> None:
+        """Report a conversion to the hooks of the call that returned this response"""
+        event = self._event
+        if event is not None:
+            seconds = time.perf_counter() - start
+            event.add_timing("convert", seconds)
+            event.emit("on_converted", {"format": fmt, "seconds": seconds,
+                                        "shape": getattr(frame, "shape", None)})
 
-    def to_pandas(self, index_col: str = 'utc', naive_datetime: bool = False) -> pd.DataFrame:
+    def to_pandas(self, index_col: str = 'utc', naive_datetime: bool = False) -> 'pd.DataFrame':
         """Convert to pandas DataFrame"""
-        if not self._data:
+        start = time.perf_counter()
+        df = self._to_pandas(index_col, naive_datetime)
+        self._record_conversion("pandas", start, df)
+        return df
+
+    def _frame(self, pd) -> 'pd.DataFrame':
+        """Build the DataFrame the pandas conversions index"""
+        return pd.DataFrame([item.model_dump() for item in self._data])
+
+    def _to_pandas(self, index_col: str, naive_datetime: bool) -> 'pd.DataFrame':
+        pd = _import_pandas()
+        if not len(self):
             return pd.DataFrame()
 
-        # Convert to dict records
-        records = [item.model_dump() for item in self._data]
-        df = pd.DataFrame(records)
+        df = self._frame(pd)
 
         # Set datetime index if specified
         if index_col and index_col in df.columns:
@@ -56,14 +105,19 @@ class APIResponse(List[T]):
 
         return df
 
-    def to_pandas_cet(self, naive_datetime: bool = False) -> pd.DataFrame:
+    def to_pandas_cet(self, naive_datetime: bool = False) -> 'pd.DataFrame':
         """Convert to pandas DataFrame and convert UTC to CET timezone"""
-        if not self._data:
+        start = time.perf_counter()
+        df = self._to_pandas_cet(naive_datetime)
+        self._record_conversion("pandas_cet", start, df)
+        return df
+
+    def _to_pandas_cet(self, naive_datetime: bool) -> 'pd.DataFrame':
+        pd = _import_pandas()
+        if not len(self):
             return pd.DataFrame()
 
-        # Convert to dict records
-        records = [item.model_dump() for item in self._data]
-        df = pd.DataFrame(records)
+        df = self._frame(pd)
 
         # Set datetime index if specified
         index_col = 'utc'
@@ -96,8 +150,27 @@ class APIResponse(List[T]):
         if not self._data:
             return pl.DataFrame()
 
+        start = time.perf_counter()
         records = [item.model_dump() for item in self._data]
-        return pl.DataFrame(records)
+        df = pl.DataFrame(records)
+        self._record_conversion("polars", start, df)
+        return df
+
+    def to_arrow(self) -> 'pa.Table':
+        """Convert to a pyarrow Table"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise DependencyError("pyarrow", "convert responses to Arrow tables",
+                                  "pip install enemera[arrow]")
+
+        if not self._data:
+            return pa.table({})
+
+        start = time.perf_counter()
+        table = pa.Table.from_pylist([item.model_dump() for item in self._data])
+        self._record_conversion("arrow", start, table)
+        return table
 
     def to_csv(self, filepath: Union[str, pathlib.Path], **kwargs) -> None:
         """Save to CSV file"""
@@ -125,3 +198,119 @@ class APIResponse(List[T]):
         path = validate_filepath(filepath, 'xlsx')
         df = self.to_pandas(naive_datetime=True)
         df.to_excel(path, **kwargs)
+
+
+# List methods that need the rows as models, and those that also change them
+_READING_METHODS = ("__getitem__", "__iter__", "__reversed__", "__contains__", "__eq__",
+                    "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__add__", "__mul__",
+                    "__rmul__", "__repr__", "index", "count", "copy")
+_MUTATING_METHODS = ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+                     "insert", "pop", "remove", "clear", "reverse", "sort")
+
+
+class ArrowResponse(APIResponse[T]):
+    """APIResponse backed by a pyarrow Table, e.g. a memory-mapped cache file.
+
+    Conversions read the table directly: to_arrow() returns it, to_polars()
+    wraps it without copying, and to_pandas() copies only what pandas cannot
+    share (strings, timestamps, columns with nulls). The rows are validated
+    into models only when the response is used as a list.
+
+    Attributes:
+        table: The rows, one column per model field (None once the response
+            was changed as a list)
+        model_class: Model the rows are validated into
+        source: File the table is mapped from, if any
+    """
+
+    def __init__(self, table: 'pa.Table', model_class: type, source: Optional[str] = None):
+        super().__init__([])
+        self.table = table
+        self.model_class = model_class
+        self.source = source
+        self._materialized = False
+
+    def _materialize(self) -> None:
+        if not self._materialized:
+            self._materialized = True
+            model_class = self.model_class
+            list.extend(self, [model_class(**row) for row in self.table.to_pylist()])
+            self._data = self
+
+    def _copy(self) -> 'APIResponse[T]':
+        if self.table is None:
+            return super()._copy()
+        copy = ArrowResponse(self.table, self.model_class, self.source)
+        if self._materialized:
+            # Reuse the validated models instead of validating the rows again
+            list.extend(copy, list.__iter__(self))
+            copy._materialized = True
+            copy._data = copy
+        return copy
+
+    def __len__(self) -> int:
+        if self.table is None:
+            return list.__len__(self)
+        return self.table.num_rows
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __reduce__(self):
+        if self.table is None:
+            # Changed as a list; the table no longer reflects the rows
+            return APIResponse, (list(self),)
+        return self.__class__, (self.table, self.model_class, self.source)
+
+    def _frame(self, pd) -> 'pd.DataFrame':
+        if self.table is None:
+            return super()._frame(pd)
+        # split_blocks keeps numeric columns without nulls as views of the table
+        return self.table.to_pandas(split_blocks=True)
+
+    def to_polars(self) -> 'pl.DataFrame':
+        """Convert to polars DataFrame (without copying the table)"""
+        if self.table is None:
+            return super().to_polars()
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "polars is required. Install with: pip install polars")
+        start = time.perf_counter()
+        df = pl.from_arrow(self.table)
+        self._record_conversion("polars", start, df)
+        return df
+
+    def to_arrow(self) -> 'pa.Table':
+        """Return the table backing the response"""
+        if self.table is None:
+            return super().to_arrow()
+        return self.table
+
+
+def _reading(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    return wrapper
+
+
+def _mutating(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        self.table = None
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in _READING_METHODS:
+    setattr(ArrowResponse, _name, _reading(_name))
+for _name in _MUTATING_METHODS:
+    setattr(ArrowResponse, _name, _mutating(_name))
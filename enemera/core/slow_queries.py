@@ -0,0 +1,167 @@
+"""
+Slow-query log and per-curve latency tracking for the Enemera API client.
+
+SlowQueryLog is a request hook that keeps rolling latency percentiles per
+curve and records every call slower than its curve's threshold, with the
+parameters, stage timings, payload size and retries needed to explain it.
+Entries are written to an EnemeraLogger and kept in memory, and latency
+objectives can be checked in-process to alert on breaches.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from enemera.core.hedging import LatencyTracker
+from enemera.core.hooks import RequestEvent, RequestHook
+from enemera.models.curves import Curve
+from enemera.utils.logging import EnemeraLogger, logger as default_logger
+
+CurveKey = Union[Curve, str]
+
+
+def _curve_key(curve: CurveKey) -> str:
+    return curve.value if isinstance(curve, Curve) else curve
+
+
+class SlowQueryLog(RequestHook):
+    """Hook logging slow calls and tracking rolling latency percentiles per curve.
+
+    Attributes:
+        threshold: Default slow-call threshold in seconds
+        thresholds: Thresholds per curve value, overriding the default
+        slo: Latency objectives per curve value as (percentile, seconds)
+        latencies: Rolling call latencies per curve
+
+    Example:
+        >>> slow_log = SlowQueryLog(threshold=2.0,
+        ...                         thresholds={Curve.ITALY_IMBALANCE_DATA: 10.0},
+        ...                         slo={Curve.ITALY_PRICES: (95, 1.5)})
+        >>> client = EnemeraClient(api_key="...", hooks=[slow_log])
+        >>> slow_log.percentiles()["italy_prices"]
+        {'count': 120, 'p50': 0.21, 'p95': 0.94, 'p99': 1.8}
+        >>> slow_log.slo_breaches()
+        []
+    """
+
+    def __init__(self,
+                 threshold: float = 5.0,
+                 thresholds: Optional[Dict[CurveKey, float]] = None,
+                 slo: Optional[Dict[CurveKey, Tuple[float, float]]] = None,
+                 window: int = 1000,
+                 max_entries: int = 500,
+                 logger: Optional[EnemeraLogger] = None):
+        """Initialize a new SlowQueryLog.
+
+        Args:
+            threshold: Default slow-call threshold in seconds
+            thresholds: Thresholds per curve (Curve or curve value)
+            slo: Latency objectives per curve as (percentile, seconds),
+                e.g. {Curve.ITALY_PRICES: (95, 1.5)}
+            window: Number of most recent calls kept per curve for percentiles
+            max_entries: Number of slow calls kept in memory
+            logger: Logger slow calls are written to (defaults to the enemera logger)
+        """
+        self.threshold = threshold
+        self.thresholds = {_curve_key(k): v for k, v in (thresholds or {}).items()}
+        self.slo = {_curve_key(k): v for k, v in (slo or {}).items()}
+        self.latencies = LatencyTracker(window)
+        self.logger = logger or default_logger
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def threshold_for(self, curve: CurveKey) -> float:
+        """Return the slow-call threshold of a curve in seconds."""
+        return self.thresholds.get(_curve_key(curve), self.threshold)
+
+    def _record(self, event: RequestEvent, error: Optional[BaseException] = None) -> None:
+        curve = event.curve
+        elapsed = event.elapsed
+        self.latencies.record(curve, elapsed)
+        if elapsed < self.threshold_for(curve):
+            return
+
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(event.started_at)),
+            "curve": curve,
+            "params": {k: str(v) for k, v in event.params.items() if v is not None},
+            "seconds": round(elapsed, 3),
+            "timings": {k: round(v, 4) for k, v in event.timings.items()},
+            "wire_bytes": event.wire_bytes,
+            "decoded_bytes": event.decoded_bytes,
+            "rows": event.rows,
+            "retries": event.retries,
+            "status": event.status_code,
+            "cache": event.cache,
+            "error": f"{type(error).__name__}: {error}" if error is not None else None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+        self.logger.warning(
+            f"Slow query: {curve} took {entry['seconds']:.2f}s",
+            params=entry["params"], timings=entry["timings"], wire_bytes=entry["wire_bytes"],
+            rows=entry["rows"], retries=entry["retries"], status=entry["status"],
+            error=entry["error"]
+        )
+
+    def on_parsed(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        self._record(event, error)
+
+    def entries(self, curve: Optional[CurveKey] = None) -> List[Dict[str, Any]]:
+        """Return the recorded slow calls, oldest first, optionally for one curve."""
+        with self._lock:
+            entries = list(self._entries)
+        if curve is not None:
+            key = _curve_key(curve)
+            entries = [e for e in entries if e["curve"] == key]
+        return entries
+
+    def percentiles(self, curve: Optional[CurveKey] = None,
+                    pcts: Tuple[float, ...] = (50, 95, 99)) -> Dict[str, Dict[str, Any]]:
+        """Return rolling latency percentiles in seconds per curve.
+
+        Args:
+            curve: Only report this curve
+            pcts: Percentiles to compute
+
+        Returns:
+            {curve: {"count": n, "p50": seconds, ...}}
+        """
+        curves = [_curve_key(curve)] if curve is not None else self.latencies.keys()
+        result = {}
+        for key in curves:
+            stats = {"count": self.latencies.count(key)}
+            for pct in pcts:
+                value = self.latencies.percentile(key, pct)
+                stats[f"p{pct:g}"] = round(value, 4) if value is not None else None
+            result[key] = stats
+        return result
+
+    def slo_breaches(self) -> List[Dict[str, Any]]:
+        """Return the curves whose rolling latency currently exceeds their objective.
+
+        Returns:
+            List of {"curve", "percentile", "target", "observed", "count"}
+        """
+        breaches = []
+        for curve, (pct, target) in self.slo.items():
+            observed = self.latencies.percentile(curve, pct)
+            if observed is not None and observed > target:
+                breaches.append({
+                    "curve": curve,
+                    "percentile": pct,
+                    "target": target,
+                    "observed": round(observed, 4),
+                    "count": self.latencies.count(curve),
+                })
+        return breaches
+
+    def reset(self) -> None:
+        """Clear slow-call entries and latency history."""
+        with self._lock:
+            self._entries.clear()
+        self.latencies.clear()
@@ -0,0 +1,51 @@
+"""
+Optional observability integrations (OpenTelemetry tracing, Prometheus metrics).
+
+The hooks import their libraries only when instantiated. instrument() adds
+every integration whose library is installed and silently skips the others,
+so an uninstrumented client pays nothing.
+"""
+
+from typing import List
+
+from enemera.core.exceptions import DependencyError
+from enemera.core.hooks import RequestHook
+from enemera.utils.logging import logger
+
+from .otel import OpenTelemetryHook
+from .prometheus import PrometheusHook
+
+__all__ = [
+    'OpenTelemetryHook',
+    'PrometheusHook',
+    'instrument'
+]
+
+
+def instrument(client, tracing: bool = True, metrics: bool = True, **kwargs) -> List[RequestHook]:
+    """Add the available observability hooks to a client.
+
+    Args:
+        client: EnemeraClient or curve client to instrument
+        tracing: Add OpenTelemetry tracing if opentelemetry-api is installed
+        metrics: Add Prometheus metrics if prometheus-client is installed
+        **kwargs: registry and namespace for PrometheusHook,
+            tracer_provider for OpenTelemetryHook
+
+    Returns:
+        The hooks that were added (empty if no library is installed)
+    """
+    added = []
+    wanted = []
+    if tracing:
+        wanted.append((OpenTelemetryHook, {k: v for k, v in kwargs.items()
+                                           if k == "tracer_provider"}))
+    if metrics:
+        wanted.append((PrometheusHook, {k: v for k, v in kwargs.items()
+                                        if k in ("registry", "namespace")}))
+    for hook_class, options in wanted:
+        try:
+            added.append(client.hooks.add(hook_class(**options)))
+        except DependencyError as e:
+            logger.debug(f"Skipping {hook_class.__name__}: {e}")
+    return added
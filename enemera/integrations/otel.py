@@ -0,0 +1,156 @@
+"""
+OpenTelemetry tracing for the Enemera API client.
+
+OpenTelemetryHook emits one span per client call ("enemera GET <endpoint>")
+with child spans for the HTTP exchange, parsing and every DataFrame
+conversion of the result. Retries and circuit breaker state changes are
+recorded as span events. Requires `pip install enemera[otel]`; spans are
+exported by whatever SDK the application has configured.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from enemera.core.exceptions import DependencyError
+from enemera.core.hooks import RequestEvent, RequestHook
+
+INSTRUMENTATION_NAME = "enemera"
+
+
+def _import_trace():
+    """Import opentelemetry.trace or raise DependencyError"""
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise DependencyError("opentelemetry-api", "emit OpenTelemetry traces",
+                              "pip install enemera[otel]")
+    return trace
+
+
+class OpenTelemetryHook(RequestHook):
+    """Hook emitting OpenTelemetry spans for every client call.
+
+    Span structure:
+        enemera GET /italy/prices       the whole call
+          ├─ HTTP GET                   request sent until body received (incl. retries)
+          ├─ parse                      JSON decode and model validation
+          └─ convert pandas             each to_pandas / to_pandas_cet / to_polars
+
+    Example:
+        >>> from enemera.integrations import OpenTelemetryHook
+        >>> client = EnemeraClient(api_key="...", hooks=[OpenTelemetryHook()])
+    """
+
+    def __init__(self, tracer_provider=None):
+        """Initialize a new OpenTelemetryHook.
+
+        Args:
+            tracer_provider: TracerProvider to use (defaults to the global one)
+
+        Raises:
+            DependencyError: If opentelemetry-api is not installed
+        """
+        self._trace = _import_trace()
+        from opentelemetry.trace import SpanKind, Status, StatusCode
+
+        self._span_kind = SpanKind
+        self._status = Status
+        self._status_code = StatusCode
+
+        from enemera import __version__
+        self.tracer = self._trace.get_tracer(INSTRUMENTATION_NAME, __version__,
+                                             tracer_provider=tracer_provider)
+
+    def _attributes(self, event: RequestEvent) -> Dict[str, Any]:
+        attributes = {
+            "enemera.curve": event.curve,
+            "enemera.endpoint": event.endpoint,
+            "http.request.method": event.method,
+        }
+        for key, value in event.params.items():
+            if value is not None:
+                attributes[f"enemera.param.{key}"] = str(value)
+        return attributes
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        span = self.tracer.start_span(f"enemera {event.method} {event.endpoint}",
+                                      attributes=self._attributes(event))
+        context = self._trace.set_span_in_context(span)
+        http_span = self.tracer.start_span(f"HTTP {event.method}", context=context,
+                                           kind=self._span_kind.CLIENT)
+        event.extra["otel"] = {"span": span, "context": context, "http": http_span}
+
+    def on_retry(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        state = event.extra.get("otel")
+        if state is not None:
+            attributes = {k: v for k, v in info.items() if v is not None}
+            (state["http"] or state["span"]).add_event("retry", attributes=attributes)
+
+    def on_breaker(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        state = event.extra.get("otel")
+        if state is not None:
+            state["span"].add_event("circuit " + info["state"],
+                                    attributes={"enemera.circuit.previous": info["previous"]})
+
+    def on_response(self, event: RequestEvent) -> None:
+        state = event.extra.get("otel")
+        if state is None or state["http"] is None:
+            return
+        http_span = state["http"]
+        http_span.set_attribute("http.response.status_code", event.status_code)
+        http_span.set_attribute("enemera.wire_bytes", event.wire_bytes)
+        http_span.set_attribute("enemera.decoded_bytes", event.decoded_bytes)
+        http_span.set_attribute("enemera.retries", event.retries)
+        for stage in ("connect", "wait", "download", "decompress"):
+            if stage in event.timings:
+                http_span.set_attribute(f"enemera.{stage}_ms", event.timings[stage] * 1000)
+        if event.status_code >= 400:
+            http_span.set_status(self._status(self._status_code.ERROR))
+        http_span.end()
+        state["http"] = None
+        state["parse_start"] = time.time_ns()
+
+    def on_parsed(self, event: RequestEvent) -> None:
+        state = event.extra.get("otel")
+        if state is None:
+            return
+        span = state["span"]
+        if state["http"] is not None:
+            # Served from the cache without a request
+            state["http"].end()
+            state["http"] = None
+        if "parse_start" in state and "validate" in event.timings:
+            parse = self.tracer.start_span("parse", context=state["context"],
+                                           start_time=state["parse_start"])
+            parse.set_attribute("enemera.rows", event.rows)
+            for stage in ("json_decode", "validate"):
+                parse.set_attribute(f"enemera.{stage}_ms", event.timings.get(stage, 0.0) * 1000)
+            parse.end()
+        span.set_attribute("enemera.rows", event.rows)
+        span.set_attribute("enemera.cache", event.cache)
+        span.set_attribute("enemera.retries", event.retries)
+        span.end()
+
+    def on_converted(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        state = event.extra.get("otel")
+        if state is None:
+            return
+        end = time.time_ns()
+        span = self.tracer.start_span(f"convert {info['format']}", context=state["context"],
+                                      start_time=end - int(info["seconds"] * 1e9))
+        if info.get("shape") is not None:
+            span.set_attribute("enemera.rows", info["shape"][0])
+            span.set_attribute("enemera.columns", info["shape"][1])
+        span.end(end_time=end)
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        state = event.extra.get("otel")
+        if state is None:
+            return
+        for key in ("http", "span"):
+            span = state.get(key)
+            if span is not None:
+                span.record_exception(error)
+                span.set_status(self._status(self._status_code.ERROR, str(error)))
+                span.end()
+        state["http"] = None
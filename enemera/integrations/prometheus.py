@@ -0,0 +1,141 @@
+"""
+Prometheus metrics for the Enemera API client.
+
+PrometheusHook records, per curve, latency histograms for whole calls and for
+each stage of the timing breakdown, bytes received, rows parsed, retries,
+rate-limited (429) responses, errors, cache outcomes and the state of the
+circuit breaker, if the client has one. Requires
+`pip install enemera[prometheus]`; the metrics are exposed by the
+application's existing Prometheus endpoint.
+
+Useful queries:
+
+    rate(enemera_cache_lookups_total{result!="miss"}[5m])
+        / rate(enemera_cache_lookups_total[5m])                    cache hit ratio
+    histogram_quantile(0.95, rate(enemera_call_duration_seconds_bucket[5m]))
+    max by (curve) (enemera_circuit_state) == 2                     curves failing fast
+"""
+
+import threading
+from typing import Any, Dict, Tuple
+
+from enemera.core.breaker import STATE_VALUES
+from enemera.core.exceptions import DependencyError
+from enemera.core.hooks import RequestEvent, RequestHook
+
+# Histogram buckets in seconds, from sub-millisecond parsing to multi-year downloads
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Metrics already created per registry, so several hooks can share one registry
+_metrics: Dict[Tuple[int, str], Dict[str, Any]] = {}
+_metrics_lock = threading.Lock()
+
+
+def _import_prometheus():
+    """Import prometheus_client or raise DependencyError"""
+    try:
+        import prometheus_client
+    except ImportError:
+        raise DependencyError("prometheus-client", "export Prometheus metrics",
+                              "pip install enemera[prometheus]")
+    return prometheus_client
+
+
+def _create_metrics(prometheus_client, registry, namespace: str) -> Dict[str, Any]:
+    """Create the metric families in a registry"""
+    histogram = prometheus_client.Histogram
+    counter = prometheus_client.Counter
+    return {
+        "calls": counter("calls", "Client calls by outcome", ["curve", "status"],
+                         namespace=namespace, registry=registry),
+        "duration": histogram("call_duration_seconds", "Duration of client calls",
+                              ["curve"], namespace=namespace, registry=registry,
+                              buckets=LATENCY_BUCKETS),
+        "stage": histogram("stage_duration_seconds", "Duration of each stage of a call",
+                           ["curve", "stage"], namespace=namespace, registry=registry,
+                           buckets=LATENCY_BUCKETS),
+        "bytes": counter("response_bytes", "Response body bytes (wire or decoded)",
+                         ["curve", "kind"], namespace=namespace, registry=registry),
+        "rows": counter("rows", "Rows parsed", ["curve"], namespace=namespace,
+                        registry=registry),
+        "retries": counter("retries", "Retried attempts", ["curve"], namespace=namespace,
+                           registry=registry),
+        "rate_limited": counter("rate_limited", "Responses with status 429, including retried ones",
+                                ["curve"], namespace=namespace, registry=registry),
+        "errors": counter("errors", "Failed calls by exception type", ["curve", "error"],
+                          namespace=namespace, registry=registry),
+        "cache": counter("cache_lookups", "Cache outcome of calls (miss, hit, revalidated, stale)",
+                         ["curve", "result"], namespace=namespace, registry=registry),
+        "circuit_state": prometheus_client.Gauge(
+            "circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+            ["curve"], namespace=namespace, registry=registry),
+        "circuit_transitions": counter("circuit_transitions", "Circuit breaker state changes",
+                                       ["curve", "state"], namespace=namespace,
+                                       registry=registry),
+    }
+
+
+class PrometheusHook(RequestHook):
+    """Hook recording Prometheus metrics for every client call.
+
+    Example:
+        >>> from enemera.integrations import PrometheusHook
+        >>> client = EnemeraClient(api_key="...", hooks=[PrometheusHook()])
+    """
+
+    def __init__(self, registry=None, namespace: str = "enemera"):
+        """Initialize a new PrometheusHook.
+
+        Args:
+            registry: CollectorRegistry to register the metrics in
+                (defaults to the global registry)
+            namespace: Prefix of the metric names
+
+        Raises:
+            DependencyError: If prometheus-client is not installed
+        """
+        prometheus_client = _import_prometheus()
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        with _metrics_lock:
+            key = (id(registry), namespace)
+            if key not in _metrics:
+                _metrics[key] = _create_metrics(prometheus_client, registry, namespace)
+            self.metrics = _metrics[key]
+
+    def on_retry(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        curve = event.curve
+        self.metrics["retries"].labels(curve).inc()
+        if info.get("status") == 429:
+            self.metrics["rate_limited"].labels(curve).inc()
+
+    def _finish(self, event: RequestEvent, status: str) -> None:
+        curve = event.curve
+        m = self.metrics
+        m["calls"].labels(curve, status).inc()
+        m["duration"].labels(curve).observe(event.elapsed)
+        for stage, seconds in event.timings.items():
+            if stage != "convert":
+                m["stage"].labels(curve, stage).observe(seconds)
+        if event.wire_bytes:
+            m["bytes"].labels(curve, "wire").inc(event.wire_bytes)
+            m["bytes"].labels(curve, "decoded").inc(event.decoded_bytes)
+
+    def on_parsed(self, event: RequestEvent) -> None:
+        self._finish(event, "ok")
+        self.metrics["rows"].labels(event.curve).inc(event.rows or 0)
+        self.metrics["cache"].labels(event.curve, event.cache).inc()
+
+    def on_converted(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        self.metrics["stage"].labels(event.curve, "convert").observe(info["seconds"])
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        self._finish(event, "error")
+        self.metrics["errors"].labels(event.curve, type(error).__name__).inc()
+        if event.status_code == 429:
+            self.metrics["rate_limited"].labels(event.curve).inc()
+
+    def on_breaker(self, event: RequestEvent, info: Dict[str, Any]) -> None:
+        self.metrics["circuit_state"].labels(event.curve).set(STATE_VALUES[info["state"]])
+        self.metrics["circuit_transitions"].labels(event.curve, info["state"]).inc()
@@ -5,7 +5,25 @@ This module defines the Curve enum which is used to identify which data series
 to request from the API. Each enum value corresponds to a specific energy market dataset.
 """
 
+from datetime import date
 from enum import Enum
+from typing import Iterable, Optional
+
+from enemera.models.response_models import (
+    PriceData,
+    IPEXXbidRecapResponse,
+    IpexQuantityResponse,
+    IPEXAncillaryServicesResponse,
+    IPEXActualDemandResponse,
+    IPEXEstimatedDemandResponse,
+    IPEXFlowResponse,
+    IPEXFlowLimitResponse,
+    LoadData,
+    GenerationData,
+    ItalyImbalanceDataResponse,
+    SpainPriceResponse,
+    SpainXbidResultsResponse
+)
 
 
 class Curve(Enum):
@@ -46,3 +64,53 @@ class Curve(Enum):
     SPAIN_PRICES = "spain_prices"  # Spanish electricity market prices
     # Spanish cross-border intraday results
     SPAIN_XBID_RESULTS = "spain_xbid_results"
+
+
+# API endpoint and response model of every curve served by EnemeraClient
+CURVE_ENDPOINTS = {
+    Curve.ITALY_PRICES: ('/italy/prices', PriceData),
+    Curve.ITALY_XBID_RESULTS: ('/italy/xbid/results', IPEXXbidRecapResponse),
+    Curve.ITALY_EXCHANGE_VOLUMES: ('/italy/exchange_volumes', IpexQuantityResponse),
+    Curve.ITALY_ANCILLARY_SERVICES: ('/italy/ancillary_services', IPEXAncillaryServicesResponse),
+    Curve.ITALY_DAM_DEMAND_ACT: ('/italy/dam_demand/act', IPEXActualDemandResponse),
+    Curve.ITALY_DAM_DEMAND_FCS: ('/italy/dam_demand/fcs', IPEXEstimatedDemandResponse),
+    Curve.ITALY_COMMERCIAL_FLOWS: ('/italy/commercial_flows', IPEXFlowResponse),
+    Curve.ITALY_COMMERCIAL_FLOW_LIMITS: ('/italy/commercial_flow_limits', IPEXFlowLimitResponse),
+    Curve.ITALY_LOAD_ACTUAL: ('/italy/load/actual', LoadData),
+    Curve.ITALY_LOAD_FORECAST: ('/italy/load/forecast', LoadData),
+    Curve.ITALY_GENERATION: ('/italy/generation/actual', GenerationData),
+    Curve.ITALY_GENERATION_FORECAST: ('/italy/generation/forecast', GenerationData),
+    Curve.ITALY_IMBALANCE_DATA: ('/italy/imbalance/data', ItalyImbalanceDataResponse),
+    Curve.ITALY_IMBALANCE_DATA_PT60M: ('/italy/imbalance/data_PT60M', ItalyImbalanceDataResponse),
+    Curve.SPAIN_PRICES: ('/spain/prices', SpainPriceResponse),
+    Curve.SPAIN_XBID_RESULTS: ('/spain/xbid/results', SpainXbidResultsResponse),
+}
+
+# Curve served at each endpoint path
+ENDPOINT_CURVES = {endpoint: curve for curve, (endpoint, _) in CURVE_ENDPOINTS.items()}
+
+# Days after delivery during which a curve's data may still be revised.
+# Imbalance data additionally carries is_final_* flags, which must all be set.
+FINALITY_DAYS = {
+    Curve.ITALY_LOAD_ACTUAL: 7,
+    Curve.ITALY_GENERATION: 7,
+    Curve.ITALY_DAM_DEMAND_ACT: 3,
+    Curve.ITALY_IMBALANCE_DATA: 3,
+    Curve.ITALY_IMBALANCE_DATA_PT60M: 3,
+}
+DEFAULT_FINALITY_DAYS = 1
+
+
+def is_final(curve: Curve, day: date, flags: Iterable[Optional[bool]] = (),
+             today: Optional[date] = None) -> bool:
+    """Whether a curve's data for a delivery day can no longer be revised.
+
+    Args:
+        curve: The curve
+        day: Delivery day (the last one, for a range of days)
+        flags: Values of the rows' is_final_* fields; a False one means the
+            API may still revise the data
+        today: Reference day (defaults to today)
+    """
+    lag = FINALITY_DAYS.get(curve, DEFAULT_FINALITY_DAYS)
+    return ((today or date.today()) - day).days > lag and all(v is not False for v in flags)
@@ -0,0 +1,11 @@
+"""Background prefetching of market data at its publication times"""
+
+from .prefetcher import Prefetcher
+from .schedule import PUBLICATIONS, Publication, publications_for
+
+__all__ = [
+    'Prefetcher',
+    'Publication',
+    'PUBLICATIONS',
+    'publications_for'
+]
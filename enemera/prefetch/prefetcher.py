@@ -0,0 +1,235 @@
+"""
+Background prefetching of market data around its publication times.
+
+Right after an auction's results are published, every consumer asks for
+them at once. A Prefetcher knows when each curve is published (see
+enemera.prefetch.schedule) and starts polling the API shortly before, so
+that the client's cache (or store) already holds the data when the first
+consumer asks and their call is a cache hit instead of a cold fetch.
+
+Polling is cheap: every poll after the first is a conditional GET, answered
+304 Not Modified while nothing changed, and the interval between polls grows
+once the usual publication time has passed. Polling for a publication stops
+as soon as data is returned, or after `window` seconds.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from enemera.api.base import revalidating
+from enemera.core.deadline import deadline
+from enemera.core.exceptions import APIError, ConfigurationError
+from enemera.models.curves import Curve
+from enemera.models.enums import Market
+from enemera.utils.logging import logger
+
+from .schedule import Publication, publications_for
+
+# Growth of the polling interval per empty poll once the publication is late
+_BACKOFF = 1.5
+
+
+class _Job:
+    """Polling for one publication of one delivery day"""
+
+    def __init__(self, publication: Publication, published_at: datetime,
+                 delivery_day: date, interval: float):
+        self.publication = publication
+        self.published_at = published_at
+        self.delivery_day = delivery_day
+        self.interval = interval
+        self.polls = 0
+
+
+class Prefetcher:
+    """Background thread warming a client's cache as market data is published.
+
+    The client needs a cache (or a store) shared with the consumers, e.g. a
+    RedisCache for a fleet of workers. Queries are made for single delivery
+    days with the publication's parameters, so consumers asking for the
+    same day and parameters are served from the cache.
+
+    Attributes:
+        client: EnemeraClient whose cache is warmed
+        publications: Publications polled for
+        lead: Seconds before the usual publication time polling starts
+        poll_interval: Seconds between polls around the publication time
+        max_poll_interval: Upper bound of the interval when data is late
+        window: Seconds after the usual publication time polling gives up
+
+    Example:
+        >>> client = EnemeraClient(api_key="...", cache=RedisCache("redis://cache:6379/0"),
+        ...                        cache_max_age=600)
+        >>> with Prefetcher(client, markets=[Market.MGP, Market.MI1]) as prefetcher:
+        ...     serve_dashboards()
+    """
+
+    def __init__(self, client,
+                 publications: Optional[Iterable[Publication]] = None,
+                 curves: Optional[Iterable[Curve]] = None,
+                 markets: Optional[Iterable[Union[Market, str]]] = None,
+                 lead: float = 30,
+                 poll_interval: float = 10,
+                 max_poll_interval: float = 120,
+                 window: float = 3600,
+                 poll_timeout: float = 60):
+        """Initialize a new Prefetcher.
+
+        Args:
+            client: EnemeraClient with a cache or store
+            publications: Publications to poll for (defaults to PUBLICATIONS)
+            curves: Only poll for these curves
+            markets: Only poll for these markets (publications without a
+                market parameter are kept)
+            lead: Seconds before the usual publication time polling starts
+            poll_interval: Seconds between polls around the publication time
+            max_poll_interval: Upper bound of the interval when data is late
+            window: Seconds after the usual publication time polling gives up
+            poll_timeout: Time budget of a single poll in seconds
+
+        Raises:
+            ConfigurationError: If the client has neither a cache nor a store
+        """
+        if getattr(client, "cache", None) is None and getattr(client, "store", None) is None:
+            raise ConfigurationError("Prefetching needs a client with a cache or a store")
+        self.client = client
+        self.publications = publications_for(curves, markets, publications)
+        self.lead = lead
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.window = window
+        self.poll_timeout = poll_timeout
+
+        self._queue: List[Tuple[datetime, int, _Job]] = []
+        self._sequence = itertools.count()
+        self._random = random.Random()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"polls": 0, "warmed": 0, "missed": 0, "errors": 0}
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    def start(self) -> "Prefetcher":
+        """Start polling on a background thread."""
+        self._stop.clear()
+        now = self._now()
+        self._queue = []
+        for publication in self.publications:
+            # Publications up to `window` ago may not have appeared yet
+            self._schedule(publication, now - timedelta(seconds=self.window))
+        self._thread = threading.Thread(target=self._run, name="enemera-prefetch",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling and wait for the current poll to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "Prefetcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _schedule(self, publication: Publication, after: datetime) -> None:
+        published_at, delivery_day = publication.next_after(after)
+        job = _Job(publication, published_at, delivery_day, self.poll_interval)
+        self._push(published_at - timedelta(seconds=self.lead), job)
+
+    def _push(self, due: datetime, job: _Job) -> None:
+        with self._lock:
+            heapq.heappush(self._queue, (due, next(self._sequence), job))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                if not self._queue:
+                    return
+                due, _, job = self._queue[0]
+                wait = (due - self._now()).total_seconds()
+                if wait <= 0:
+                    heapq.heappop(self._queue)
+            if wait > 0:
+                # Woken at least every minute, so a suspended host does not oversleep
+                self._stop.wait(min(wait, 60))
+                continue
+            self._poll(job)
+
+    def _poll(self, job: _Job) -> None:
+        """Request a publication's data once and schedule what comes next"""
+        publication = job.publication
+        day = job.delivery_day.isoformat()
+        job.polls += 1
+        self._count("polls")
+        published = False
+        try:
+            with revalidating(), deadline(self.poll_timeout):
+                result = self.client.get(publication.curve, date_from=day, date_to=day,
+                                         **publication.params)
+            published = len(result) > 0
+        except APIError as e:
+            # Not found is how some endpoints answer before publication
+            if e.status_code != 404:
+                self._poll_failed(job, e)
+        except Exception as e:
+            self._poll_failed(job, e)
+
+        now = self._now()
+        if published:
+            self._count("warmed")
+            lag = (now - job.published_at).total_seconds()
+            with self._lock:
+                self._last[publication.name] = {"delivery_day": job.delivery_day,
+                                                "warmed_at": now, "lag": lag,
+                                                "polls": job.polls}
+            logger.debug(f"Prefetched {publication.name} for {day}", lag=round(lag, 1),
+                         polls=job.polls)
+        elif now >= job.published_at + timedelta(seconds=self.window):
+            self._count("missed")
+            logger.warning(f"{publication.name} for {day} was not published within "
+                           f"{self.window:.0f}s of its usual time", polls=job.polls)
+        else:
+            if now > job.published_at:
+                job.interval = min(self.max_poll_interval, job.interval * _BACKOFF)
+            # Jitter keeps prefetchers started together from polling in lockstep
+            delay = job.interval * self._random.uniform(0.9, 1.1)
+            return self._push(now + timedelta(seconds=delay), job)
+
+        self._schedule(publication, job.published_at + timedelta(seconds=1))
+
+    def _poll_failed(self, job: _Job, error: Exception) -> None:
+        self._count("errors")
+        logger.warning(f"Prefetch poll of {job.publication.name} failed", error=str(error))
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return poll counters, the last warm-up per publication and the next polls.
+
+        "last" maps publication names to the delivery day warmed, when, how
+        long after the usual publication time (lag, in seconds) and after how
+        many polls. "next" lists the upcoming polls, soonest first.
+        """
+        with self._lock:
+            result: Dict[str, Any] = dict(self._stats)
+            result["last"] = {name: dict(last) for name, last in self._last.items()}
+            result["next"] = [
+                {"publication": job.publication.name, "delivery_day": job.delivery_day,
+                 "due": due}
+                for due, _, job in sorted(self._queue, key=lambda item: item[:2])
+            ]
+        return result
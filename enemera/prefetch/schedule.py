@@ -0,0 +1,130 @@
+"""
+Publication times of market data.
+
+Auction results are published at known times of the day: day-ahead (MGP,
+and OMIE's MD) results shortly after the SDAC coupling around 13:00 for the
+next delivery day, the intraday auctions later that day or on the delivery
+day itself. A Publication records when one query's data appears, in local
+market time, so that a Prefetcher can request it as soon as it does.
+
+The default times below are the usual ones and may move by several minutes
+(or more, when the coupling is delayed); the Prefetcher keeps polling for a
+while past them. MI4 to MI7 no longer run since the intraday market joined
+continuous trading (XBID), so they have no publication.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from dateutil import tz
+
+from enemera.models.curves import Curve
+from enemera.models.enums import Market
+
+MARKET_TZ = tz.gettz("Europe/Rome")
+
+
+class Publication:
+    """The time of day a query's data is published for a delivery day.
+
+    Attributes:
+        curve: Curve the data belongs to
+        at: Local time of day the data is usually available
+        delivery_offset: Delivery day minus publication day (1 for day-ahead
+            results, 0 for same-day auctions, -1 for data about yesterday)
+        params: Query parameters besides the dates (e.g., market)
+        timezone: Timezone of `at`
+
+    Example:
+        >>> Publication(Curve.ITALY_PRICES, "13:00", params={"market": "MGP"})
+    """
+
+    def __init__(self, curve: Curve, at: Union[str, time], delivery_offset: int = 1,
+                 params: Optional[Dict[str, Any]] = None, timezone=MARKET_TZ):
+        """Initialize a new Publication.
+
+        Args:
+            curve: Curve the data belongs to
+            at: Local time of day ("HH:MM" or a datetime.time)
+            delivery_offset: Delivery day minus publication day
+            params: Query parameters besides the dates; enum values are
+                turned into strings
+            timezone: Timezone of `at` (defaults to Europe/Rome)
+        """
+        self.curve = curve
+        self.at = time.fromisoformat(at) if isinstance(at, str) else at
+        self.delivery_offset = delivery_offset
+        self.params = {key: str(value) for key, value in (params or {}).items()}
+        self.timezone = timezone
+
+    @property
+    def name(self) -> str:
+        """Curve and parameters, e.g. "italy_prices:MGP"."""
+        return ":".join([self.curve.value] + list(self.params.values()))
+
+    def published_at(self, delivery_day: date) -> datetime:
+        """Return when the data of a delivery day is usually available."""
+        day = delivery_day - timedelta(days=self.delivery_offset)
+        return datetime.combine(day, self.at, tzinfo=self.timezone)
+
+    def next_after(self, moment: datetime) -> Tuple[datetime, date]:
+        """Return the first publication at or after a moment, with its delivery day.
+
+        Args:
+            moment: Timezone-aware datetime
+        """
+        day = moment.astimezone(self.timezone).date()
+        published = datetime.combine(day, self.at, tzinfo=self.timezone)
+        if published < moment:
+            day += timedelta(days=1)
+            published = datetime.combine(day, self.at, tzinfo=self.timezone)
+        return published, day + timedelta(days=self.delivery_offset)
+
+    def matches(self, curve: Curve, params: Dict[str, Any]) -> bool:
+        """Whether a query for a curve is covered by this publication."""
+        return curve == self.curve and all(
+            str(params.get(key)) == value for key, value in self.params.items())
+
+    def __repr__(self) -> str:
+        return (f"Publication({self.name} at {self.at.strftime('%H:%M')}, "
+                f"delivery_offset={self.delivery_offset})")
+
+
+def _results(curves: Iterable[Curve], market: Market, at: str,
+             delivery_offset: int) -> List[Publication]:
+    return [Publication(curve, at, delivery_offset, {"market": market}) for curve in curves]
+
+
+_AUCTION_CURVES = (Curve.ITALY_PRICES, Curve.ITALY_EXCHANGE_VOLUMES, Curve.ITALY_COMMERCIAL_FLOWS)
+
+# Usual publication times of the curves with a known schedule (Europe/Rome)
+PUBLICATIONS: List[Publication] = [
+    *_results(_AUCTION_CURVES, Market.MGP, "13:00", 1),
+    Publication(Curve.ITALY_DAM_DEMAND_FCS, "13:00", 1),
+    Publication(Curve.SPAIN_PRICES, "13:00", 1, {"market": "MD"}),
+    *_results(_AUCTION_CURVES, Market.MI1, "15:30", 1),
+    *_results(_AUCTION_CURVES, Market.MI2, "22:30", 1),
+    *_results(_AUCTION_CURVES, Market.MI3, "10:30", 0),
+    Publication(Curve.ITALY_IMBALANCE_DATA, "11:00", -1),
+]
+
+
+def publications_for(curves: Optional[Iterable[Curve]] = None,
+                     markets: Optional[Iterable[Union[Market, str]]] = None,
+                     publications: Optional[Iterable[Publication]] = None) -> List[Publication]:
+    """Select publications by curve and market.
+
+    Args:
+        curves: Curves to keep (None keeps all)
+        markets: Markets to keep; publications without a market are kept
+            (None keeps all)
+        publications: Publications to select from (defaults to PUBLICATIONS)
+    """
+    selected = list(PUBLICATIONS if publications is None else publications)
+    if curves is not None:
+        curves = set(curves)
+        selected = [p for p in selected if p.curve in curves]
+    if markets is not None:
+        markets = {str(m) for m in markets}
+        selected = [p for p in selected if p.params.get("market") in markets | {None}]
+    return selected
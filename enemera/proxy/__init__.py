@@ -0,0 +1,7 @@
+"""Local caching proxy shared by every process on a host: enemera-proxy --help"""
+
+from .server import CachingProxy
+
+__all__ = [
+    'CachingProxy'
+]
@@ -0,0 +1,5 @@
+"""Run the caching proxy: python -m enemera.proxy --help"""
+
+from enemera.proxy.server import main
+
+main()
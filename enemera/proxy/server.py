@@ -0,0 +1,370 @@
+"""
+Local caching proxy for the Enemera API.
+
+Every process on a host that points its client's base_url at the proxy
+shares one cache and one upstream rate limit:
+
+- concurrent requests for the same query are coalesced into a single
+  upstream request (single flight), whose answer is sent to every caller
+- answers are cached; after max_age seconds they are revalidated upstream
+  with a conditional GET, which costs the API almost nothing when the data
+  did not change
+- upstream requests go through a shared RateLimiter, so callers wait their
+  turn instead of being answered 429 Too Many Requests
+
+Clients can keep their own cache: the proxy answers their conditional GETs
+with 304 Not Modified. Run it with:
+
+    enemera-proxy --port 8765 --max-age 300 --requests-per-second 5
+
+and create clients with EnemeraClient(base_url="http://127.0.0.1:8765").
+"""
+
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from enemera.cache import make_cache_key
+from enemera.core.constants import BASE_URL
+from enemera.core.exceptions import (
+    APIError,
+    AuthenticationError,
+    CircuitOpenError,
+    ConnectionError,
+    EnemeraError,
+    RateLimitError,
+    TimeoutError
+)
+from enemera.core.ratelimit import RateLimiter
+from enemera.models.curves import ENDPOINT_CURVES
+from enemera.security import SecureSession
+from enemera.utils.logging import logger
+
+# Upstream headers passed on to clients
+_FORWARDED_HEADERS = ("ETag", "Last-Modified", "Content-Type")
+
+
+class _Answer:
+    """An upstream answer as served to clients"""
+
+    def __init__(self, status: int, body: bytes, headers: Dict[str, str]):
+        self.status = status
+        self.body = body
+        self.headers = headers
+        self.stored_at = time.monotonic()
+        self._gzipped: Optional[bytes] = None
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+    def gzipped(self) -> bytes:
+        # Compressed once, on first use, and shared by every client
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=5)
+        return self._gzipped
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating to the owning CachingProxy"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.proxy.handle(self)
+
+    def log_message(self, format, *args):
+        if self.server.proxy.verbose:
+            super().log_message(format, *args)
+
+
+class CachingProxy:
+    """Threaded HTTP server caching and deduplicating calls to the Enemera API.
+
+    Attributes:
+        upstream: Base URL of the API
+        max_age: Seconds an answer is served without revalidation
+        max_entries: Maximum number of answers kept
+        limiter: Rate limit shared by all upstream requests, if any
+        verbose: Whether to log every request to stderr
+
+    Example:
+        >>> with CachingProxy(api_key="...", max_age=300, requests_per_second=5) as proxy:
+        ...     client = EnemeraClient(api_key="...", base_url=proxy.url)
+    """
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 upstream: str = BASE_URL,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 max_age: float = 60,
+                 max_entries: int = 1024,
+                 requests_per_second: Optional[float] = None,
+                 burst: Optional[float] = None,
+                 session: Optional[SecureSession] = None,
+                 verbose: bool = False):
+        """Initialize a new CachingProxy.
+
+        Args:
+            api_key: API key used upstream (defaults to ENEMERA_API_KEY)
+            upstream: Base URL of the API
+            host: Interface to bind (keep the default unless other hosts should
+                use the proxy's API key)
+            port: Port to bind (0 picks a free port)
+            max_age: Seconds an answer is served without revalidation
+            max_entries: Maximum number of answers kept
+            requests_per_second: Upstream rate limit (None disables it)
+            burst: Upstream requests allowed at once after an idle period
+            session: Existing SecureSession to send upstream requests with
+            verbose: Whether to log every request to stderr
+        """
+        self.upstream = upstream.rstrip('/')
+        if session is None:
+            api_key = api_key or os.getenv('ENEMERA_API_KEY')
+            if not api_key:
+                raise ValueError("API key required. Set ENEMERA_API_KEY or pass api_key")
+            session = SecureSession(api_key, self.upstream)
+        self.session = session
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.limiter = RateLimiter(requests_per_second, burst) if requests_per_second else None
+        self.verbose = verbose
+
+        self._answers: "OrderedDict[str, _Answer]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hits": 0, "coalesced": 0, "revalidated": 0,
+                       "upstream_requests": 0, "upstream_errors": 0, "not_modified": 0}
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.proxy = self
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to EnemeraClient"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "CachingProxy":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name="enemera-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "CachingProxy":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters of client requests, cache hits and upstream requests"""
+        with self._lock:
+            return dict(self._stats, entries=len(self._answers))
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    # -- answers ----------------------------------------------------------
+
+    def _cached(self, key: str) -> Optional[_Answer]:
+        with self._lock:
+            answer = self._answers.get(key)
+            if answer is not None:
+                self._answers.move_to_end(key)
+            return answer
+
+    def _store(self, key: str, answer: _Answer) -> None:
+        with self._lock:
+            self._answers[key] = answer
+            self._answers.move_to_end(key)
+            while len(self._answers) > self.max_entries:
+                self._answers.popitem(last=False)
+
+    def answer(self, path: str, params: Dict[str, str]) -> Tuple[_Answer, str]:
+        """Return the answer to a query, from the cache or upstream.
+
+        Returns:
+            (answer, outcome): outcome is "hit", "revalidated", "miss" or
+            "coalesced" (another caller's upstream request was shared)
+        """
+        key = make_cache_key(path, params)
+        cached = self._cached(key)
+        if cached is not None and cached.age < self.max_age:
+            self._count("hits")
+            return cached, "hit"
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            self._count("coalesced")
+            return future.result(), "coalesced"
+
+        try:
+            answer, outcome = self._fetch(key, path, params, cached)
+            future.set_result(answer)
+            return answer, outcome
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _fetch(self, key: str, path: str, params: Dict[str, str],
+               cached: Optional[_Answer]) -> Tuple[_Answer, str]:
+        headers = {}
+        if cached is not None:
+            if "ETag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+
+        if self.limiter is not None:
+            self.limiter.acquire()
+        self._count("upstream_requests")
+        try:
+            response = self.session.make_request('GET', f"{self.upstream}{path}", params=params,
+                                                 headers=headers or None)
+        except EnemeraError:
+            self._count("upstream_errors")
+            raise
+
+        if response.status_code == 304 and cached is not None:
+            self._count("revalidated")
+            cached.stored_at = time.monotonic()
+            return cached, "revalidated"
+
+        answer = _Answer(response.status_code, response.content,
+                         {name: response.headers[name] for name in _FORWARDED_HEADERS
+                          if name in response.headers})
+        self._store(key, answer)
+        return answer, "miss"
+
+    # -- HTTP -------------------------------------------------------------
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Answer a single GET request."""
+        parts = urlsplit(request.path)
+        path = parts.path.rstrip("/")
+        self._count("requests")
+        if path not in ENDPOINT_CURVES:
+            return self._send_error(request, 404, "Not Found")
+
+        try:
+            answer, outcome = self.answer(path, dict(parse_qsl(parts.query)))
+        except Exception as e:
+            status, detail = self._error_status(e)
+            logger.warning(f"Upstream request failed for {path}", status=status, error=str(e))
+            return self._send_error(request, status, detail)
+
+        etag = answer.headers.get("ETag")
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            self._count("not_modified")
+            request.send_response(304)
+            request.send_header("ETag", etag)
+            request.send_header("X-Enemera-Proxy", outcome)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        body = answer.body
+        headers = dict(answer.headers)
+        if "gzip" in request.headers.get("Accept-Encoding", "") and len(body) > 512:
+            body = answer.gzipped()
+            headers["Content-Encoding"] = "gzip"
+        headers["X-Enemera-Proxy"] = outcome
+        self._send(request, answer.status, body, headers)
+
+    @staticmethod
+    def _error_status(error: Exception) -> Tuple[int, str]:
+        if isinstance(error, AuthenticationError):
+            return 502, "Upstream rejected the proxy's API key"
+        if isinstance(error, RateLimitError):
+            return 429, "Upstream rate limit exceeded"
+        if isinstance(error, APIError):
+            return error.status_code, error.message
+        if isinstance(error, CircuitOpenError):
+            return 503, "Upstream unavailable, circuit open"
+        if isinstance(error, TimeoutError):
+            return 504, "Upstream timed out"
+        if isinstance(error, ConnectionError):
+            return 502, "Upstream unreachable"
+        return 502, "Upstream request failed"
+
+    def _send_error(self, request, status: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        self._send(request, status, body, {"Content-Type": "application/json"})
+
+    @staticmethod
+    def _send(request, status: int, body: bytes, headers: Dict[str, Any]) -> None:
+        request.send_response(status)
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def main(argv=None) -> None:
+    """Run the caching proxy from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="enemera-proxy",
+        description="Local caching proxy for the Enemera API, shared by every process on a host")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--upstream", default=BASE_URL, help="Base URL of the API")
+    parser.add_argument("--api-key", default=None, help="API key (defaults to ENEMERA_API_KEY)")
+    parser.add_argument("--max-age", type=float, default=60,
+                        help="Seconds an answer is served without revalidation")
+    parser.add_argument("--max-entries", type=int, default=1024)
+    parser.add_argument("--requests-per-second", type=float, default=None,
+                        help="Upstream rate limit shared by all clients")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    proxy = CachingProxy(api_key=args.api_key, upstream=args.upstream, host=args.host,
+                         port=args.port, max_age=args.max_age, max_entries=args.max_entries,
+                         requests_per_second=args.requests_per_second, burst=args.burst,
+                         verbose=not args.quiet)
+    print(f"Enemera caching proxy for {proxy.upstream} listening on {proxy.url}")
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
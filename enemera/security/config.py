@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from enemera.core.exceptions import ConfigurationError
 from enemera.security.validators import validate_api_key
@@ -27,16 +27,32 @@ class SecureConfig:
         config['base_url'] = base_url
 
         # Timeout settings
+        config['timeout'] = SecureConfig.load_timeout()
+
+        return config
+
+    @staticmethod
+    def load_timeout(default: Optional[int] = 30) -> Optional[int]:
+        """Load the request timeout from the ENEMERA_TIMEOUT environment variable
+
+        Args:
+            default: Timeout returned when ENEMERA_TIMEOUT is not set
+
+        Returns:
+            Timeout in seconds
+        """
+        value = os.getenv('ENEMERA_TIMEOUT')
+        if value is None:
+            return default
+
         try:
-            timeout = int(os.getenv('ENEMERA_TIMEOUT', '30'))
+            timeout = int(value)
             if timeout < 1 or timeout > 300:
                 raise ValueError("Timeout must be between 1-300 seconds")
-            config['timeout'] = timeout
+            return timeout
         except ValueError as e:
             raise ConfigurationError(f"Invalid timeout configuration: {e}")
 
-        return config
-
     @staticmethod
     def load_from_file(config_path: Path) -> Dict[str, Any]:
         """Load configuration from secure file"""
@@ -1,97 +1,373 @@
-import logging
-import re
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-from enemera.core.exceptions import AuthenticationError, RateLimitError, APIError
+from enemera.core.breaker import CircuitBreaker, is_failure
+from enemera.core.compression import StreamDecoder, TransferStats, accept_encoding_header
+from enemera.core.deadline import current_deadline
+from enemera.core.hedging import HedgingPolicy
+from enemera.core.hooks import (
+    HookManager,
+    RequestEvent,
+    RequestHook,
+    current_event,
+    make_hook_manager,
+    track
+)
+from enemera.core.exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    APIError,
+    ConnectionError,
+    TimeoutError,
+    RetryError
+)
 from enemera.security.validators import validate_api_key
+from enemera.utils.logging import install_redaction_filter, logger
+from enemera.transport import Transport, create_transport
+
+# Default (connect, read) timeout in seconds
+DEFAULT_TIMEOUT = (10, 30)
 
 
 class SecureSession:
     """Secure session management with API key protection"""
 
-    def __init__(self, api_key: str, base_url: str):
-        self.session = requests.Session()
+    def __init__(self, api_key: str, base_url: str,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 hedging: Optional[HedgingPolicy] = None,
+                 transport: Union[str, Transport, None] = None,
+                 hooks: Union[HookManager, Iterable[RequestHook], None] = None,
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize a secure session
+
+        Args:
+            api_key: API key used for bearer authentication
+            base_url: API base URL
+            timeout: Read timeout in seconds, or a (connect, read) tuple.
+                Defaults to DEFAULT_TIMEOUT.
+            hedging: Optional policy for hedging slow GET requests
+            transport: HTTP backend: "requests" (default), "httpx", "http2",
+                or a Transport instance
+            hooks: Lifecycle hooks notified of every request
+            breaker: Optional circuit breaker failing calls to an endpoint
+                fast after repeated failures
+        """
+        self.transport = create_transport(transport)
+        self.hooks = make_hook_manager(hooks)
+        self.timeout = self._normalize_timeout(timeout)
+        self.hedging = hedging
+        self.breaker = breaker
+        self.transfer_stats = TransferStats()
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
         self._setup_security(api_key, base_url)
         self._setup_logging()
 
+    @property
+    def session(self):
+        """The underlying requests.Session when using the requests transport"""
+        return getattr(self.transport, 'session', None)
+
+    @staticmethod
+    def _normalize_timeout(timeout: Optional[Union[float, Tuple[float, float]]]) -> Tuple[float, float]:
+        """Turn a timeout setting into a (connect, read) tuple"""
+        if timeout is None:
+            return DEFAULT_TIMEOUT
+        if isinstance(timeout, tuple):
+            return timeout
+        # A single value is the read timeout; connecting should never take longer
+        return (min(DEFAULT_TIMEOUT[0], timeout), timeout)
+
     def _setup_security(self, api_key: str, base_url: str):
         """Configure secure session settings"""
 
         # Validate API key
         validated_key = validate_api_key(api_key)
 
-        # Set headers securely
-        self.session.headers.update({
+        # Set headers securely. SSL verification and retries with backoff are
+        # configured by the transport; timeouts are applied per request.
+        self.transport.update_headers({
             "Authorization": f"Bearer {validated_key}",
             "Content-Type": "application/json",
+            "Accept-Encoding": accept_encoding_header(),
         })
 
-        # Configure SSL verification
-        self.session.verify = True
+    def _setup_logging(self):
+        """Configure secure logging that doesn't expose credentials"""
+        # The filter is shared by all sessions and installed only once
+        install_redaction_filter()
 
-        # Configure timeouts
-        self.session.timeout = (10, 30)  # (connect, read)
+    def make_request(self, method: str, url: str,
+                     params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None,
+                     timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                     stream: bool = False, **kwargs):
+        """Make secure HTTP request with error handling
 
-        # Configure retries with backoff
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
+        The request uses the session timeout unless a timeout is passed
+        explicitly. When a deadline is active, the timeout is capped by the
+        remaining budget and the request fails fast once it has run out.
+        Other keyword arguments (e.g., json, data, allow_redirects) are passed
+        on to the transport.
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        Timings are added to the RequestEvent of the calling client. Requests
+        made directly on the session get an event of their own.
+        """
+        if current_event() is not None:
+            return self._make_request(method, url, params, headers, timeout, stream, **kwargs)
 
-    def _setup_logging(self):
-        """Configure secure logging that doesn't expose credentials"""
+        event = RequestEvent.from_url(method, url, params, self.hooks)
+        with track(event):
+            event.emit("on_request_start")
+            try:
+                return self._make_request(method, url, params, headers, timeout, stream,
+                                          **kwargs)
+            except Exception as e:
+                event.error = e
+                event.emit("on_error", e)
+                raise
 
-        # Custom log filter to remove sensitive data
-        class SensitiveDataFilter(logging.Filter):
-            def filter(self, record):
-                if hasattr(record, 'msg'):
-                    # Remove API keys from log messages
-                    record.msg = re.sub(
-                        r'Bearer [a-zA-Z0-9-_]{20,}',
-                        'Bearer ***REDACTED***',
-                        str(record.msg)
-                    )
-                return True
-
-        # Apply filter to requests logger
-        requests_logger = logging.getLogger('requests')
-        requests_logger.addFilter(SensitiveDataFilter())
-
-        # Apply filter to urllib3 logger
-        urllib3_logger = logging.getLogger('urllib3')
-        urllib3_logger.addFilter(SensitiveDataFilter())
-
-    def make_request(self, method: str, url: str, **kwargs):
-        """Make secure HTTP request with error handling"""
+    def _make_request(self, method: str, url: str, params, headers, timeout, stream: bool,
+                      **kwargs):
+        """Apply the deadline and send the request, hedged if configured"""
+        deadline = current_deadline()
+        if timeout is None:
+            timeout = self.timeout
+        if deadline is not None:
+            deadline.check()
+            timeout = deadline.cap_timeout(timeout)
+
+        if self.breaker is None:
+            return self._send_within_deadline(method, url, params, headers, timeout, stream,
+                                              deadline, **kwargs)
+
+        endpoint = urlsplit(url).path
+        self._breaker_changed(endpoint, self.breaker.before_request(endpoint))
+        record = None
         try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response
-
-        except requests.exceptions.Timeout:
-            raise ConnectionError("Request timed out")
-
-        except requests.exceptions.SSLError:
-            raise ConnectionError("SSL verification failed")
-
-        except requests.exceptions.ConnectionError:
-            raise ConnectionError("Failed to connect to API")
-
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                raise AuthenticationError("Invalid API key or unauthorized access")
-            elif e.response.status_code == 403:
-                raise AuthenticationError("API key does not have required permissions")
-            elif e.response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded")
+            response = self._send_within_deadline(method, url, params, headers, timeout,
+                                                  stream, deadline, **kwargs)
+            record = self.breaker.record_success
+        except Exception as e:
+            # A 4xx is still an answer: the API is available, only not with what was asked for
+            record = self.breaker.record_failure if is_failure(e) else self.breaker.record_success
+            raise
+        finally:
+            if record is None:
+                # Interrupted (e.g., KeyboardInterrupt): free the probe slot for the next call
+                self.breaker.release(endpoint)
             else:
-                raise APIError(e.response.status_code, str(e))
+                self._breaker_changed(endpoint, record(endpoint))
+        return response
+
+    def _send_within_deadline(self, method: str, url: str, params, headers, timeout,
+                              stream: bool, deadline, **kwargs):
+        """Send the request, reporting a failure past the deadline as a timeout"""
+        try:
+            if self.hedging is not None and method.upper() == 'GET' and not stream:
+                return self._send_hedged(method, url, params, headers, timeout, **kwargs)
+            return self._send(method, url, params, headers, timeout, stream, **kwargs)
+
+        except (ConnectionError, RetryError):
+            if deadline is not None and deadline.expired:
+                raise TimeoutError(f"Deadline of {deadline.seconds}s exceeded",
+                                   timeout_value=deadline.seconds)
+            raise
+
+    def _breaker_changed(self, endpoint: str, change) -> None:
+        """Tell the hooks of the current call that a circuit changed state"""
+        if change is None:
+            return
+        previous, state = change
+        log = logger.info if state == "closed" else logger.warning
+        log(f"Circuit for {endpoint} is now {state}", previous=previous)
+        event = current_event()
+        if event is not None:
+            event.emit("on_breaker", {"endpoint": endpoint, "state": state,
+                                      "previous": previous})
+
+    @staticmethod
+    def _raise_for_status(response) -> None:
+        """Map an HTTP error status to the matching Enemera exception"""
+        status_code = response.status_code
+        if status_code < 400:
+            return
+        if status_code == 401:
+            raise AuthenticationError("Invalid API key or unauthorized access")
+        elif status_code == 403:
+            raise AuthenticationError("API key does not have required permissions")
+        elif status_code == 429:
+            raise RateLimitError("Rate limit exceeded")
+        else:
+            kind = "Client" if status_code < 500 else "Server"
+            reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', '')
+            raise APIError(status_code, f"{status_code} {kind} Error: {reason} for url: {response.url}")
+
+    def _send(self, method: str, url: str, params, headers, timeout, stream: bool = False,
+              **kwargs):
+        """Send a single request and raise on HTTP error status
+
+        The body is always streamed from the connection so that it can be
+        decoded here and its wire size accounted for. Unless the caller asked
+        for a streaming response, the decoded body is read before returning.
+        """
+        start = time.monotonic()
+        response = self._send_for_headers(method, url, params, headers, timeout, **kwargs)
+        return self._complete(response, url, start, stream)
+
+    def _send_for_headers(self, method: str, url: str, params, headers, timeout, **kwargs):
+        """Send a request and return as soon as its response headers arrived"""
+        event = current_event()
+        connect_before = event.timings.get("connect", 0.0) if event is not None else 0.0
+        start = time.monotonic()
+        response = self.transport.send(method, url, params=params, headers=headers,
+                                       timeout=timeout, **kwargs)
+        if event is not None:
+            # Time to the response headers, less any time spent connecting
+            connect = event.timings.get("connect", 0.0) - connect_before
+            event.add_timing("wait", max(0.0, time.monotonic() - start - connect))
+        return response
+
+    def _complete(self, response, url: str, start: float, stream: bool):
+        """Read the body unless streaming, report the response and raise on HTTP error status"""
+        event = current_event()
+        if not stream:
+            self.transport.set_body(response, b"".join(self.iter_content(response)))
+        if event is not None:
+            event.status_code = response.status_code
+            event.emit("on_response")
+        self._raise_for_status(response)
+        if self.hedging is not None:
+            self.hedging.latencies.record(urlsplit(url).path, time.monotonic() - start)
+        return response
+
+    def _send_copy(self, method: str, url: str, params, headers, timeout, **kwargs):
+        """Send one copy of a hedged request up to its response headers
+
+        The copy is measured on an event of its own, without hooks, so that
+        only the copy that wins is reported on the call's event.
+        """
+        scratch = RequestEvent.from_url(method, url, params)
+        start = time.monotonic()
+        with track(scratch):
+            response = self._send_for_headers(method, url, params, headers, timeout, **kwargs)
+        return response, scratch, start
+
+    def _send_hedged(self, method: str, url: str, params, headers, timeout, **kwargs):
+        """Send a request, duplicating it if it is slower than the hedge delay
+
+        Whichever copy receives its response headers first wins; only its
+        body is read, and the other copy's connection is closed. An HTTP
+        error status is a final answer from the API, while a connection
+        failure of one copy still leaves the other one a chance to succeed.
+        """
+        policy = self.hedging
+        policy.record_request()
+        delay = policy.hedge_delay(urlsplit(url).path)
+        if delay is None:
+            return self._send(method, url, params, headers, timeout, **kwargs)
+
+        executor = self._get_hedge_executor()
+        # Each copy runs in its own copy of the context, so an active deadline
+        # still applies inside the worker threads
+        primary = executor.submit(contextvars.copy_context().run,
+                                  self._send_copy, method, url, params, headers, timeout,
+                                  **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done or not policy.try_acquire():
+            return self._complete_copy(primary.result(), url)
+
+        hedge = executor.submit(contextvars.copy_context().run,
+                                self._send_copy, method, url, params, headers, timeout,
+                                **kwargs)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None or not isinstance(error, ConnectionError):
+                    for loser in pending:
+                        loser.add_done_callback(self._close_response)
+                    if future is hedge and error is None:
+                        policy.record_hedge_win()
+                    return self._complete_copy(future.result(), url)
+        raise error
+
+    def _complete_copy(self, sent, url: str):
+        """Report the winning copy of a hedged request on the call's event and read its body"""
+        response, scratch, start = sent
+        event = current_event()
+        if event is not None:
+            for stage, seconds in scratch.timings.items():
+                event.add_timing(stage, seconds)
+            event.retries += scratch.retries
+        return self._complete(response, url, start, stream=False)
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool for hedged requests on first use"""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.hedging.max_workers,
+                    thread_name_prefix="enemera-hedge"
+                )
+            return self._hedge_executor
+
+    def _close_response(self, future) -> None:
+        """Release the connection held by a request that lost the race"""
+        if not future.cancelled() and future.exception() is None:
+            response, _, _ = future.result()
+            self.transport.close_response(response)
+
+    def iter_content(self, response, chunk_size: int = 64 * 1024):
+        """Iterate over the decoded body of a streaming response
+
+        The body is read from the wire as sent by the server and decompressed
+        here, so the wire and decoded sizes are recorded in transfer_stats
+        once the body has been fully read.
+
+        Args:
+            response: Response returned by make_request(..., stream=True)
+            chunk_size: Number of wire bytes read per iteration
+
+        Yields:
+            bytes: Decoded chunks of the response body
+        """
+        decoder = StreamDecoder(response.headers.get('Content-Encoding'))
+        wire_bytes = 0
+        decoded_bytes = 0
+        decompress_time = 0.0
+        started = time.perf_counter()
+        for chunk in self.transport.iter_raw(response, chunk_size):
+            wire_bytes += len(chunk)
+            decode_start = time.perf_counter()
+            data = decoder.decompress(chunk)
+            decompress_time += time.perf_counter() - decode_start
+            if data:
+                decoded_bytes += len(data)
+                yield data
+        data = decoder.flush()
+        if data:
+            decoded_bytes += len(data)
+            yield data
+        self.transfer_stats.record(urlsplit(self.transport.response_url(response)).path,
+                                   wire_bytes, decoded_bytes, decoder.encoding)
+
+        event = current_event()
+        if event is not None:
+            event.add_timing("download", time.perf_counter() - started - decompress_time)
+            event.add_timing("decompress", decompress_time)
+            event.wire_bytes += wire_bytes
+            event.decoded_bytes += decoded_bytes
+
+    def close(self) -> None:
+        """Close the transport and the hedging thread pool"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self.transport.close()
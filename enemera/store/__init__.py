@@ -0,0 +1,8 @@
+# enemera/store/__init__.py
+"""Local Parquet mirror of curve data"""
+
+from .parquet import ParquetStore
+
+__all__ = [
+    'ParquetStore'
+]
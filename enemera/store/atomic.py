@@ -0,0 +1,22 @@
+"""Atomic file writes for the local store"""
+
+import os
+import pathlib
+import uuid
+
+
+def write_atomic(path: pathlib.Path, write) -> None:
+    """Write a file through a temporary name in the same directory.
+
+    Args:
+        path: Final path of the file
+        write: Function writing the file to the path it is given
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
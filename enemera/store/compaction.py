@@ -0,0 +1,77 @@
+"""
+Compaction of the local Parquet store.
+
+Every sync writes a new file per month it touches, so a store synced daily
+ends up with one small file per day and partition. Compaction merges the
+files of each month into a single file whose rows are deduplicated by their
+natural key, sorted by utc and written in row groups, so engines can skip
+row groups by their utc and delivery_date statistics.
+
+Syncing already removes refreshed days from older files; deduplicating here
+also cleans up after a sync that was interrupted between writing a new
+revision and updating the manifest.
+"""
+
+from typing import List
+
+# Rows per row group of compacted files
+ROW_GROUP_SIZE = 128 * 1024
+
+# Columns identifying a row besides utc are its string columns, except these
+_NON_KEY_COLUMNS = ("utc", "delivery_date")
+
+
+def natural_key(schema) -> List[str]:
+    """Return the columns identifying a row: utc and the string columns (zone, market, ...)."""
+    import pyarrow as pa
+    return ["utc"] + [field.name for field in schema
+                      if field.name not in _NON_KEY_COLUMNS
+                      and (pa.types.is_string(field.type) or pa.types.is_large_string(field.type))]
+
+
+def concat(tables: list):
+    """Concatenate tables whose schemas may differ by all-null columns"""
+    import pyarrow as pa
+    try:
+        return pa.concat_tables(tables, promote_options="default")
+    except TypeError:
+        # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def deduplicate(table, key: List[str]):
+    """Keep one row per natural key.
+
+    Final rows (more is_final_* flags set) win over provisional ones; among
+    equally final rows the one further down the table wins, so rows of
+    later revisions must come after earlier ones.
+
+    Returns:
+        The remaining rows, sorted by the key
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = table.column_names
+    finality = pa.array([0] * table.num_rows, pa.int64())
+    for name in columns:
+        if name.startswith("is_final"):
+            flags = pc.cast(pc.fill_null(table[name], False), pa.int64())
+            finality = pc.add(finality, flags)
+    ranked = (table
+              .append_column("__final", finality)
+              .append_column("__row", pa.array(range(table.num_rows), pa.int64()))
+              .sort_by([(k, "ascending") for k in key]
+                       + [("__final", "descending"), ("__row", "descending")]))
+    ranked = ranked.append_column("__rank", pa.array(range(ranked.num_rows), pa.int64()))
+    # The best ranked row of each key group is the first one of the group
+    winners = ranked.group_by(key).aggregate([("__rank", "min")])["__rank_min"]
+    return ranked.take(pc.take(winners, pc.sort_indices(winners))).select(columns)
+
+
+def merge(paths: list):
+    """Read Parquet files (oldest first) into one deduplicated table sorted by utc."""
+    import pyarrow.parquet as pq
+    table = concat([pq.read_table(path, partitioning=None) for path in paths])
+    # The key starts with utc, so the rows come out sorted by utc
+    return deduplicate(table, natural_key(table.schema))
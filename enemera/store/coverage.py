@@ -0,0 +1,191 @@
+"""
+Coverage index of locally stored curve data.
+
+For every curve and filter combination the index keeps two per-day bitmaps:
+the days that were fetched and the days whose data is final. Bitmaps are
+Python integers with one bit per day since 1970-01-01, so answering "which
+parts of this range are missing?" is a handful of big-integer operations
+per missing range, even over decades of history. The whole index is a small
+JSON file stored next to the data it describes.
+"""
+
+import base64
+import json
+import pathlib
+import threading
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+from enemera.store.atomic import write_atomic
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+DateRange = Tuple[date, date]
+
+
+def _bit(day: date) -> int:
+    return day.toordinal() - _EPOCH
+
+
+def _day(bit: int) -> date:
+    return date.fromordinal(bit + _EPOCH)
+
+
+def _range_mask(start: date, end: date) -> int:
+    """Bitmap with the days from start to end (inclusive) set"""
+    first = _bit(start)
+    if first < 0:
+        raise ValueError(f"Dates before 1970-01-01 are not supported: {start}")
+    return ((1 << (_bit(end) - first + 1)) - 1) << first
+
+
+def bitmap_ranges(bits: int) -> List[DateRange]:
+    """Return the runs of set bits of a day bitmap as (first, last) date ranges."""
+    ranges = []
+    while bits:
+        low = bits & -bits
+        start = low.bit_length() - 1
+        # Adding the lowest set bit carries through the run, setting the bit after it
+        carried = bits + low
+        end = (carried & -carried).bit_length() - 1
+        ranges.append((_day(start), _day(end - 1)))
+        bits &= ~((1 << end) - 1)
+    return ranges
+
+
+def _encode(bits: int) -> str:
+    return base64.b64encode(bits.to_bytes((bits.bit_length() + 7) // 8, "little")).decode()
+
+
+def _decode(text: str) -> int:
+    return int.from_bytes(base64.b64decode(text), "little")
+
+
+class CoverageIndex:
+    """Per-day bitmaps of fetched and final data, per curve and filter combination.
+
+    Keys identify a curve and its filters, e.g. "italy_prices/market=MGP/area=all".
+
+    Example:
+        >>> coverage = CoverageIndex("~/enemera-data/_coverage.json")
+        >>> coverage.mark("italy_prices/market=MGP/area=all", date(2023, 1, 1), date(2023, 12, 31))
+        >>> coverage.missing("italy_prices/market=MGP/area=all", date(2023, 3, 1), date(2024, 1, 5))
+        [(datetime.date(2024, 1, 1), datetime.date(2024, 1, 5))]
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path, None] = None):
+        """Initialize a new CoverageIndex.
+
+        Args:
+            path: JSON file the index is loaded from and saved to (None keeps it in memory)
+        """
+        self.path = pathlib.Path(path).expanduser() if path is not None else None
+        self._fetched: Dict[str, int] = {}
+        self._final: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+            for key, entry in data.items():
+                self._fetched[key] = _decode(entry["fetched"])
+                self._final[key] = _decode(entry["final"])
+
+    def keys(self) -> List[str]:
+        """Return the keys with recorded coverage."""
+        with self._lock:
+            return list(self._fetched)
+
+    def mark(self, key: str, start: date, end: date, final: bool = True,
+             save: bool = True) -> None:
+        """Record the days from start to end (inclusive) as fetched.
+
+        Args:
+            key: Curve and filter combination
+            start: First day
+            end: Last day
+            final: Whether the data of these days is final; False clears the
+                final bit, so the days are fetched again
+            save: Write the index to its file afterwards
+        """
+        mask = _range_mask(start, end)
+        with self._lock:
+            self._fetched[key] = self._fetched.get(key, 0) | mask
+            final_bits = self._final.get(key, 0)
+            self._final[key] = final_bits | mask if final else final_bits & ~mask
+        if save:
+            self.save()
+
+    def mark_days(self, key: str, days: Dict[date, bool], save: bool = True) -> None:
+        """Record single days as fetched, each with its own finality."""
+        fetched = final = not_final = 0
+        for day, is_final in days.items():
+            bit = 1 << _bit(day)
+            fetched |= bit
+            if is_final:
+                final |= bit
+            else:
+                not_final |= bit
+        with self._lock:
+            self._fetched[key] = self._fetched.get(key, 0) | fetched
+            self._final[key] = (self._final.get(key, 0) | final) & ~not_final
+        if save:
+            self.save()
+
+    def covered(self, key: str, day: date, final: bool = False) -> bool:
+        """Whether a day was fetched (and, with final=True, is final)."""
+        bitmap = self._final if final else self._fetched
+        return bool(bitmap.get(key, 0) >> _bit(day) & 1)
+
+    def missing(self, key: str, start: date, end: date, final: bool = True) -> List[DateRange]:
+        """Return the minimal list of date ranges not covered within a range.
+
+        Args:
+            key: Curve and filter combination
+            start: First day of the range
+            end: Last day of the range (inclusive)
+            final: Also treat days that were fetched but are not final as missing
+
+        Returns:
+            Sorted, non-overlapping (first, last) ranges; empty if fully covered
+        """
+        if end < start:
+            return []
+        bitmap = (self._final if final else self._fetched).get(key, 0)
+        return bitmap_ranges(_range_mask(start, end) & ~bitmap)
+
+    def ranges(self, key: str, final: bool = False) -> List[DateRange]:
+        """Return the covered date ranges of a key."""
+        bitmap = (self._final if final else self._fetched).get(key, 0)
+        return bitmap_ranges(bitmap)
+
+    def forget(self, key: str, save: bool = True) -> None:
+        """Drop all coverage of a key."""
+        with self._lock:
+            self._fetched.pop(key, None)
+            self._final.pop(key, None)
+        if save:
+            self.save()
+
+    def save(self) -> None:
+        """Write the index to its file (atomically)."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {key: {"fetched": _encode(bits), "final": _encode(self._final.get(key, 0))}
+                    for key, bits in self._fetched.items()}
+
+        def write(tmp):
+            with open(tmp, "w") as f:
+                json.dump(data, f, separators=(",", ":"), sort_keys=True)
+        write_atomic(self.path, write)
+
+    @staticmethod
+    def split(ranges: List[DateRange], step_days: int) -> List[DateRange]:
+        """Split ranges into pieces of at most step_days days."""
+        pieces = []
+        for start, end in ranges:
+            while start <= end:
+                piece_end = min(start + timedelta(days=step_days - 1), end)
+                pieces.append((start, piece_end))
+                start = piece_end + timedelta(days=1)
+        return pieces
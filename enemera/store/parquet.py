@@ -0,0 +1,472 @@
+"""
+Local Parquet mirror of curve data.
+
+A ParquetStore keeps one Hive-partitioned Parquet dataset per curve:
+
+    <root>/<curve>/<filter>=<value>/.../year=<yyyy>/month=<mm>/part-*.parquet
+
+Filters are the parameters of the curve besides the dates, in the order of
+the curve client's get() signature; a filter that was not given is stored as
+"all". Every row gets a delivery_date column (the delivery day in Italian
+time), so any Arrow-based engine (pyarrow.dataset, polars, DuckDB) can query
+the mirror directly with partition and range pruning.
+
+A manifest next to each partition records, per delivery day, which file holds
+its rows and whether the data is final. A coverage index at the root (see
+enemera.store.coverage) holds the same per-day state as bitmaps, from which
+the days that are missing or not final yet are computed. Syncing fetches
+only those. Files are written to a temporary name and
+renamed into place, and the manifest is replaced last, so an interrupted sync
+never leaves a partially written file behind. compact() merges the small
+files of each month written by successive syncs (see enemera.store.compaction).
+"""
+
+import inspect
+import json
+import pathlib
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from dateutil import tz
+
+from enemera.core.exceptions import DependencyError
+from enemera.models.curves import Curve, is_final
+# Revision windows, importable from here as before
+from enemera.models.curves import DEFAULT_FINALITY_DAYS, FINALITY_DAYS  # noqa: F401
+from enemera.store.atomic import write_atomic
+from enemera.store.compaction import ROW_GROUP_SIZE, merge
+from enemera.store.coverage import CoverageIndex
+from enemera.utils.logging import logger
+
+MARKET_TZ = tz.gettz("Europe/Rome")
+
+MANIFEST = "_manifest.json"
+COVERAGE = "_coverage.json"
+
+# Value of a filter that was not given (the API returns every value)
+ALL = "all"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise DependencyError("pyarrow", "store curve data as Parquet",
+                              "pip install enemera[parquet]")
+    return pyarrow
+
+
+def _filter_value(value: Any) -> str:
+    if value is None:
+        return ALL
+    if isinstance(value, Enum):
+        value = value.value
+    return quote(str(value), safe="")
+
+
+def delivery_date(utc: datetime) -> date:
+    """Return the delivery day (in Italian time) of a UTC timestamp."""
+    return utc.astimezone(MARKET_TZ).date()
+
+
+class ParquetStore:
+    """Partitioned Parquet mirror of curve data with per-day sync state.
+
+    Writes to one partition (curve and filters) must come from a single
+    process at a time; reads are always safe.
+
+    Example:
+        >>> store = ParquetStore("~/enemera-data")
+        >>> store.sync(client, Curve.ITALY_PRICES, date_from="2015-01-01", market="MGP")
+        {'fetched_days': 3653, 'skipped_days': 0, 'rows': 876720, 'files': 121}
+        >>> store.read(Curve.ITALY_PRICES, "2024-01-01", "2024-01-31", market="MGP", area="NORD")
+    """
+
+    def __init__(self, root: Union[str, pathlib.Path]):
+        """Initialize a new ParquetStore.
+
+        Args:
+            root: Directory holding the datasets (created on first write)
+        """
+        self.root = pathlib.Path(root).expanduser()
+        self._lock = threading.Lock()
+        self._coverage: Optional[CoverageIndex] = None
+
+    @property
+    def coverage(self) -> CoverageIndex:
+        """Coverage index of the store, rebuilt from the manifests if missing."""
+        if self._coverage is None:
+            path = self.root / COVERAGE
+            rebuild = not path.exists()
+            self._coverage = CoverageIndex(path)
+            if rebuild:
+                self._rebuild_coverage()
+        return self._coverage
+
+    def _rebuild_coverage(self) -> None:
+        manifests = list(self.root.glob(f"*/**/{MANIFEST}"))
+        for manifest_path in manifests:
+            days = json.loads(manifest_path.read_text())["days"]
+            self._coverage.mark_days(
+                self.key(manifest_path.parent),
+                {date.fromisoformat(d): entry["final"] for d, entry in days.items()},
+                save=False)
+        if manifests:
+            self._coverage.save()
+
+    def key(self, partition: pathlib.Path) -> str:
+        """Return the coverage key of a partition (its path below the root)."""
+        return partition.relative_to(self.root).as_posix()
+
+    # -- layout -----------------------------------------------------------
+
+    @staticmethod
+    def filter_names(client, curve: Curve) -> List[str]:
+        """Return the filters a curve accepts, in partitioning order."""
+        signature = inspect.signature(client.curve_method(curve))
+        return [name for name in signature.parameters if name not in ("date_from", "date_to")]
+
+    def partition(self, curve: Curve, filters: Dict[str, Any],
+                  names: Optional[Iterable[str]] = None) -> pathlib.Path:
+        """Return the directory holding a curve's data for a set of filters.
+
+        Args:
+            curve: The curve
+            filters: Filter values; missing ones are stored as "all"
+            names: Filter names in partitioning order (defaults to the sorted
+                names of the given filters)
+        """
+        path = self.root / curve.value
+        for name in (names if names is not None else sorted(filters)):
+            path = path / f"{name}={_filter_value(filters.get(name))}"
+        return path
+
+    # -- manifest ---------------------------------------------------------
+
+    def load_manifest(self, partition: pathlib.Path) -> Dict[str, Any]:
+        """Return the sync state of a partition (empty if never synced)."""
+        path = partition / MANIFEST
+        if not path.exists():
+            return {"days": {}}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_manifest(self, partition: pathlib.Path, manifest: Dict[str, Any]) -> None:
+        def write(tmp):
+            with open(tmp, "w") as f:
+                json.dump(manifest, f, separators=(",", ":"), sort_keys=True)
+        write_atomic(partition / MANIFEST, write)
+
+    def missing(self, partition: pathlib.Path, start: date, end: date,
+                step_days: Optional[int] = None) -> List[Tuple[date, date]]:
+        """Return the date ranges of a partition that are missing or not final yet.
+
+        Args:
+            partition: Partition directory (see partition())
+            start: First day
+            end: Last day (inclusive)
+            step_days: Split the ranges into pieces of at most this many days
+        """
+        ranges = self.coverage.missing(self.key(partition), start, end)
+        return CoverageIndex.split(ranges, step_days) if step_days else ranges
+
+    # -- sync -------------------------------------------------------------
+
+    def sync(self, client, curve: Curve,
+             date_from: Union[str, date, datetime],
+             date_to: Union[str, date, datetime, None] = None,
+             step_days: int = 30,
+             **filters) -> Dict[str, int]:
+        """Bring the local copy of a curve up to date.
+
+        Only days that are missing or not final yet are requested, in ranges
+        of at most step_days days.
+
+        Args:
+            client: EnemeraClient used to fetch the data
+            curve: The curve to sync
+            date_from: First delivery day to keep locally
+            date_to: Last delivery day (defaults to tomorrow, whose day-ahead
+                data may already be published)
+            step_days: Maximum number of days per request
+            **filters: Curve filters (e.g., market="MGP", area="NORD")
+
+        Returns:
+            Counts of fetched and skipped days, rows and files written
+        """
+        _import_pyarrow()
+        names = self.filter_names(client, curve)
+        unknown = set(filters) - set(names)
+        if unknown:
+            raise ValueError(f"Unknown filters for {curve.value}: {', '.join(sorted(unknown))}")
+
+        start = datetime.strptime(client._format_date(date_from), '%Y-%m-%d').date()
+        end = (datetime.strptime(client._format_date(date_to), '%Y-%m-%d').date()
+               if date_to is not None else date.today() + timedelta(days=1))
+        partition = self.partition(curve, filters, names)
+
+        client_store = getattr(client, "store", None)
+        if client_store is not None and client_store is not self:
+            raise ValueError("The client already writes to another store; "
+                             "sync through client.sync() instead")
+
+        result = {"fetched_days": 0, "skipped_days": (end - start).days + 1,
+                  "rows": 0, "files": 0}
+        params = {k: v for k, v in filters.items() if v is not None}
+        for range_start, range_end in self.missing(partition, start, end, step_days):
+            response = client.get(curve, date_from=range_start, date_to=range_end, **params)
+            # A client using this store has stored the range already
+            files = 0 if client_store is self else self.write(
+                partition, curve, response, range_start, range_end)
+            days = (range_end - range_start).days + 1
+            result["fetched_days"] += days
+            result["skipped_days"] -= days
+            result["rows"] += len(response)
+            result["files"] += files
+        logger.debug(f"Synced {curve.value} to {partition}", **result)
+        return result
+
+    def write(self, partition: pathlib.Path, curve: Curve, response,
+              range_start: date, range_end: date) -> int:
+        """Store the rows fetched for a range of days, replacing what was stored for them.
+
+        Args:
+            partition: Partition directory (see partition())
+            curve: The curve the rows belong to
+            response: APIResponse returned for the range
+            range_start: First day requested
+            range_end: Last day requested (days without rows are recorded as empty)
+
+        Returns:
+            Number of files written
+        """
+        with self._lock:
+            return self._write(partition, curve, response, range_start, range_end)
+
+    def _write(self, partition: pathlib.Path, curve: Curve, response,
+               range_start: date, range_end: date) -> int:
+        pa = _import_pyarrow()
+        by_day: Dict[date, list] = {}
+        for item in response:
+            by_day.setdefault(delivery_date(item.utc), []).append(item)
+
+        manifest = self.load_manifest(partition)
+        days = manifest["days"]
+        today = date.today()
+        fetched_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        # One new file per month touched by the range
+        months: Dict[Tuple[int, int], List[date]] = {}
+        day = range_start
+        while day <= range_end:
+            months.setdefault((day.year, day.month), []).append(day)
+            day += timedelta(days=1)
+
+        files = 0
+        for (year, month), month_days in months.items():
+            month_dir = partition / f"year={year}" / f"month={month:02d}"
+            refreshed = {d for d in month_days if d.isoformat() in days}
+            rows = [item for d in month_days for item in by_day.get(d, ())]
+            name = None
+            if rows:
+                name = (f"part-{month_days[0]:%Y%m%d}-{month_days[-1]:%Y%m%d}-"
+                        f"{uuid.uuid4().hex[:8]}.parquet")
+                table = self._to_table(pa, rows)
+                write_atomic(month_dir / name, lambda tmp: pa.parquet.write_table(table, tmp))
+                files += 1
+            if refreshed:
+                # Drop the previous revision of the refreshed days from older files
+                self._drop_days(pa, partition, days, refreshed, keep=name)
+            for d in month_days:
+                day_rows = by_day.get(d, ())
+                flags = [v for item in day_rows for k, v in item.__dict__.items()
+                         if k.startswith("is_final")]
+                days[d.isoformat()] = {
+                    "file": f"year={year}/month={month:02d}/{name}" if day_rows else None,
+                    "rows": len(day_rows),
+                    "final": is_final(curve, d, flags, today),
+                    "fetched_at": fetched_at,
+                }
+        self._save_manifest(partition, manifest)
+        # The manifest is the source of truth; the index follows it
+        fetched = (range_start + timedelta(days=i) for i in range((range_end - range_start).days + 1))
+        self.coverage.mark_days(self.key(partition), {d: days[d.isoformat()]["final"] for d in fetched})
+        return files
+
+    @staticmethod
+    def _to_table(pa, rows: list):
+        records = [item.model_dump() for item in rows]
+        for record, item in zip(records, rows):
+            record["delivery_date"] = delivery_date(item.utc)
+        return pa.Table.from_pylist(records)
+
+    def _drop_days(self, pa, partition: pathlib.Path, days: Dict[str, Any],
+                   refreshed: set, keep: Optional[str]) -> None:
+        """Rewrite the files holding refreshed days without those days"""
+        import pyarrow.compute as pc
+        files = {days[d.isoformat()]["file"] for d in refreshed} - {None}
+        for relative in files:
+            path = partition / relative
+            if path.name == keep or not path.exists():
+                continue
+            table = pa.parquet.read_table(path)
+            mask = pc.invert(pc.is_in(table["delivery_date"],
+                                      value_set=pa.array(sorted(refreshed), pa.date32())))
+            remaining = table.filter(mask)
+            if remaining.num_rows:
+                write_atomic(path, lambda tmp: pa.parquet.write_table(remaining, tmp))
+            else:
+                path.unlink()
+
+    # -- compaction -------------------------------------------------------
+
+    def compact(self, curve: Optional[Curve] = None, min_files: int = 2,
+                row_group_size: int = ROW_GROUP_SIZE) -> Dict[str, int]:
+        """Merge the small files of each month into one file per month.
+
+        Rows are deduplicated by their natural key (utc and the string
+        columns), keeping the final revision, then the latest one; they are
+        sorted by utc and written in row groups of row_group_size rows. The
+        merged file is renamed into place and the manifest updated before the
+        old files are removed, so readers never see a day twice or not at all.
+        Leftover temporary files of interrupted writes are removed as well.
+
+        Args:
+            curve: Compact only this curve (defaults to every curve)
+            min_files: Leave months with fewer files alone
+            row_group_size: Rows per row group of the merged files
+
+        Returns:
+            Counts of months compacted, and of files and rows before and after
+        """
+        _import_pyarrow()
+        pattern = f"{curve.value}/**/{MANIFEST}" if curve is not None else f"*/**/{MANIFEST}"
+        result = {"months": 0, "files_before": 0, "files_after": 0,
+                  "rows_before": 0, "rows_after": 0}
+        for manifest_path in self.root.glob(pattern):
+            with self._lock:
+                self._compact_partition(manifest_path.parent, min_files, row_group_size, result)
+        logger.debug(f"Compacted {self.root}", **result)
+        return result
+
+    def _compact_partition(self, partition: pathlib.Path, min_files: int,
+                           row_group_size: int, result: Dict[str, int]) -> None:
+        import pyarrow.parquet as pq
+
+        manifest = self.load_manifest(partition)
+        removed = []
+        for month_dir in sorted(partition.glob("year=*/month=*")):
+            for stale in month_dir.glob(".*.tmp"):
+                stale.unlink()
+            # Oldest first, so later revisions win when deduplicating
+            files = sorted(month_dir.glob("part-*.parquet"), key=lambda p: p.stat().st_mtime_ns)
+            if len(files) < max(min_files, 2):
+                continue
+            table = merge(files)
+            first, last = table["delivery_date"][0].as_py(), table["delivery_date"][-1].as_py()
+            name = f"part-{first:%Y%m%d}-{last:%Y%m%d}-{uuid.uuid4().hex[:8]}.parquet"
+            write_atomic(month_dir / name,
+                         lambda tmp: pq.write_table(table, tmp, row_group_size=row_group_size))
+
+            relative = month_dir.relative_to(partition).as_posix()
+            merged = {f"{relative}/{path.name}" for path in files}
+            for entry in manifest["days"].values():
+                if entry["file"] in merged:
+                    entry["file"] = f"{relative}/{name}"
+            removed.extend(files)
+            result["months"] += 1
+            result["files_before"] += len(files)
+            result["files_after"] += 1
+            result["rows_before"] += sum(pq.ParquetFile(path).metadata.num_rows for path in files)
+            result["rows_after"] += table.num_rows
+
+        if removed:
+            # The manifest must point at the merged files before the old ones go
+            self._save_manifest(partition, manifest)
+            for path in removed:
+                path.unlink()
+
+    # -- read -------------------------------------------------------------
+
+    def read_partition(self, partition: pathlib.Path, start: Optional[date] = None,
+                       end: Optional[date] = None):
+        """Read the rows of one partition as a pyarrow Table sorted by utc.
+
+        Args:
+            partition: Partition directory (see partition())
+            start: First delivery day (inclusive)
+            end: Last delivery day (inclusive)
+        """
+        pa = _import_pyarrow()
+        if not partition.exists():
+            return pa.table({})
+        return self._scan(pa, partition, {}, start, end)
+
+    def read(self, curve: Curve,
+             date_from: Union[str, date, None] = None,
+             date_to: Union[str, date, None] = None,
+             **filters):
+        """Read locally stored rows of a curve as a pyarrow Table.
+
+        Args:
+            curve: The curve
+            date_from: First delivery day (inclusive)
+            date_to: Last delivery day (inclusive)
+            **filters: Filter values the data was synced with. A filter not
+                given selects the data synced without it (stored as "all"),
+                never the partitions synced per value, so overlapping syncs
+                (e.g., area=None and area="NORD") are not returned twice.
+
+        Returns:
+            pyarrow.Table sorted by utc
+        """
+        pa = _import_pyarrow()
+        path = self.root / curve.value
+        if not path.exists():
+            return pa.table({})
+        filters = dict({name: None for name in self._partition_names(path)}, **filters)
+        start = date.fromisoformat(date_from) if isinstance(date_from, str) else date_from
+        end = date.fromisoformat(date_to) if isinstance(date_to, str) else date_to
+        return self._scan(pa, path, filters, start, end)
+
+    @staticmethod
+    def _partition_names(path: pathlib.Path) -> List[str]:
+        """Return the filter names a curve's directory is partitioned by"""
+        names = []
+        while True:
+            level = next((p for p in path.iterdir() if p.is_dir() and "=" in p.name), None)
+            if level is None or level.name.startswith("year="):
+                return names
+            names.append(level.name.split("=", 1)[0])
+            path = level
+
+    @staticmethod
+    def _scan(pa, path: pathlib.Path, filters: Dict[str, Any],
+              start: Optional[date], end: Optional[date]):
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format="parquet", partitioning="hive",
+                             exclude_invalid_files=True)
+        expression = None
+        for name, value in filters.items():
+            # pyarrow decodes hive segments, so compare with the unquoted value
+            condition = ds.field(name) == unquote(_filter_value(value))
+            expression = condition if expression is None else expression & condition
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        if start is not None:
+            condition = ds.field("delivery_date") >= pa.scalar(start, pa.date32())
+            expression = condition if expression is None else expression & condition
+        if end is not None:
+            condition = ds.field("delivery_date") <= pa.scalar(end, pa.date32())
+            expression = condition if expression is None else expression & condition
+        table = dataset.to_table(filter=expression)
+        return table.sort_by("utc") if table.num_rows else table
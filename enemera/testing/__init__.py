@@ -0,0 +1,12 @@
+"""Offline testing helpers: synthetic data, a local stand-in API server and a stand-in Redis"""
+
+from .redis import StandInRedis
+from .server import StandInServer, make_api_key
+from .synthetic import generate_rows
+
+__all__ = [
+    'StandInRedis',
+    'StandInServer',
+    'make_api_key',
+    'generate_rows'
+]
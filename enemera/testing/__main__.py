@@ -0,0 +1,5 @@
+"""Run the stand-in API server: python -m enemera.testing --help"""
+
+from enemera.testing.server import main
+
+main()
@@ -0,0 +1,265 @@
+"""
+Local stand-in for a Redis-compatible server.
+
+StandInRedis speaks enough of the Redis protocol for RedisCache and
+redis-py clients: strings with expiry, key deletion and scanning. It keeps
+everything in memory, so a shared cache can be tested without a real server:
+
+    with StandInRedis() as server:
+        cache = RedisCache(server.url)
+"""
+
+import fnmatch
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Connection handler delegating commands to the owning StandInRedis"""
+
+    def handle(self):
+        protocol = 2
+        while True:
+            try:
+                command = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if command is None:
+                return
+            reply = self.server.standin.execute(command)
+            if command[0].upper() == b"HELLO" and not reply.startswith(b"-"):
+                protocol = 3 if reply.startswith(b"%") else 2
+            if protocol == 3 and reply == _NULL:
+                reply = b"_\r\n"
+            self.wfile.write(reply)
+            self.wfile.flush()
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            # Inline command, as typed into a telnet session
+            return line.split()
+        args = []
+        for _ in range(int(line[1:])):
+            header = self.rfile.readline()
+            if not header.startswith(b"$"):
+                raise ValueError("Expected a bulk string")
+            length = int(header[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+# Null reply in RESP2; connections that switched to RESP3 get "_" instead
+_NULL = b"$-1\r\n"
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return _NULL
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _integer(value: int) -> bytes:
+    return b":%d\r\n" % value
+
+
+def _array(items: List[bytes]) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(items)
+
+
+_OK = b"+OK\r\n"
+
+
+class StandInRedis:
+    """Threaded in-memory server answering the Redis commands RedisCache uses.
+
+    Supported: HELLO (RESP2 and RESP3), PING, ECHO, GET, SET (EX/PX/NX/XX),
+    DEL, EXISTS, EXPIRE, PEXPIRE, TTL, PTTL, KEYS, SCAN, DBSIZE, FLUSHDB,
+    FLUSHALL, SELECT and CLIENT (accepted and ignored). Other commands get
+    an error reply.
+
+    Attributes:
+        commands: Number of commands received, per command name
+
+    Example:
+        >>> with StandInRedis() as server:
+        ...     client = EnemeraClient(api_key=make_api_key(), base_url=api.url,
+        ...                            cache=RedisCache(server.url))
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """Initialize a new StandInRedis.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.commands: Dict[str, int] = {}
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._server = _Server((host, port), _Handler)
+        self._server.standin = self
+
+    @property
+    def url(self) -> str:
+        """URL to pass to RedisCache or redis.Redis.from_url()"""
+        host, port = self._server.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "StandInRedis":
+        """Serve connections on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="enemera-standin-redis", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInRedis":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _live(self, key: bytes) -> Optional[Tuple[bytes, Optional[float]]]:
+        item = self._data.get(key)
+        if item is not None and item[1] is not None and item[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return item
+
+    def execute(self, command: List[bytes]) -> bytes:
+        """Run one command and return its encoded reply."""
+        if not command:
+            return b"-ERR empty command\r\n"
+        name = command[0].decode().upper()
+        args = command[1:]
+        with self._lock:
+            self.commands[name] = self.commands.get(name, 0) + 1
+            handler = getattr(self, f"_cmd_{name.lower()}", None)
+            if handler is None:
+                return b"-ERR unknown command '%s'\r\n" % name.encode()
+            try:
+                return handler(args)
+            except (IndexError, ValueError):
+                return b"-ERR syntax error\r\n"
+
+    def _cmd_ping(self, args):
+        return _bulk(args[0]) if args else b"+PONG\r\n"
+
+    def _cmd_echo(self, args):
+        return _bulk(args[0])
+
+    def _cmd_client(self, args):
+        return _OK
+
+    def _cmd_hello(self, args):
+        version = int(args[0]) if args else 2
+        if version not in (2, 3):
+            return b"-NOPROTO unsupported protocol version\r\n"
+        info = [(b"server", _bulk(b"redis")), (b"version", _bulk(b"7.0.0")),
+                (b"proto", _integer(version)), (b"id", _integer(1)),
+                (b"mode", _bulk(b"standalone")), (b"role", _bulk(b"master")),
+                (b"modules", _array([]))]
+        fields = b"".join(_bulk(name) + value for name, value in info)
+        # RESP3 replies with a map; other replies only differ in how null is sent
+        return (b"%%%d\r\n" % len(info) if version == 3 else b"*%d\r\n" % (2 * len(info))) + fields
+
+    def _cmd_select(self, args):
+        return _OK
+
+    def _cmd_get(self, args):
+        item = self._live(args[0])
+        return _bulk(item[0] if item is not None else None)
+
+    def _cmd_set(self, args):
+        key, value = args[0], args[1]
+        expires_at = None
+        options = [a.upper() for a in args[2:]]
+        i = 0
+        while i < len(options):
+            option = options[i]
+            if option in (b"EX", b"PX"):
+                amount = float(args[2 + i + 1])
+                expires_at = time.monotonic() + (amount if option == b"EX" else amount / 1000)
+                i += 2
+                continue
+            if option == b"NX" and self._live(key) is not None:
+                return _bulk(None)
+            if option == b"XX" and self._live(key) is None:
+                return _bulk(None)
+            i += 1
+        self._data[key] = (value, expires_at)
+        return _OK
+
+    def _cmd_del(self, args):
+        return _integer(sum(self._data.pop(key, None) is not None for key in args))
+
+    def _cmd_exists(self, args):
+        return _integer(sum(self._live(key) is not None for key in args))
+
+    def _expire(self, key: bytes, seconds: float) -> bytes:
+        item = self._live(key)
+        if item is None:
+            return _integer(0)
+        self._data[key] = (item[0], time.monotonic() + seconds)
+        return _integer(1)
+
+    def _cmd_expire(self, args):
+        return self._expire(args[0], float(args[1]))
+
+    def _cmd_pexpire(self, args):
+        return self._expire(args[0], float(args[1]) / 1000)
+
+    def _remaining(self, key: bytes, scale: int) -> bytes:
+        item = self._live(key)
+        if item is None:
+            return _integer(-2)
+        if item[1] is None:
+            return _integer(-1)
+        return _integer(int((item[1] - time.monotonic()) * scale))
+
+    def _cmd_ttl(self, args):
+        return self._remaining(args[0], 1)
+
+    def _cmd_pttl(self, args):
+        return self._remaining(args[0], 1000)
+
+    def _matching(self, pattern: bytes) -> List[bytes]:
+        return [key for key in list(self._data)
+                if self._live(key) is not None and fnmatch.fnmatchcase(key, pattern)]
+
+    def _cmd_keys(self, args):
+        return _array([_bulk(key) for key in self._matching(args[0])])
+
+    def _cmd_scan(self, args):
+        # One pass returns every match; cursor 0 tells the client it is done
+        pattern = b"*"
+        for i in range(1, len(args), 2):
+            if args[i].upper() == b"MATCH":
+                pattern = args[i + 1]
+        return _array([_bulk(b"0"), _array([_bulk(key) for key in self._matching(pattern)])])
+
+    def _cmd_dbsize(self, args):
+        return _integer(len(self._matching(b"*")))
+
+    def _cmd_flushdb(self, args):
+        self._data.clear()
+        return _OK
+
+    _cmd_flushall = _cmd_flushdb
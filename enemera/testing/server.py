@@ -0,0 +1,333 @@
+"""
+Local stand-in for the Enemera API.
+
+StandInServer serves every endpoint used by the curve clients with synthetic
+data, so EnemeraClient can be exercised offline (in CI, on an air-gapped box,
+or under load tests) by pointing base_url at it. Latency, server errors and
+429 responses can be injected to test retries, hedging and deadlines, and
+data can be withheld until its publication time to test prefetching.
+
+Run it from the command line with:
+
+    python -m enemera.testing --port 8080 --latency 0.02 --error-rate 0.01
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from enemera.models.curves import ENDPOINT_CURVES
+from enemera.prefetch.schedule import Publication
+from enemera.testing.synthetic import generate_rows
+
+# Body and ETag of queries whose data is not published yet
+_UNPUBLISHED = (b"[]", '"unpublished"')
+
+
+def make_api_key(subject: str = "standin-user", lifetime: int = 86400) -> str:
+    """Return a structurally valid API key accepted by the client's validator.
+
+    The token is not signed with a real secret; it is only meant for the
+    stand-in server and replayed fixtures.
+
+    Args:
+        subject: Value of the token's "sub" claim
+        lifetime: Seconds until the token expires
+
+    Returns:
+        str: JWT-formatted API key
+    """
+    def encode(data: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    now = int(time.time())
+    header = encode({"alg": "HS256", "typ": "JWT"})
+    payload = encode({"sub": subject, "type": "api_key", "iat": now - 1, "exp": now + lifetime,
+                      "jti": hashlib.sha1(f"{subject}{now}".encode()).hexdigest()})
+    signature = base64.urlsafe_b64encode(hashlib.sha256(payload.encode()).digest()).rstrip(b"=").decode()
+    return f"{header}.{payload}.{signature}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating to the owning StandInServer"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.standin.handle(self)
+
+    def log_message(self, format, *args):
+        if self.server.standin.verbose:
+            super().log_message(format, *args)
+
+
+class StandInServer:
+    """Threaded HTTP server imitating the Enemera API with synthetic data.
+
+    Attributes:
+        latency: Added delay per request in seconds, or a (min, max) range
+        error_rate: Fraction of requests answered with a 500 or 503
+        rate_limit_rate: Fraction of requests answered with a 429
+        requests_per_second: Sustained rate above which requests get a 429
+        retry_after: Retry-After value sent with 429 responses, in seconds
+        compress: Whether gzip is used when the client accepts it
+        require_auth: Whether requests need a Bearer token
+        publications: Publications withholding data until their time
+        counters: Number of responses per status code and per endpoint
+
+    Example:
+        >>> with StandInServer(latency=(0.01, 0.05), error_rate=0.02) as server:
+        ...     client = EnemeraClient(api_key=make_api_key(), base_url=server.url)
+        ...     prices = client.get(Curve.ITALY_PRICES, market="MGP",
+        ...                         date_from="2024-01-01", date_to="2024-01-31")
+    """
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: Union[float, Tuple[float, float]] = 0.0,
+                 error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0,
+                 requests_per_second: Optional[float] = None,
+                 retry_after: int = 1,
+                 compress: bool = True,
+                 require_auth: bool = True,
+                 publications: Optional[Iterable[Publication]] = None,
+                 seed: Optional[int] = None,
+                 verbose: bool = False):
+        """Initialize a new StandInServer.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Added delay per request in seconds, or a (min, max) range
+            error_rate: Fraction of requests answered with a 500 or 503
+            rate_limit_rate: Fraction of requests answered with a 429
+            requests_per_second: Sustained rate above which requests get a 429
+            retry_after: Retry-After value sent with 429 responses, in seconds
+            compress: Whether gzip is used when the client accepts it
+            require_auth: Whether requests need a Bearer token
+            publications: Queries matching one of these publications are
+                answered with an empty list until the data of their last
+                delivery day is published
+            seed: Seed for the random fault injection
+            verbose: Whether to log every request to stderr
+        """
+        for name, rate in (("error_rate", error_rate), ("rate_limit_rate", rate_limit_rate)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.requests_per_second = requests_per_second
+        self.retry_after = retry_after
+        self.compress = compress
+        self.require_auth = require_auth
+        self.publications = list(publications or [])
+        self.verbose = verbose
+        self.counters: Dict[str, Dict[Any, int]] = {"status": {}, "endpoints": {}}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = requests_per_second or 0.0
+        self._last_refill = time.monotonic()
+        self._bodies: Dict[str, Tuple[bytes, str]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to EnemeraClient"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name="enemera-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _count(self, status: int, endpoint: str) -> None:
+        with self._lock:
+            self.counters["status"][status] = self.counters["status"].get(status, 0) + 1
+            self.counters["endpoints"][endpoint] = self.counters["endpoints"].get(endpoint, 0) + 1
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            with self._lock:
+                return self._random.uniform(*self.latency)
+        return self.latency
+
+    def _fault(self) -> Optional[int]:
+        """Return the status of an injected fault for this request, if any"""
+        with self._lock:
+            if self.requests_per_second:
+                now = time.monotonic()
+                self._tokens = min(self.requests_per_second,
+                                   self._tokens + (now - self._last_refill) * self.requests_per_second)
+                self._last_refill = now
+                if self._tokens < 1:
+                    return 429
+                self._tokens -= 1
+            roll = self._random.random()
+            if roll < self.rate_limit_rate:
+                return 429
+            if roll < self.rate_limit_rate + self.error_rate:
+                return self._random.choice((500, 503))
+        return None
+
+    def _body(self, path: str, params: Dict[str, str]) -> Tuple[bytes, str]:
+        """Return the JSON body and ETag for a query, memoized"""
+        key = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is None:
+            rows = generate_rows(ENDPOINT_CURVES[path], params)
+            body = json.dumps(rows, separators=(",", ":")).encode()
+            cached = (body, '"%s"' % hashlib.sha1(body).hexdigest())
+            with self._lock:
+                if len(self._bodies) >= 512:
+                    self._bodies.clear()
+                self._bodies[key] = cached
+        return cached
+
+    def _unpublished(self, path: str, params: Dict[str, str]) -> bool:
+        """Whether a query asks for data a publication withholds for now"""
+        last_day = params.get("date_to") or params.get("date_from")
+        if not self.publications or not last_day:
+            return False
+        curve = ENDPOINT_CURVES[path]
+        published_at = [p.published_at(date.fromisoformat(last_day))
+                        for p in self.publications if p.matches(curve, params)]
+        return bool(published_at) and max(published_at) > datetime.now(timezone.utc)
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Answer a single GET request."""
+        parts = urlsplit(request.path)
+        path = parts.path.rstrip("/")
+
+        delay = self._delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        if path not in ENDPOINT_CURVES:
+            return self._send_json(request, path, 404, {"detail": "Not Found"})
+        if self.require_auth and not request.headers.get("Authorization", "").startswith("Bearer "):
+            return self._send_json(request, path, 401, {"detail": "Not authenticated"})
+
+        fault = self._fault()
+        if fault == 429:
+            return self._send_json(request, path, 429, {"detail": "Rate limit exceeded"},
+                                   {"Retry-After": str(self.retry_after)})
+        if fault is not None:
+            return self._send_json(request, path, fault, {"detail": "Injected server error"})
+
+        params = dict(parse_qsl(parts.query))
+        try:
+            if self._unpublished(path, params):
+                body, etag = _UNPUBLISHED
+            else:
+                body, etag = self._body(path, params)
+        except ValueError as e:
+            return self._send_json(request, path, 422, {"detail": str(e)})
+
+        if request.headers.get("If-None-Match") == etag:
+            self._count(304, path)
+            request.send_response(304)
+            request.send_header("ETag", etag)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        self._send(request, path, 200, body, {"ETag": etag, "Cache-Control": "max-age=60"})
+
+    def _send_json(self, request, path, status, payload, headers=None) -> None:
+        self._send(request, path, status, json.dumps(payload).encode(), headers or {})
+
+    def _send(self, request, path, status, body: bytes, headers: Dict[str, str]) -> None:
+        self._count(status, path)
+        accept = request.headers.get("Accept-Encoding", "")
+        if self.compress and "gzip" in accept and len(body) > 512:
+            body = gzip.compress(body, compresslevel=5)
+            headers = dict(headers, **{"Content-Encoding": "gzip"})
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def _parse_latency(value: str) -> Union[float, Tuple[float, float]]:
+    if ":" in value:
+        low, high = value.split(":", 1)
+        return (float(low), float(high))
+    return float(value)
+
+
+def main(argv=None) -> None:
+    """Run the stand-in server from the command line."""
+    parser = argparse.ArgumentParser(description="Local stand-in for the Enemera API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=_parse_latency, default=0.0,
+                        help="Delay per request in seconds, or MIN:MAX")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--requests-per-second", type=float, default=None)
+    parser.add_argument("--no-compress", action="store_true")
+    parser.add_argument("--no-auth", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    server = StandInServer(host=args.host, port=args.port, latency=args.latency,
+                           error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                           requests_per_second=args.requests_per_second,
+                           compress=not args.no_compress, require_auth=not args.no_auth,
+                           seed=args.seed, verbose=not args.quiet)
+    print(f"Enemera stand-in API listening on {server.url}")
+    print(f"API key for testing: {make_api_key()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
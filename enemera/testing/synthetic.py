@@ -0,0 +1,308 @@
+"""
+Synthetic data for the Enemera API endpoints.
+
+Rows are generated from the query parameters of a request, follow the field
+layout of the response models and cover every delivery interval of the
+requested days in Italian local time (so DST days have 23 or 25 hours). Values
+are a deterministic function of the curve, zone and timestamp: the same query
+always returns the same payload, which keeps ETags stable and benchmarks
+repeatable.
+"""
+
+import math
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dateutil import tz
+
+from enemera.models.curves import Curve
+
+MARKET_TZ = tz.gettz("Europe/Rome")
+
+ITALY_ZONES = ["NORD", "CNOR", "CSUD", "SUD", "SICI", "SARD", "CALA"]
+ITALY_MACROZONES = ["NORD", "SUD"]
+ITALY_INTERCONNECTIONS = [
+    ("NORD", "CNOR"), ("CNOR", "CSUD"), ("CSUD", "SUD"), ("SUD", "CALA"),
+    ("CALA", "SICI"), ("CSUD", "SARD"), ("NORD", "FRAN"), ("NORD", "SVIZ"),
+    ("NORD", "AUST"), ("NORD", "SLOV"), ("SUD", "GREC"), ("SICI", "MALT"),
+]
+GENERATION_TYPES = ["THERMAL", "HYDRO", "WIND", "SOLAR", "GEOTHERMAL"]
+SPAIN_ZONES = ["ES"]
+
+# Resolution of each curve in minutes
+RESOLUTION_MINUTES = {
+    Curve.ITALY_IMBALANCE_DATA: 15,
+}
+
+
+def _zones(params: Dict[str, Any], default: List[str]) -> List[str]:
+    """Return the zones requested by the 'area' parameter, or the defaults"""
+    area = params.get("area")
+    if not area:
+        return default
+    return [a.strip() for a in str(area).split(",") if a.strip()]
+
+
+def _delivery_days(params: Dict[str, Any]) -> List[date]:
+    """Return the delivery days from date_from to date_to, both inclusive"""
+    today = date.today()
+    start = date.fromisoformat(params["date_from"]) if params.get("date_from") else today
+    end = date.fromisoformat(params["date_to"]) if params.get("date_to") else start
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def delivery_intervals(params: Dict[str, Any], minutes: int = 60) -> Iterator[datetime]:
+    """Yield the UTC start of every delivery interval of the requested days.
+
+    Args:
+        params: Query parameters (date_from and date_to as YYYY-MM-DD)
+        minutes: Interval length in minutes
+
+    Yields:
+        datetime: Timezone-aware UTC interval starts
+    """
+    step = timedelta(minutes=minutes)
+    for day in _delivery_days(params):
+        start = datetime(day.year, day.month, day.day, tzinfo=MARKET_TZ).astimezone(timezone.utc)
+        next_day = day + timedelta(days=1)
+        end = datetime(next_day.year, next_day.month, next_day.day,
+                       tzinfo=MARKET_TZ).astimezone(timezone.utc)
+        current = start
+        while current < end:
+            yield current
+            current += step
+
+
+def _value(key: str, ts: datetime, base: float, amplitude: float) -> float:
+    """Deterministic daily-cycle value for a series key and timestamp"""
+    offset = zlib.crc32(key.encode()) % 1000 / 1000.0
+    hours = ts.timestamp() / 3600.0
+    daily = math.sin(2 * math.pi * (hours / 24.0 + offset))
+    weekly = math.sin(2 * math.pi * (hours / 168.0 + offset))
+    return round(base * (1 + 0.2 * offset) + amplitude * daily + 0.25 * amplitude * weekly, 2)
+
+
+def _format_utc(ts: datetime) -> str:
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _series(curve: Curve, params: Dict[str, Any],
+            keys: List[Tuple[Any, ...]],
+            row: Callable[[str, datetime, Tuple[Any, ...]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build rows for every interval and series key, ordered by time"""
+    minutes = RESOLUTION_MINUTES.get(curve, 60)
+    rows = []
+    for ts in delivery_intervals(params, minutes):
+        utc = _format_utc(ts)
+        for key in keys:
+            rows.append(row(utc, ts, key))
+    return rows
+
+
+def _resolution(curve: Curve) -> str:
+    return f"PT{RESOLUTION_MINUTES.get(curve, 60)}M"
+
+
+def _prices(curve, params):
+    market = params.get("market") or "MGP"
+    res = _resolution(curve)
+    return _series(curve, params, [(z,) for z in _zones(params, ITALY_ZONES)], lambda utc, ts, k: {
+        "utc": utc, "time_resolution": res, "market": market, "zone": k[0],
+        "price": _value(f"price:{market}:{k[0]}", ts, 110.0, 35.0),
+    })
+
+
+def _xbid(curve, params):
+    res = _resolution(curve)
+
+    def row(utc, ts, k):
+        ref = _value(f"xbid:{k[0]}", ts, 105.0, 30.0)
+        return {
+            "utc": utc, "time_resolution": res, "zone": k[0],
+            "first_price": round(ref - 3.5, 2), "last_price": round(ref + 1.25, 2),
+            "min_price": round(ref - 12.0, 2), "max_price": round(ref + 15.0, 2),
+            "ref_price": ref, "last_hour_price": round(ref + 0.5, 2),
+            "buy_volume": abs(_value(f"xbid-buy:{k[0]}", ts, 150.0, 60.0)),
+            "sell_volume": abs(_value(f"xbid-sell:{k[0]}", ts, 140.0, 55.0)),
+        }
+
+    return _series(curve, params, [(z,) for z in _zones(params, ITALY_ZONES)], row)
+
+
+def _exchange_volumes(curve, params):
+    market = params.get("market") or "MGP"
+    purposes = [params["purpose"]] if params.get("purpose") else ["BUY", "SELL"]
+    res = _resolution(curve)
+    keys = [(z, p) for z in _zones(params, ITALY_ZONES) for p in purposes]
+    return _series(curve, params, keys, lambda utc, ts, k: {
+        "utc": utc, "time_resolution": res, "market": market, "zone": k[0], "purpose": k[1],
+        "quantity": abs(_value(f"qty:{market}:{k[0]}:{k[1]}", ts, 2500.0, 900.0)),
+    })
+
+
+def _ancillary_services(curve, params):
+    market = params.get("market") or "MSD"
+    segment = params.get("market_segment") or market
+    res = _resolution(curve)
+
+    def row(utc, ts, k):
+        key = f"as:{market}:{segment}:{k[0]}"
+        return {
+            "utc": utc, "time_resolution": res, "zone": k[0], "market": market, "segment": segment,
+            "buy_volume": abs(_value(key + ":bv", ts, 120.0, 50.0)),
+            "sell_volume": abs(_value(key + ":sv", ts, 90.0, 40.0)),
+            "buy_volume_no_rev": abs(_value(key + ":bvn", ts, 110.0, 45.0)),
+            "sell_volume_no_rev": abs(_value(key + ":svn", ts, 80.0, 35.0)),
+            "avg_buy_price": _value(key + ":abp", ts, 60.0, 25.0),
+            "avg_sell_price": _value(key + ":asp", ts, 180.0, 60.0),
+            "max_sell_price": _value(key + ":msp", ts, 320.0, 80.0),
+            "min_buy_price": _value(key + ":mbp", ts, 5.0, 4.0),
+        }
+
+    return _series(curve, params, [(z,) for z in _zones(params, ITALY_ZONES)], row)
+
+
+def _dam_demand(curve, params):
+    res = _resolution(curve)
+    tag = curve.value
+    return _series(curve, params, [(z,) for z in _zones(params, ITALY_ZONES)], lambda utc, ts, k: {
+        "utc": utc, "time_resolution": res, "zone": k[0],
+        "demand": abs(_value(f"{tag}:{k[0]}", ts, 4200.0, 1500.0)),
+    })
+
+
+def _flow_keys(params):
+    pairs = ITALY_INTERCONNECTIONS
+    if params.get("area_from"):
+        pairs = [p for p in pairs if p[0] in _zones({"area": params["area_from"]}, [])]
+    if params.get("area_to"):
+        pairs = [p for p in pairs if p[1] in _zones({"area": params["area_to"]}, [])]
+    return pairs
+
+
+def _flows(curve, params):
+    market = params.get("market") or "MGP"
+    res = _resolution(curve)
+    return _series(curve, params, _flow_keys(params), lambda utc, ts, k: {
+        "utc": utc, "time_resolution": res, "market": market, "zone_from": k[0], "zone_to": k[1],
+        "flow": _value(f"flow:{market}:{k[0]}:{k[1]}", ts, 800.0, 600.0),
+    })
+
+
+def _flow_limits(curve, params):
+    market = params.get("market") or "MGP"
+    res = _resolution(curve)
+    return _series(curve, params, _flow_keys(params), lambda utc, ts, k: {
+        "utc": utc, "time_resolution": res, "market": market, "zone_from": k[0], "zone_to": k[1],
+        "flow_limit": abs(_value(f"limit:{market}:{k[0]}:{k[1]}", ts, 3000.0, 400.0)),
+        "coefficient": 1.0,
+    })
+
+
+def _load(curve, params):
+    tag = curve.value
+    return _series(curve, params, [(z,) for z in _zones(params, ITALY_ZONES)], lambda utc, ts, k: {
+        "utc": utc, "area": k[0],
+        "data_value": abs(_value(f"{tag}:{k[0]}", ts, 4500.0, 1600.0)),
+    })
+
+
+def _generation(curve, params):
+    types = [params["generation_type"]] if params.get("generation_type") else GENERATION_TYPES
+    tag = curve.value
+    keys = [(z, g) for z in _zones(params, ITALY_ZONES) for g in types]
+    return _series(curve, params, keys, lambda utc, ts, k: {
+        "utc": utc, "area": k[0], "gen_type": k[1],
+        "data_value": abs(_value(f"{tag}:{k[0]}:{k[1]}", ts, 900.0, 500.0)),
+    })
+
+
+def _imbalance(curve, params):
+    def row(utc, ts, k):
+        key = f"{curve.value}:{k[0]}"
+        volume = _value(key + ":vol", ts, 0.0, 450.0)
+        return {
+            "utc": utc, "macrozone": k[0],
+            "imb_volume": volume,
+            "imb_sign": 1 if volume > 0 else (-1 if volume < 0 else 0),
+            "imb_price": _value(key + ":price", ts, 115.0, 45.0),
+            "imb_base_price": _value(key + ":base", ts, 110.0, 35.0),
+            "pnamz": _value(key + ":pnamz", ts, 112.0, 40.0),
+            "scambi": _value(key + ":scambi", ts, 0.0, 1200.0),
+            "estero": _value(key + ":estero", ts, 4000.0, 1500.0),
+            "is_final_sign": True,
+            "is_final_price": True,
+            "is_final_pnamz": True,
+        }
+
+    return _series(curve, params, [(z,) for z in _zones(params, ITALY_MACROZONES)], row)
+
+
+def _spain_prices(curve, params):
+    market = params.get("market") or "MD"
+    res = _resolution(curve)
+    return _series(curve, params, [(z,) for z in SPAIN_ZONES], lambda utc, ts, k: {
+        "utc": utc, "time_resolution": res, "market": market, "zone": k[0],
+        "price": _value(f"es-price:{market}", ts, 85.0, 40.0),
+    })
+
+
+def _spain_xbid(curve, params):
+    res = _resolution(curve)
+
+    def row(utc, ts, k):
+        wavg = _value(f"es-xbid:{k[0]}", ts, 80.0, 35.0)
+        return {
+            "utc": utc, "time_resolution": res, "zone": k[0], "wavg_price": wavg,
+            "min_price": round(wavg - 14.0, 2), "max_price": round(wavg + 18.0, 2),
+        }
+
+    return _series(curve, params, [(z,) for z in SPAIN_ZONES], row)
+
+
+_GENERATORS: Dict[Curve, Callable[[Curve, Dict[str, Any]], List[Dict[str, Any]]]] = {
+    Curve.ITALY_PRICES: _prices,
+    Curve.ITALY_XBID_RESULTS: _xbid,
+    Curve.ITALY_EXCHANGE_VOLUMES: _exchange_volumes,
+    Curve.ITALY_ANCILLARY_SERVICES: _ancillary_services,
+    Curve.ITALY_DAM_DEMAND_ACT: _dam_demand,
+    Curve.ITALY_DAM_DEMAND_FCS: _dam_demand,
+    Curve.ITALY_COMMERCIAL_FLOWS: _flows,
+    Curve.ITALY_COMMERCIAL_FLOW_LIMITS: _flow_limits,
+    Curve.ITALY_LOAD_ACTUAL: _load,
+    Curve.ITALY_LOAD_FORECAST: _load,
+    Curve.ITALY_GENERATION: _generation,
+    Curve.ITALY_GENERATION_FORECAST: _generation,
+    Curve.ITALY_IMBALANCE_DATA: _imbalance,
+    Curve.ITALY_IMBALANCE_DATA_PT60M: _imbalance,
+    Curve.SPAIN_PRICES: _spain_prices,
+    Curve.SPAIN_XBID_RESULTS: _spain_xbid,
+}
+
+
+def generate_rows(curve: Curve, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Generate the JSON rows the API would return for a curve and query.
+
+    Args:
+        curve: The curve requested
+        params: Query parameters as sent by the client (date_from, date_to,
+            area, market, ...). Dates default to today.
+
+    Returns:
+        List of row dictionaries matching the curve's response model
+
+    Raises:
+        ValueError: If the curve is not served by EnemeraClient
+
+    Example:
+        >>> rows = generate_rows(Curve.ITALY_PRICES, {
+        ...     "market": "MGP", "date_from": "2024-03-31", "date_to": "2024-03-31"})
+        >>> len(rows)  # 23 hours on the DST change day, 7 zones
+        161
+    """
+    try:
+        generator = _GENERATORS[curve]
+    except KeyError:
+        raise ValueError(f"No synthetic data available for curve {curve}")
+    return generator(curve, dict(params or {}))
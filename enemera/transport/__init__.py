@@ -0,0 +1,17 @@
+# enemera/transport/__init__.py
+"""HTTP transports used by SecureSession"""
+
+from .base import Transport, create_transport
+from .requests_backend import RequestsTransport, DeadlineRetry
+from .httpx_backend import HTTPXTransport
+from .replay import RecordingTransport, ReplayTransport
+
+__all__ = [
+    'Transport',
+    'RequestsTransport',
+    'HTTPXTransport',
+    'RecordingTransport',
+    'ReplayTransport',
+    'DeadlineRetry',
+    'create_transport'
+]
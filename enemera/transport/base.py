@@ -0,0 +1,104 @@
+"""
+Transport interface for the Enemera API client.
+
+A transport sends a single HTTP request and hands back the response with its
+body still unread, so that SecureSession can decode the body itself and
+account for wire and decoded bytes. Transports own connection pooling and
+retries of transient failures, and translate their library's network errors
+into Enemera exceptions (TimeoutError, ConnectionError, RetryError). Mapping
+HTTP error statuses to exceptions stays in SecureSession, so every backend
+reports errors the same way.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+# Retry settings shared by all backends
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+RETRY_ALLOWED_METHODS = ("GET", "POST")
+
+TimeoutValue = Union[float, Tuple[float, float]]
+
+
+class Transport(ABC):
+    """Interface implemented by HTTP transport backends.
+
+    Attributes:
+        name: Short backend name (e.g., "requests", "httpx")
+    """
+
+    name = "abstract"
+
+    @abstractmethod
+    def send(self, method: str, url: str, *,
+             params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[TimeoutValue] = None, **kwargs) -> Any:
+        """Send a request and return the response with its body unread.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers, merged over the transport's default headers
+            timeout: Single timeout or (connect, read) tuple in seconds
+            **kwargs: Further request options in requests' terms (e.g., json,
+                data, allow_redirects)
+
+        Returns:
+            The backend's response object (requests.Response, httpx.Response, ...)
+
+        Raises:
+            TimeoutError: If connecting or reading timed out
+            ConnectionError: If the connection failed
+            RetryError: If retries of a transient error status were exhausted
+        """
+
+    @abstractmethod
+    def iter_raw(self, response: Any, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the body of a response exactly as received (not decoded)."""
+
+    @abstractmethod
+    def set_body(self, response: Any, body: bytes) -> None:
+        """Attach a fully read, decoded body so response.content and json() work."""
+
+    @abstractmethod
+    def update_headers(self, headers: Dict[str, str]) -> None:
+        """Set headers sent with every request."""
+
+    def close_response(self, response: Any) -> None:
+        """Release the connection held by a response."""
+        response.close()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+    @staticmethod
+    def response_url(response: Any) -> str:
+        """Return the final URL of a response as a string."""
+        return str(response.url)
+
+
+def create_transport(transport: Union[str, Transport, None] = None) -> Transport:
+    """Return a transport instance from a backend name or instance.
+
+    Args:
+        transport: "requests" (default), "httpx", "http2", or a Transport instance
+
+    Returns:
+        Transport: The transport to use
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if isinstance(transport, Transport):
+        return transport
+    if transport is None or transport == "requests":
+        from enemera.transport.requests_backend import RequestsTransport
+        return RequestsTransport()
+    if transport in ("httpx", "http2"):
+        from enemera.transport.httpx_backend import HTTPXTransport
+        return HTTPXTransport(http2=transport == "http2")
+    raise ValueError(f"Unknown transport: {transport}. Use 'requests', 'httpx' or 'http2'")
@@ -0,0 +1,190 @@
+"""
+Transport backed by httpx, with optional HTTP/2.
+
+With HTTP/2, concurrent requests from several threads are multiplexed over a
+single connection per host instead of each holding its own HTTP/1.1
+connection. Requires `pip install enemera[http2]`.
+"""
+
+import ssl
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+
+from enemera.core.deadline import current_deadline
+from enemera.core.hooks import current_event
+from enemera.core.exceptions import ConnectionError, DependencyError, TimeoutError, RetryError
+from enemera.transport.base import (
+    Transport,
+    TimeoutValue,
+    RETRY_TOTAL,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_ALLOWED_METHODS
+)
+
+
+def _import_httpx(http2: bool):
+    """Import httpx (and h2 when HTTP/2 is requested) or raise DependencyError"""
+    try:
+        import httpx
+    except ImportError:
+        raise DependencyError("httpx", "use the httpx transport", "pip install enemera[http2]")
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            raise DependencyError("h2", "use HTTP/2", "pip install enemera[http2]")
+    return httpx
+
+
+class HTTPXTransport(Transport):
+    """Transport using an httpx.Client, HTTP/2 capable.
+
+    Retries mirror the requests backend: connection failures and the
+    statuses in RETRY_STATUS_FORCELIST are retried up to RETRY_TOTAL times
+    with exponential backoff, honouring Retry-After and the active deadline.
+
+    Attributes:
+        client: The underlying httpx.Client
+        http2: Whether HTTP/2 is enabled
+    """
+
+    name = "httpx"
+
+    def __init__(self, http2: bool = True, http1: bool = True,
+                 max_connections: int = 10, retries: int = RETRY_TOTAL,
+                 backoff_factor: float = RETRY_BACKOFF_FACTOR):
+        """Initialize a new HTTPXTransport.
+
+        Args:
+            http2: Enable HTTP/2 (negotiated via ALPN on HTTPS)
+            http1: Allow HTTP/1.1. Set to False with http2=True to use HTTP/2
+                with prior knowledge on plain-text connections (e.g., a local proxy)
+            max_connections: Maximum number of pooled connections
+            retries: Maximum number of retries
+            backoff_factor: Exponential backoff factor between retries
+        """
+        self._httpx = _import_httpx(http2)
+        self.http2 = http2
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # Connection retries are handled by httpx; status retries in send()
+        self.client = self._httpx.Client(
+            transport=self._httpx.HTTPTransport(
+                verify=True,
+                http1=http1,
+                http2=http2,
+                limits=self._httpx.Limits(max_connections=max_connections),
+                retries=retries
+            )
+        )
+
+    def _timeout(self, timeout: Optional[TimeoutValue]):
+        """Convert a requests-style timeout into an httpx.Timeout"""
+        if timeout is None:
+            return self._httpx.Timeout(None)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect, pool=connect)
+        return self._httpx.Timeout(timeout)
+
+    def _backoff(self, attempt: int, response) -> float:
+        """Seconds to wait before retry number `attempt` (1-based)"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = 0
+        else:
+            # Same schedule as urllib3: no wait before the first retry
+            delay = 0 if attempt <= 1 else self.backoff_factor * (2 ** (attempt - 1))
+        deadline = current_deadline()
+        if deadline is not None:
+            delay = min(delay, deadline.remaining())
+        return max(0.0, delay)
+
+    def send(self, method: str, url: str, *,
+             params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[TimeoutValue] = None, **kwargs):
+        httpx = self._httpx
+        # httpx names the redirect option differently from requests
+        follow_redirects = kwargs.pop("allow_redirects", self.client.follow_redirects)
+        retryable = method.upper() in RETRY_ALLOWED_METHODS
+        event = current_event()
+        extensions = {"trace": self._tracer(event)} if event is not None else None
+        attempt = 0
+        while True:
+            request = self.client.build_request(method, url, params=params, headers=headers,
+                                                timeout=self._timeout(timeout),
+                                                extensions=extensions, **kwargs)
+            try:
+                response = self.client.send(request, stream=True,
+                                            follow_redirects=follow_redirects)
+
+            except httpx.TimeoutException as e:
+                raise TimeoutError("Request timed out", timeout_value=timeout,
+                                   original_exception=e)
+
+            except httpx.TransportError as e:
+                if isinstance(e.__cause__ or e.__context__, ssl.SSLError):
+                    raise ConnectionError("SSL verification failed", original_exception=e)
+                raise ConnectionError("Failed to connect to API", original_exception=e)
+
+            if not retryable or response.status_code not in RETRY_STATUS_FORCELIST:
+                return response
+
+            attempt += 1
+            deadline = current_deadline()
+            if attempt > self.retries or (deadline is not None and deadline.expired):
+                response.close()
+                raise RetryError(attempts=attempt, status_code=response.status_code,
+                                 last_exception=Exception(
+                                     f"too many {response.status_code} error responses"))
+
+            delay = self._backoff(attempt, response)
+            if event is not None:
+                event.retries += 1
+                event.emit("on_retry", {"attempt": attempt, "status": response.status_code,
+                                        "error": None, "backoff": delay})
+            response.close()
+            time.sleep(delay)
+
+    @staticmethod
+    def _tracer(event):
+        """Return an httpcore trace callback adding connect time to an event"""
+        started = {}
+
+        def trace(name: str, info: Dict[str, Any]) -> None:
+            step, _, phase = name.rpartition(".")
+            if step not in ("connection.connect_tcp", "connection.start_tls"):
+                return
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase == "complete" and step in started:
+                event.add_timing("connect", time.perf_counter() - started.pop(step))
+
+        return trace
+
+    def iter_raw(self, response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.iter_raw(chunk_size)
+        except self._httpx.TimeoutException as e:
+            raise TimeoutError("Request timed out", original_exception=e)
+        except self._httpx.TransportError as e:
+            raise ConnectionError("Connection lost while reading response", original_exception=e)
+
+    def set_body(self, response, body: bytes) -> None:
+        response._content = body
+        response.close()
+
+    def update_headers(self, headers: Dict[str, str]) -> None:
+        self.client.headers.update(headers)
+
+    def close(self) -> None:
+        self.client.close()
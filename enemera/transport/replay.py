@@ -0,0 +1,255 @@
+"""
+Record/replay transports for exercising the client without the live API.
+
+RecordingTransport wraps a real transport and saves the responses it
+receives (status, selected headers and the body exactly as sent on the wire)
+as JSON fixtures. ReplayTransport serves those fixtures back, so parsing,
+caching and concurrency can be measured offline and deterministically.
+Credentials are never written to fixtures.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+from enemera.core.exceptions import ConnectionError
+from enemera.transport.base import Transport, TimeoutValue
+
+# Request headers making a request conditional; their answers are not recorded
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# Response headers kept in fixtures
+RECORDED_HEADERS = (
+    "Content-Type",
+    "Content-Encoding",
+    "ETag",
+    "Last-Modified",
+    "Cache-Control",
+    "Retry-After",
+)
+
+
+def fixture_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Return the fixture file name for a request.
+
+    The host is ignored, so fixtures recorded against the live API replay
+    against any base URL.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        str: File name such as "GET_italy_prices_3f2a9c1d0b.json"
+    """
+    parts = urlsplit(url)
+    query = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    if parts.query:
+        query = sorted(query + [tuple(q.split("=", 1)) for q in parts.query.split("&")])
+    digest = hashlib.sha1(f"{method.upper()} {parts.path}?{urlencode(query)}".encode()).hexdigest()
+    slug = parts.path.strip("/").replace("/", "_") or "root"
+    return f"{method.upper()}_{slug}_{digest[:10]}.json"
+
+
+class ReplayResponse:
+    """Minimal response object built from a recorded fixture.
+
+    Provides the attributes the client relies on (status_code, headers, url,
+    content, text, json()), matching requests.Response.
+    """
+
+    def __init__(self, status_code: int, headers: Dict[str, str], url: str,
+                 body: bytes, reason: str = ""):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.url = url
+        self.reason = reason
+        self.raw_body = body
+        self._content = None
+
+    @property
+    def content(self) -> bytes:
+        return self._content if self._content is not None else b""
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def close(self) -> None:
+        pass
+
+
+class RecordingTransport(Transport):
+    """Transport that saves the responses of an inner transport as fixtures.
+
+    Answers to conditional requests (a 304 carries no body to replay) are
+    not recorded, and an error response never replaces a recorded 200.
+
+    Attributes:
+        inner: The transport actually sending the requests
+        fixtures_dir: Directory the fixtures are written to
+    """
+
+    name = "recording"
+
+    def __init__(self, fixtures_dir: Union[str, Path], inner: Optional[Transport] = None):
+        """Initialize a new RecordingTransport.
+
+        Args:
+            fixtures_dir: Directory the fixtures are written to (created if missing)
+            inner: Transport to record (defaults to the requests transport)
+        """
+        from enemera.transport.base import create_transport
+
+        self.inner = create_transport(inner)
+        self.fixtures_dir = Path(fixtures_dir)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+        self._pending: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def send(self, method: str, url: str, *,
+             params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[TimeoutValue] = None, **kwargs) -> Any:
+        response = self.inner.send(method, url, params=params, headers=headers, timeout=timeout,
+                                   **kwargs)
+        name = fixture_key(method, url, params)
+        if not self._records(name, response.status_code, headers):
+            return response
+        record = {
+            "method": method.upper(),
+            "url": urlsplit(url).path,
+            "params": {k: str(v) for k, v in (params or {}).items() if v is not None},
+            "status_code": response.status_code,
+            "reason": getattr(response, "reason", None) or getattr(response, "reason_phrase", ""),
+            "headers": {h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+        }
+        with self._lock:
+            self._pending[id(response)] = (name, record)
+        return response
+
+    def _records(self, name: str, status_code: int,
+                 headers: Optional[Dict[str, str]]) -> bool:
+        """Whether a response is saved as the fixture of its request"""
+        conditional = {h.lower() for h in CONDITIONAL_HEADERS}
+        if status_code == 304 or any(h.lower() in conditional for h in (headers or {})):
+            return False
+        if status_code == 200:
+            return True
+        path = self.fixtures_dir / name
+        if not path.exists():
+            return True
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f).get("status_code") != 200
+        except (OSError, ValueError):
+            return True
+
+    def iter_raw(self, response: Any, chunk_size: int) -> Iterator[bytes]:
+        chunks: List[bytes] = []
+        for chunk in self.inner.iter_raw(response, chunk_size):
+            chunks.append(chunk)
+            yield chunk
+        with self._lock:
+            name, record = self._pending.pop(id(response), (None, None))
+        if name is not None:
+            record["body"] = base64.b64encode(b"".join(chunks)).decode("ascii")
+            self._write(name, record)
+
+    def _write(self, name: str, record: Dict[str, Any]) -> None:
+        """Write a fixture atomically"""
+        path = self.fixtures_dir / name
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=1)
+        os.replace(tmp_path, path)
+
+    def set_body(self, response: Any, body: bytes) -> None:
+        self.inner.set_body(response, body)
+
+    def update_headers(self, headers: Dict[str, str]) -> None:
+        self.inner.update_headers(headers)
+
+    def close_response(self, response: Any) -> None:
+        with self._lock:
+            self._pending.pop(id(response), None)
+        self.inner.close_response(response)
+
+    def close(self) -> None:
+        self.inner.close()
+
+    @staticmethod
+    def response_url(response: Any) -> str:
+        return str(response.url)
+
+
+class ReplayTransport(Transport):
+    """Transport that answers requests from recorded fixtures.
+
+    Attributes:
+        fixtures_dir: Directory holding the fixtures
+    """
+
+    name = "replay"
+
+    def __init__(self, fixtures_dir: Union[str, Path]):
+        """Initialize a new ReplayTransport.
+
+        Args:
+            fixtures_dir: Directory holding fixtures written by RecordingTransport
+        """
+        self.fixtures_dir = Path(fixtures_dir)
+        self._fixtures: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if name not in self._fixtures:
+                path = self.fixtures_dir / name
+                if not path.exists():
+                    return None
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                record["body"] = base64.b64decode(record["body"])
+                self._fixtures[name] = record
+            return self._fixtures[name]
+
+    def send(self, method: str, url: str, *,
+             params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[TimeoutValue] = None, **kwargs) -> ReplayResponse:
+        # Fixtures are keyed by method, path and query; other options are ignored
+        record = self._load(fixture_key(method, url, params))
+        if record is None:
+            raise ConnectionError(
+                f"No recorded response for {method.upper()} {urlsplit(url).path} "
+                f"with params {params} in {self.fixtures_dir}"
+            )
+
+        etag = record["headers"].get("ETag")
+        if etag and headers and headers.get("If-None-Match") == etag:
+            return ReplayResponse(304, {"ETag": etag}, url, b"", "Not Modified")
+        return ReplayResponse(record["status_code"], record["headers"], url,
+                              record["body"], record.get("reason", ""))
+
+    def iter_raw(self, response: ReplayResponse, chunk_size: int) -> Iterator[bytes]:
+        body = response.raw_body
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    def set_body(self, response: ReplayResponse, body: bytes) -> None:
+        response._content = body
+
+    def update_headers(self, headers: Dict[str, str]) -> None:
+        pass
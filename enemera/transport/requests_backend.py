@@ -0,0 +1,191 @@
+"""
+Transport backed by requests (HTTP/1.1 with urllib3 connection pooling).
+"""
+
+import re
+import time
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from enemera.core.deadline import current_deadline
+from enemera.core.hooks import current_event
+from enemera.core.exceptions import ConnectionError, TimeoutError, RetryError
+from enemera.transport.base import (
+    Transport,
+    TimeoutValue,
+    RETRY_TOTAL,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_ALLOWED_METHODS
+)
+
+
+def _retried_status(error: requests.exceptions.RetryError) -> Optional[int]:
+    """Return the status whose retries were exhausted, from urllib3's reason"""
+    reason = getattr(error.args[0] if error.args else None, "reason", None)
+    # urllib3 reports e.g. "too many 429 error responses"
+    match = re.search(r"too many (\d{3}) error responses", str(reason or error))
+    return int(match.group(1)) if match else None
+
+
+class DeadlineRetry(Retry):
+    """Retry policy that never outlives the active deadline.
+
+    Retries stop as soon as the deadline in the current context has expired,
+    and backoff or Retry-After sleeps are capped by the remaining budget.
+    """
+
+    def is_exhausted(self) -> bool:
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            return True
+        return super().is_exhausted()
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        deadline = current_deadline()
+        if deadline is not None:
+            backoff = min(backoff, deadline.remaining())
+        return backoff
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        deadline = current_deadline()
+        if retry_after is not None and deadline is not None:
+            retry_after = min(retry_after, deadline.remaining())
+        return retry_after
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None) -> "DeadlineRetry":
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        event = current_event()
+        if event is not None:
+            event.retries += 1
+            event.emit("on_retry", {
+                "attempt": len(new_retry.history),
+                "status": response.status if response is not None else None,
+                "error": repr(error) if error is not None else None,
+                "backoff": new_retry.get_backoff_time(),
+            })
+        return new_retry
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """Connection adding the time spent connecting to the current RequestEvent"""
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        event = current_event()
+        if event is not None:
+            event.add_timing("connect", time.perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection adding connect and TLS handshake time to the current RequestEvent"""
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        event = current_event()
+        if event is not None:
+            event.add_timing("connect", time.perf_counter() - start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report connect time"""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport using a requests.Session.
+
+    Attributes:
+        session: The underlying requests.Session
+    """
+
+    name = "requests"
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 pool_maxsize: int = 10):
+        """Initialize a new RequestsTransport.
+
+        Args:
+            session: Existing session to use (a new one is created if None)
+            pool_maxsize: Maximum number of pooled connections per host
+        """
+        self.session = session or requests.Session()
+
+        # Configure SSL verification
+        self.session.verify = True
+
+        # Configure retries with backoff
+        retry_strategy = DeadlineRetry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=list(RETRY_STATUS_FORCELIST),
+            allowed_methods=list(RETRY_ALLOWED_METHODS)
+        )
+
+        adapter = _TimedHTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def send(self, method: str, url: str, *,
+             params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[TimeoutValue] = None, **kwargs) -> requests.Response:
+        try:
+            return self.session.request(method, url, params=params, headers=headers,
+                                        timeout=timeout, stream=True, **kwargs)
+
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError("Request timed out", timeout_value=timeout,
+                               original_exception=e)
+
+        except requests.exceptions.SSLError as e:
+            raise ConnectionError("SSL verification failed", original_exception=e)
+
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError("Failed to connect to API", original_exception=e)
+
+        except requests.exceptions.RetryError as e:
+            raise RetryError(last_exception=e, status_code=_retried_status(e))
+
+    def iter_raw(self, response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from response.raw.stream(chunk_size, decode_content=False)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise TimeoutError("Request timed out", original_exception=e)
+        except urllib3.exceptions.HTTPError as e:
+            raise ConnectionError("Connection lost while reading response", original_exception=e)
+
+    def set_body(self, response: requests.Response, body: bytes) -> None:
+        response._content = body
+        response._content_consumed = True
+
+    def update_headers(self, headers: Dict[str, str]) -> None:
+        self.session.headers.update(headers)
+
+    def close(self) -> None:
+        self.session.close()
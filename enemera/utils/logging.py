@@ -2,9 +2,73 @@
 Logging utilities for the Enemera API client.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
-from typing import Optional
+import threading
+from typing import List, Optional
+
+# Loggers of the HTTP libraries whose records may carry the Authorization header.
+# Logger filters do not apply to records of child loggers, so those are listed too.
+REDACTED_LOGGERS = (
+    "enemera",
+    "requests",
+    "urllib3",
+    "urllib3.connectionpool",
+    "httpx",
+    "httpcore",
+    "httpcore.connection",
+    "httpcore.http11",
+    "httpcore.http2",
+)
+
+_BEARER_TOKEN = re.compile(r'Bearer [a-zA-Z0-9-_]{20,}')
+_REDACTED = 'Bearer ***REDACTED***'
+
+
+class SensitiveDataFilter(logging.Filter):
+    """Log filter replacing bearer tokens in log records with a placeholder"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        msg = record.msg
+        if isinstance(msg, str):
+            if "Bearer " in msg:
+                record.msg = _BEARER_TOKEN.sub(_REDACTED, msg)
+        elif msg is not None:
+            text = str(msg)
+            if "Bearer " in text:
+                record.msg = _BEARER_TOKEN.sub(_REDACTED, text)
+        args = record.args
+        if args and isinstance(args, tuple) and any(
+                isinstance(a, str) and "Bearer " in a for a in args):
+            record.args = tuple(_BEARER_TOKEN.sub(_REDACTED, a) if isinstance(a, str) else a
+                                for a in args)
+        return True
+
+
+_redaction_filter = SensitiveDataFilter()
+_redaction_lock = threading.Lock()
+_redaction_installed = False
+
+
+def install_redaction_filter() -> None:
+    """Install the redaction filter on the HTTP library loggers.
+
+    The filter is installed once per process; later calls do nothing, so
+    creating many clients does not stack up filters on the global loggers.
+    """
+    global _redaction_installed
+    if _redaction_installed:
+        return
+    with _redaction_lock:
+        if _redaction_installed:
+            return
+        for name in REDACTED_LOGGERS:
+            logging.getLogger(name).addFilter(_redaction_filter)
+        _redaction_installed = True
 
 
 class EnemeraLogger:
@@ -61,41 +125,55 @@ class EnemeraLogger:
 
         self.logger.setLevel(self.LEVELS[level.lower()])
 
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages of a level would be logged.
+
+        Use it to skip building expensive messages on hot paths.
+
+        Args:
+            level: Log level (debug, info, warning, error, critical)
+        """
+        return self.logger.isEnabledFor(self.LEVELS[level.lower()])
+
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with optional structured data"""
-        self._log(self.logger.debug, message, **kwargs)
+        self._log(logging.DEBUG, message, kwargs)
 
     def info(self, message: str, **kwargs) -> None:
         """Log info message with optional structured data"""
-        self._log(self.logger.info, message, **kwargs)
+        self._log(logging.INFO, message, kwargs)
 
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message with optional structured data"""
-        self._log(self.logger.warning, message, **kwargs)
+        self._log(logging.WARNING, message, kwargs)
 
     def error(self, message: str, **kwargs) -> None:
         """Log error message with optional structured data"""
-        self._log(self.logger.error, message, **kwargs)
+        self._log(logging.ERROR, message, kwargs)
 
     def critical(self, message: str, **kwargs) -> None:
         """Log critical message with optional structured data"""
-        self._log(self.logger.critical, message, **kwargs)
+        self._log(logging.CRITICAL, message, kwargs)
 
-    def _log(self, log_func, message: str, **kwargs) -> None:
+    def _log(self, level: int, message: str, kwargs: dict) -> None:
         """
         Internal method for structured logging.
 
+        Nothing is formatted unless the level is enabled.
+
         Args:
-            log_func: Logging function to use
+            level: Numeric logging level
             message: Log message
-            **kwargs: Additional structured data to include in the log
+            kwargs: Additional structured data to include in the log
         """
+        if not self.logger.isEnabledFor(level):
+            return
         if kwargs:
             # Format structured data
             structured_data = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-            log_func(f"{message} | {structured_data}")
-        else:
-            log_func(message)
+            message = f"{message} | {structured_data}"
+        self.logger.log(level, message)
 
 
 # Create default logger instance
@@ -105,7 +183,8 @@ logger = EnemeraLogger()
 def configure_logging(
         level: Optional[str] = None,
         handler: Optional[logging.Handler] = None,
-        formatter: Optional[logging.Formatter] = None
+        formatter: Optional[logging.Formatter] = None,
+        non_blocking: bool = False
 ) -> None:
     """
     Configure the global Enemera logger.
@@ -114,6 +193,8 @@ def configure_logging(
         level: Log level (debug, info, warning, error, critical)
         handler: Custom log handler to add (e.g., FileHandler)
         formatter: Custom formatter for the handler
+        non_blocking: Run the handlers on a background thread behind a queue
+            (see enable_queue_logging)
     """
     if level:
         logger.set_level(level)
@@ -121,7 +202,16 @@ def configure_logging(
     if handler:
         if formatter:
             handler.setFormatter(formatter)
-        logger.logger.addHandler(handler)
+        if _queue_listener is not None:
+            # Keep new handlers behind the queue as well
+            disable_queue_logging()
+            logger.logger.addHandler(handler)
+            enable_queue_logging()
+        else:
+            logger.logger.addHandler(handler)
+
+    if non_blocking:
+        enable_queue_logging()
 
 
 def get_logger(name: str = "enemera", level: Optional[str] = None) -> EnemeraLogger:
@@ -139,3 +229,73 @@ def get_logger(name: str = "enemera", level: Optional[str] = None) -> EnemeraLog
     if level:
         new_logger.set_level(level)
     return new_logger
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler dropping records instead of blocking when the queue is full"""
+
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _NonBlockingQueueHandler.dropped += 1
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queued_handlers: List[logging.Handler] = []
+_queue_lock = threading.Lock()
+
+
+def enable_queue_logging(maxsize: int = 10000) -> logging.handlers.QueueListener:
+    """
+    Move the handlers of the Enemera logger behind a queue.
+
+    Request threads then only put records on a queue, and a background thread
+    runs the (possibly slow) handlers, so writing logs to files or network
+    handlers never blocks high-throughput workers. Calling it again returns the
+    running listener. The queue is drained when the process exits.
+
+    Args:
+        maxsize: Maximum number of queued records (0 for unbounded). When the
+            queue is full, new records are dropped rather than blocking.
+
+    Returns:
+        The QueueListener running the original handlers
+    """
+    global _queue_listener, _queued_handlers
+    with _queue_lock:
+        if _queue_listener is not None:
+            return _queue_listener
+
+        records = queue.Queue(maxsize)
+        _queued_handlers = list(logger.logger.handlers)
+        _queue_listener = logging.handlers.QueueListener(
+            records, *_queued_handlers, respect_handler_level=True)
+        for handler in _queued_handlers:
+            logger.logger.removeHandler(handler)
+        logger.logger.addHandler(_NonBlockingQueueHandler(records))
+        _queue_listener.start()
+        return _queue_listener
+
+
+def disable_queue_logging() -> None:
+    """
+    Stop queue logging, flush the queued records and restore the handlers.
+    """
+    global _queue_listener, _queued_handlers
+    with _queue_lock:
+        if _queue_listener is None:
+            return
+        for handler in list(logger.logger.handlers):
+            if isinstance(handler, _NonBlockingQueueHandler):
+                logger.logger.removeHandler(handler)
+        _queue_listener.stop()
+        for handler in _queued_handlers:
+            logger.logger.addHandler(handler)
+        _queue_listener = None
+        _queued_handlers = []
+
+
+atexit.register(disable_queue_logging)
@@ -1,10 +1,14 @@
+from contextlib import nullcontext
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
-import numpy as np
-import pandas as pd
+from enemera.core.deadline import current_deadline, deadline as time_budget
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def calc_delivery_period(df: pd.DataFrame) -> pd.DataFrame:
+
+def calc_delivery_period(df: 'pd.DataFrame') -> 'pd.DataFrame':
     """
     Calculates 'delivery_date' and 'period' columns for a time-indexed DataFrame,
     handling timezone conversions and Daylight Saving Time (DST) changes.
@@ -31,6 +35,9 @@ def calc_delivery_period(df: pd.DataFrame) -> pd.DataFrame:
                     if the 'time_resolution' column is missing, or if it contains
                     unsupported time resolution values.
     """
+    import numpy as np
+    import pandas as pd
+
     # Validate the DataFrame index
     if not isinstance(df.index, pd.DatetimeIndex) or df.index.tz is None:
         raise ValueError("DataFrame index must be a timezone-aware DatetimeIndex.")
@@ -90,21 +97,42 @@ def calc_delivery_period(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def download_long_period(client, curve, start_date, end_date, step_days=100, **params):
+def date_chunks(start_date, end_date, step_days):
+    """
+    Split an inclusive date range into consecutive chunks of at most step_days days
+
+    Yields:
+        (chunk_start, chunk_end) date pairs, both inclusive
+    """
+    if step_days < 1:
+        raise ValueError("step_days must be at least 1")
+    current_date = start_date
+    while current_date <= end_date:
+        chunk_end = min(current_date + timedelta(days=step_days - 1), end_date)
+        yield current_date, chunk_end
+        current_date = chunk_end + timedelta(days=1)
+
+
+def download_long_period(client, curve, start_date, end_date, step_days=100, deadline=None, **params):
     """
     Download data over a long period by splitting into smaller chunks
+
+    If deadline is given (in seconds), all chunks share that single time budget,
+    including their retries, and the download stops with TimeoutError once it
+    has run out.
     """
+    with time_budget(deadline) if deadline is not None else nullcontext():
+        return _download_chunks(client, curve, start_date, end_date, step_days, **params)
+
+
+def _download_chunks(client, curve, start_date, end_date, step_days, **params):
     all_data = []
-    current_date = start_date
-    chunk_number = 1
 
     print(f"📅 Downloading data from {start_date} to {end_date} in {step_days}-day chunks")
     print("=" * 60)
 
-    while current_date <= end_date:
-        # Calculate chunk end date
-        chunk_end = min(current_date + timedelta(days=step_days - 1), end_date)
-
+    for chunk_number, (current_date, chunk_end) in enumerate(
+            date_chunks(start_date, end_date, step_days), start=1):
         print(f"📦 Chunk {chunk_number}: {current_date} to {chunk_end}", end=" ")
 
         try:
@@ -124,10 +152,12 @@ def download_long_period(client, curve, start_date, end_date, step_days=100, **p
 
         except Exception as e:
             print(f"❌ Error: {str(e)}")
+            # Stop instead of trying the remaining chunks once the budget is spent
+            active_deadline = current_deadline()
+            if active_deadline is not None:
+                active_deadline.check()
 
-        # Move to next chunk
-        current_date = chunk_end + timedelta(days=1)
-        chunk_number += 1
+    import pandas as pd
 
     # Combine all chunks
     if all_data:
@@ -0,0 +1,113 @@
+"""
+Conditional GET revalidation and stale serving of cached responses,
+exercised against the local stand-in server.
+"""
+
+import time
+
+import pytest
+
+from enemera import EnemeraClient
+from enemera.cache import MemoryCache
+from enemera.core.exceptions import RetryError
+from enemera.core.hooks import RequestHook
+from enemera.testing import StandInServer, make_api_key
+
+QUERY = dict(market="MGP", date_from="2024-01-01", date_to="2024-01-01")
+
+
+class CacheOutcomes(RequestHook):
+    """Records the cache outcome of every call"""
+
+    def __init__(self):
+        self.outcomes = []
+
+    def on_parsed(self, event):
+        self.outcomes.append(event.cache)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    # Failing requests give up at once instead of backing off between retries
+    monkeypatch.setattr("enemera.transport.requests_backend.RETRY_BACKOFF_FACTOR", 0)
+    with StandInServer(seed=1) as server:
+        yield server
+
+
+def make_client(server, **kwargs):
+    hook = CacheOutcomes()
+    client = EnemeraClient(api_key=make_api_key(), base_url=server.url, cache=MemoryCache(),
+                           hooks=[hook], **kwargs)
+    return client, hook
+
+
+def test_revalidates_with_conditional_get(server):
+    client, hook = make_client(server, cache_max_age=0)
+
+    first = client.italy_prices.get(**QUERY)
+    second = client.italy_prices.get(**QUERY)
+
+    assert server.counters["status"] == {200: 1, 304: 1}
+    assert hook.outcomes == ["miss", "revalidated"]
+    assert len(second) == len(first) > 0
+    assert not first.stale and not second.stale
+
+
+def test_fresh_entry_is_served_without_a_request(server):
+    client, hook = make_client(server, cache_max_age=3600)
+
+    client.italy_prices.get(**QUERY)
+    cached = client.italy_prices.get(**QUERY)
+
+    assert server.counters["status"] == {200: 1}
+    assert hook.outcomes == ["miss", "hit"]
+    assert not cached.stale
+
+
+def test_stale_while_revalidate_flags_the_response(server):
+    client, hook = make_client(server, cache_max_age=0, stale_while_revalidate=3600)
+
+    client.italy_prices.get(**QUERY)
+    stale = client.italy_prices.get(**QUERY)
+
+    assert stale.stale
+    assert hook.outcomes[:2] == ["miss", "stale"]
+    # The background refresh revalidates the entry
+    for _ in range(100):
+        if server.counters["status"].get(304):
+            break
+        time.sleep(0.05)
+    assert server.counters["status"].get(304) == 1
+
+
+def test_cached_responses_are_not_shared_between_calls(server):
+    client, _ = make_client(server, cache_max_age=3600)
+
+    first = client.italy_prices.get(**QUERY)
+    first.clear()
+    first.stale = True
+    second = client.italy_prices.get(**QUERY)
+
+    assert len(second) > 0
+    assert not second.stale
+
+
+def test_serves_stale_response_when_api_fails(server):
+    client, hook = make_client(server, cache_max_age=0, stale_if_error=3600)
+
+    fresh = client.italy_prices.get(**QUERY)
+    server.error_rate = 1.0
+    stale = client.italy_prices.get(**QUERY)
+
+    assert stale.stale
+    assert len(stale) == len(fresh)
+    assert hook.outcomes == ["miss", "stale"]
+
+
+def test_fails_without_stale_if_error(server):
+    client, _ = make_client(server, cache_max_age=0)
+
+    client.italy_prices.get(**QUERY)
+    server.error_rate = 1.0
+    with pytest.raises(RetryError):
+        client.italy_prices.get(**QUERY)